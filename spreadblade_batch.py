@@ -0,0 +1,688 @@
+"""SB1/SB2/SB3 hesaplamalarının NumPy ile vektörleştirilmiş toplu sürümü.
+
+spreadblade_engine.SpreadBladeEngine ile aynı formülleri, her öğe için bir
+sütun dizisi olarak tek geçişte hesaplar. Tablo kuralları (öğe 36 boşluk
+tablosu, öğe 44/48 yuvarlamaları, öğe 50/78/96 kesici kataloğu seçimleri,
+öğe 132/134 değişim dişlisi eşlemesi) ve safe_* fonksiyonlarının sıkıştırma
+davranışı da vektörleştirilmiştir.
+
+    result = calculate_batch({"n": n_array, "N": N_array, ...})
+    result.columns["136L"]   # Her tasarım için S
+    result.ok                # Hatasız satırlar
+"""
+import functools
+import math
+
+import numpy as np
+
+from spreadblade_engine import (
+    INPUT_PARAMETERS, TEXT_ITEMS, PRECISION, STOCK_ALLOWANCE, CF_FINISH, DEFAULT_MACHINE,
+    find_machine, format_value,
+)
+from spreadblade_cutters import default_cutter_catalog
+from spreadblade_gears import default_gear_index
+from spreadblade_profile import active_profiler, record_clamp, record_fallback
+
+INPUT_NAMES = [name for _, name, _, _ in INPUT_PARAMETERS]
+
+# Öğe 36 boşluk tablosu: Pd üst sınırları ve (Bmin, Bmax)
+BACKLASH_PD_LIMITS = np.array([1.0, 2.0, 3.0, 4.0, 6.0, 10.0])
+BACKLASH_TABLE = np.array([
+    (0.020, 0.030),
+    (0.012, 0.016), # PDF Tablosu
+    (0.008, 0.011),
+    (0.006, 0.008), # PDF Tablosu
+    (0.004, 0.006), # PDF Tablosu
+    (0.002, 0.004),
+    (0.001, 0.003), # 20 ve üzeri
+])
+
+# Öğe 132/134 oran dişlileri -> eşlenen ondalık oran öğesi (spreadblade_gears)
+GEAR_RATIO_ITEMS = {"132": "131", "134": "133"}
+
+# Hata kodları: satır bazında ilk hata (0 = hata yok). (başlık, mesaj)
+ERRORS = [None]
+
+def _error_code(title, message):
+    ERRORS.append((title, message))
+    return len(ERRORS) - 1
+
+def _input_error(message):
+    return _error_code("Giriş Hatası", f"Geçersiz giriş değeri: {message}")
+
+def _stage_error(stage, message):
+    return _error_code(f"{stage} Değer Hatası", f"{stage} hesaplamasında geçersiz değer: {message}")
+
+E_POSITIVE = _input_error("Pitch, Yüz Genişliği, Kesici Yarıçapı ve Diş Sayıları pozitif olmalıdır.")
+E_NEGATIVE = _input_error("Addendum ve Dedendum değerleri negatif olamaz.")
+E_NOT_FINITE = _input_error("Girdiler sonlu sayılar olmalıdır.")
+E_GAMMA = _input_error("Pitch açısı (gamma_p) hesaplanamadı (sıfıra bölme).")
+E_A0 = _input_error("A0 hesaplanamadı (sin_gamma_p sıfır?).")
+E_DELTA = _input_error("Dedendum açısı tanjantı hesaplanamadı (A0 sıfır?).")
+E_29 = _stage_error("SB1", "Öğe 29 hesaplanamadı (Ai sıfır?).")
+E_42 = _stage_error("SB1", "Öğe 42 hesaplanamadı (A0 sıfır?).")
+E_53 = _stage_error("SB2", "Öğe 53 hesaplanamadı (cos phi sıfır?).")
+E_54 = _stage_error("SB2", "Öğe 54 hesaplanamadı (A0 sıfır?).")
+E_55 = _stage_error("SB2", "Öğe 55 hesaplanamadı (tan phi sıfır?).")
+E_57 = _stage_error("SB2", "Öğe 57 hesaplanamadı (cos psi sıfır?).")
+E_59 = _stage_error("SB2", "Öğe 59 hesaplanamadı (cos pitch açısı sıfır?).")
+E_61 = _stage_error("SB2", "Öğe 61 hesaplanamadı (Öğe 60 sıfır?).")
+E_66 = _stage_error("SB2", "Öğe 66 hesaplanamadı (a1 sıfır?).")
+E_69 = _stage_error("SB2", "Öğe 69 hesaplanamadı (Öğe 52 sıfır?).")
+E_71 = _stage_error("SB2", "Öğe 71 hesaplanamadı (Öğe 53 sıfır?).")
+E_83 = _stage_error("SB2", "Öğe 83 hesaplanamadı (cos psi sıfır?).")
+E_91 = _stage_error("SB2", "Öğe 91 hesaplanamadı.")
+E_92L = _stage_error("SB2", "Öğe 92 (L) hesaplanamadı (bölme).")
+E_92R = _stage_error("SB2", "Öğe 92 (R) hesaplanamadı (bölme).")
+E_95 = _stage_error("SB2", "Öğe 95 hesaplanamadı (delta_theta sıfır?).")
+E_114 = _stage_error("SB3", "Öğe 114 hesaplanamadı (A0 sıfır?).")
+E_117 = _stage_error("SB3", "Öğe 117 hesaplanamadı (A0 sıfır?).")
+E_118 = _stage_error("SB3", "Öğe 118 hesaplanamadı (Öğe 117 sıfır?).")
+E_126 = _stage_error("SB3", "Öğe 126 hesaplanamadı (V sıfır?).")
+E_129L = _stage_error("SB3", "Öğe 129 (Pinyon) hesaplanamadı (sin gamma_p sıfır?).")
+E_129R = _stage_error("SB3", "Öğe 129 (Dişli) hesaplanamadı (sin Gamma_G sıfır?).")
+E_136 = _stage_error("SB3", "Öğe 136 hesaplanamadı (sin q sıfır?).")
+
+# --- Vektörleştirilmiş güvenli işlemler ---
+# Python'daki max(lo, min(hi, x)) ile aynı: NaN değerler üst sınıra gider.
+# Profiler etkinse geri dönüşe giren eleman sayıları "batch" konumuyla kaydedilir.
+# Sayım ek maske hesaplamaz: düzeltilen değer girdiden farklıysa (NaN dahil) eleman
+# geri dönüşe girmiştir.
+def _changed(before, after):
+    """Güvenli işlemin değiştirdiği (veya NaN) eleman sayısı."""
+    return np.count_nonzero(before != after)
+
+def clamp(x, lo=-1.0, hi=1.0, item=None):
+    """max(lo, min(hi, x)) işleminin dizi karşılığı.
+
+    `item` verilirse sıkıştırılan elemanlar o öğe numarasıyla kaydedilir.
+    """
+    clamped = np.where(x < hi, x, hi)
+    clamped = np.where(clamped > lo, clamped, lo)
+    if item is not None and active_profiler() is not None:
+        record_clamp(item, _changed(x, clamped))
+    return clamped
+
+def safe_acos(value):
+    """safe_acos'un dizi karşılığı."""
+    clamped = clamp(value)
+    if active_profiler() is not None:
+        record_fallback("safe_acos", _changed(value, clamped), "batch")
+    return np.arccos(clamped)
+
+def _divide(numerator, denominator, default=np.inf, small=None):
+    """safe_division, geri dönüşler kaydedilmeden (`small` verilebilir)."""
+    small = np.abs(denominator) < 1e-10 if small is None else small
+    return np.where(small, default, numerator / np.where(small, 1.0, denominator))
+
+def safe_asin(value):
+    """safe_asin'in dizi karşılığı."""
+    clamped = clamp(value)
+    if active_profiler() is not None:
+        record_fallback("safe_asin", _changed(value, clamped), "batch")
+    return np.arcsin(clamped)
+
+def safe_sqrt(value):
+    """safe_sqrt'ün dizi karşılığı (negatif ve NaN için 0)."""
+    radicand = np.where(value > 0.0, value, 0.0)
+    if active_profiler() is not None: # -0.0 == 0.0: yalnız negatif ve NaN sayılır
+        record_fallback("safe_sqrt", _changed(value, radicand), "batch")
+    return np.sqrt(radicand)
+
+def safe_division(numerator, denominator, default=np.inf):
+    """safe_division'ın dizi karşılığı."""
+    small = np.abs(denominator) < 1e-10
+    if active_profiler() is not None:
+        record_fallback("safe_division", np.count_nonzero(small), "batch")
+    return _divide(numerator, denominator, default, small)
+
+def py_min(a, b):
+    """Python min(a, b) (b < a değilse a döner)."""
+    return np.where(b < a, b, a)
+
+def py_max(a, b):
+    """Python max(a, b) (b > a değilse a döner)."""
+    return np.where(b > a, b, a)
+
+def round_to(value, step):
+    """round(value / step) * step (Python gibi yarıda çifte yuvarlar).
+
+    Python round() tamsayı döndürdüğü için -0.0 sonucu 0.0'a çevrilir.
+    """
+    return np.round(value / step) * step + 0.0
+
+def backlash(Pd):
+    """Öğe 36: Pd'ye göre (Bmin, Bmax) dizileri."""
+    row = np.searchsorted(BACKLASH_PD_LIMITS, Pd, side='left')
+    return BACKLASH_TABLE[row, 0], BACKLASH_TABLE[row, 1]
+
+def k1_factor(R_a, phi):
+    """Öğe 67 K1 faktörü (Grafik No. 1 formülü), R/a dizisi için.
+
+    SpreadBladeEngine (Öğe 67 L/R), calculate_batch ve K1 grafiği aynı
+    çekirdeği kullanır; tablo ile grafik birbirinden ayrılamaz.
+    """
+    R_a = np.asarray(R_a, dtype=float)
+    # Motor her hesaplamada iki değer için çağırır; profil sayaçları burada tutulmaz
+    with np.errstate(all='ignore'):
+        sin_phi, cos_phi, tan_phi = np.sin(phi), np.cos(phi), np.tan(phi)
+        delta_phi_K1 = np.arccos(clamp(_divide(R_a * cos_phi, R_a + 1))) - phi
+        term2 = (R_a + 1) * (delta_phi_K1 - np.sin(delta_phi_K1) + tan_phi * (1 - np.cos(delta_phi_K1)))
+        return _divide(cos_phi, 1 - sin_phi) * (delta_phi_K1 - term2)
+
+# K1 grafiğinin R/a noktaları (0.1'den ~30'a)
+K1_CURVE_RATIOS = np.logspace(-1, 1.5, 100)
+
+@functools.lru_cache(maxsize=16)
+def k1_curve(phi):
+    """K1 grafiğinin (R/a, K1) eğrisi; her basınç açısı phi (rad) için bir kez hesaplanır."""
+    K1 = k1_factor(K1_CURVE_RATIOS, phi)
+    K1.flags.writeable = False
+    return K1_CURVE_RATIOS, K1
+# --- ---
+
+
+class BatchResult:
+    """Toplu hesaplama sonucu: her öğe/sütun için bir dizi.
+
+    `columns` "47L" gibi anahtarlarla sayısal öğeleri tutar. Metin öğeleri
+    (80, 89, 107, 132, 134, 135) `text()` ile sayısal bileşenlerinden
+    biçimlendirilir; 132/134 oran dişlileri ilk istendiklerinde
+    gear_match() ile eşlenir. `error` her satır için ERRORS listesindeki hata
+    kodudur.
+    """
+    def __init__(self, columns, extras, error):
+        self.columns = columns
+        self.extras = extras # Metin öğelerinin sayısal bileşenleri
+        self.error = error
+        self.size = len(error)
+        self._gear_matches = {}
+
+    @property
+    def ok(self):
+        """Hatasız hesaplanan satırların maskesi."""
+        return self.error == 0
+
+    def error_message(self, i):
+        """i. satırın (başlık, mesaj) hatası; hata yoksa None."""
+        return ERRORS[self.error[i]]
+
+    def gear_match(self, item, side):
+        """Öğe 132/134 için Öğe 131/133 oranlarının en yakın değişim dişlisi dizileri.
+
+        spreadblade_gears.GearMatch döner (dizi indeksi, oranı ve hatası);
+        sonuç saklanır.
+        """
+        key = item + side
+        match = self._gear_matches.get(key)
+        if match is None:
+            ratio_key = GEAR_RATIO_ITEMS[item] + side
+            match = self._gear_matches[key] = default_gear_index().match(self.columns[ratio_key])
+        return match
+
+    def text(self, item, side, i):
+        """i. satır için metin öğesinin arayüzdeki karşılığı."""
+        if item == "80":
+            return f"Yakın {self.columns['79' + side][i]:.4f}"
+        if item == "89":
+            return f"+:{self.extras['89' + side + '+'][i]:.4f} -:{self.extras['89' + side + '-'][i]:.4f}"
+        if item == "107":
+            return f"{self.columns['97' + side][i]:.4f};{self.columns['98' + side][i]:.4f}"
+        if item in GEAR_RATIO_ITEMS:
+            return default_gear_index().describe(float(self.columns[GEAR_RATIO_ITEMS[item] + side][i]))
+        if item == "135":
+            if side == "L":
+                return f"C:20 W:{math.degrees(self.extras['work_roll_P'][i]):.2f}"
+            return f"C:30 W:{math.degrees(self.extras['work_roll_G'][i]):.2f}"
+        raise KeyError(f"{item} metin öğesi değil.")
+
+    def text_column(self, item, side):
+        """Metin öğesinin tüm satırlar için listesi (text() ile aynı biçim)."""
+        if item == "80":
+            return ["Yakın %.4f" % x for x in self.columns['79' + side].tolist()]
+        if item == "89":
+            return ["+:%.4f -:%.4f" % pair for pair in zip(self.extras['89' + side + '+'].tolist(),
+                                                         self.extras['89' + side + '-'].tolist())]
+        if item == "107":
+            return ["%.4f;%.4f" % pair for pair in zip(self.columns['97' + side].tolist(),
+                                                       self.columns['98' + side].tolist())]
+        if item in GEAR_RATIO_ITEMS:
+            return default_gear_index().describe_column(None, self.gear_match(item, side))
+        if item == "135":
+            cradle, roll = ("20", self.extras['work_roll_P']) if side == "L" else ("30", self.extras['work_roll_G'])
+            return [f"C:{cradle} W:%.2f" % x for x in np.degrees(roll).tolist()]
+        raise KeyError(f"{item} metin öğesi değil.")
+
+    def keys(self):
+        """Satırlarda bulunan tüm öğe anahtarları (tablo sırasıyla)."""
+        return list(self.columns) + [f"{item}{side}" for item in TEXT_ITEMS for side in ("L", "R")]
+
+    def format(self, item, side, i):
+        """i. satırın öğe değerini SBSummary.format gibi biçimlendirir."""
+        key = f"{item}{side}"
+        if item in TEXT_ITEMS:
+            return self.text(item, side, i)
+        if key not in self.columns:
+            return "-"
+        return format_value(float(self.columns[key][i]), PRECISION.get(key, 4))
+
+    def row(self, i):
+        """i. satırın {"47L": değer, ...} sözlüğü (metin öğeleri dahil)."""
+        row = {key: float(column[i]) for key, column in self.columns.items()}
+        for item in TEXT_ITEMS:
+            for side in ("L", "R"):
+                row[f"{item}{side}"] = self.text(item, side, i)
+        return row
+
+
+def input_columns(inputs):
+    """Girdileri aynı uzunlukta float64 dizilerine çevirir (skaler yayılır)."""
+    missing = [name for name in INPUT_NAMES if name not in inputs]
+    if missing:
+        raise KeyError(f"Eksik girdi: {', '.join(missing)}")
+    arrays = [np.asarray(inputs[name], dtype=float) for name in INPUT_NAMES]
+    arrays = np.broadcast_arrays(*[np.atleast_1d(a) for a in arrays])
+    return {name: np.ascontiguousarray(a).ravel() for name, a in zip(INPUT_NAMES, arrays)}
+
+
+def calculate_batch(inputs, k1=k1_factor, machine=DEFAULT_MACHINE):
+    """Her girdi dizisi için tüm SB öğelerini tek geçişte hesaplar.
+
+    `inputs` INPUT_PARAMETERS'taki 14 ad için dizi veya skaler içeren bir
+    sözlüktür. Hatalı satırlar `error` dizisinde işaretlenir ve bu satırların
+    sütunları NaN olur. `k1` Öğe 67'yi hesaplayan çekirdektir; tablo araması
+    için spreadblade_k1table.open_k1_table() verilebilir. Öğe 138-144
+    `machine` (default_machines()'teki ad) ile hesaplanır; tüm makineler için bkz.
+    spreadblade_machines.
+    """
+    profiler = active_profiler()
+    lap = profiler.laps("batch") if profiler is not None else _no_lap
+    K2 = find_machine(machine)[1] # Öğe 138
+    v = input_columns(inputs)
+    size = len(v['n'])
+    error = np.zeros(size, dtype=np.int16)
+    cols = {}
+    extras = {}
+
+    def fail(mask, code):
+        error[(error == 0) & mask] = code
+
+    def put(item, L=None, R=None):
+        if L is not None:
+            cols[item + "L"] = np.broadcast_to(np.asarray(L, dtype=float), (size,))
+        if R is not None:
+            cols[item + "R"] = np.broadcast_to(np.asarray(R, dtype=float), (size,))
+
+    with np.errstate(all='ignore'):
+        n, N, Pd, F, rc = v['n'], v['N'], v['Pd'], v['F'], v['rc']
+        a0P, a0G, b0P, b0G = v['a0P'], v['a0G'], v['b0P'], v['b0G']
+        t0PL, t0G = v['t0PL'], v['t0G']
+
+        # --- Girdiler ---
+        fail(~np.all(np.isfinite(np.stack(list(v.values()))), axis=0), E_NOT_FINITE)
+        fail((Pd <= 0) | (F <= 0) | (rc <= 0) | (n <= 0) | (N <= 0), E_POSITIVE)
+        fail((a0P < 0) | (a0G < 0) | (b0P < 0) | (b0G < 0), E_NEGATIVE)
+
+        phi = np.radians(v['phi_deg'])
+        shaft_angle = np.radians(v['shaft_angle_deg'])
+        psi = np.radians(v['psi_deg'])
+        p = math.pi / Pd
+        d = n / Pd
+        D = N / Pd
+
+        # Pitch Açıları (γ, Γ)
+        tan_gamma_general = safe_division(np.sin(shaft_angle), N / n + np.cos(shaft_angle))
+        right_angle = np.abs(shaft_angle - math.pi / 2) < 1e-6
+        fail(~right_angle & np.isinf(tan_gamma_general), E_GAMMA)
+        gamma_p = np.arctan(np.where(right_angle, n / N, tan_gamma_general))
+        Gamma_G = shaft_angle - gamma_p
+
+        sin_gamma_p = np.sin(gamma_p)
+        A0 = safe_division(d, 2 * sin_gamma_p)
+        fail(np.isinf(A0), E_A0)
+        Ai = A0 - F
+        Am = A0 - F / 2.0
+
+        sin_phi, cos_phi, tan_phi = np.sin(phi), np.cos(phi), np.tan(phi)
+        sin_psi, cos_psi, tan_psi = np.sin(psi), np.cos(psi), np.tan(psi)
+        cos_gamma_p, tan_gamma_p = np.cos(gamma_p), np.tan(gamma_p)
+        sin_Gamma_G, cos_Gamma_G, tan_Gamma_G = np.sin(Gamma_G), np.cos(Gamma_G), np.tan(Gamma_G)
+
+        tan_delta_p = safe_division(b0P, A0)
+        tan_delta_G = safe_division(b0G, A0)
+        fail(np.isinf(tan_delta_p) | np.isinf(tan_delta_G), E_DELTA)
+        delta_p = np.arctan(tan_delta_p)
+        delta_G = np.arctan(tan_delta_G)
+        cos_delta_p, cos_delta_G = np.cos(delta_p), np.cos(delta_G)
+
+        lap("inputs")
+        # --- SB1 ---
+        put("1", n, N)
+        put("2", Pd, p)
+        put("3", d, D)
+        F_half = F / 2.0
+        put("4", F, F_half)
+        put("5", A0, A0)
+        put("6", Am, Am)
+        put("7", Ai, Ai)
+        put("8", rc, rc)
+        for item, value in (("9", np.degrees(phi)), ("10", sin_phi), ("11", cos_phi), ("12", tan_phi),
+                            ("13", np.degrees(psi)), ("14", sin_psi), ("15", cos_psi), ("16", tan_psi)):
+            put(item, value, value)
+        put("17", np.degrees(gamma_p), np.degrees(Gamma_G))
+        put("18", sin_gamma_p, sin_Gamma_G)
+        put("19", cos_gamma_p, cos_Gamma_G)
+        put("20", tan_gamma_p, tan_Gamma_G)
+        put("21", a0P, a0G)
+        put("22", b0P, b0G)
+        put("23", np.degrees(delta_p), np.degrees(delta_G))
+        put("24", cos_delta_p, cos_delta_G)
+        put("25", tan_delta_p, tan_delta_G)
+        put("26", t0PL, t0G)
+
+        val_27 = 2 * rc * sin_psi - A0
+        put("27", val_27, val_27)
+        val_28 = val_27 + A0
+        put("28", val_28, val_28)
+        val_29 = safe_division(A0 * val_27, Ai) + Ai
+        fail(np.isinf(val_29), E_29)
+        put("29", val_29, val_29)
+
+        sin_Psi_o = clamp(safe_division(val_28, 2 * rc), item='30')
+        put("30", sin_Psi_o, sin_Psi_o)
+        Psi_o = safe_asin(sin_Psi_o)
+        Psi_o_deg = np.degrees(Psi_o)
+        put("31", Psi_o_deg, Psi_o_deg)
+        cos_Psi_o = np.cos(Psi_o)
+        put("32", cos_Psi_o, cos_Psi_o)
+        sin_Psi_i = clamp(safe_division(val_29, 2 * rc), item='33')
+        put("33", sin_Psi_i, sin_Psi_i)
+        Psi_i = safe_asin(sin_Psi_i)
+        put("34", np.degrees(Psi_i), np.degrees(Psi_i))
+        cos_Psi_i = np.cos(Psi_i)
+        put("35", cos_Psi_i, cos_Psi_i)
+
+        Bmin, Bmax = backlash(Pd)
+        put("36", Bmin, Bmax)
+        b_P = b0P - F_half * tan_delta_p
+        b_G = b0G - F_half * tan_delta_G
+        put("37", b_P, b_G)
+        bi_P = b_P - F_half * tan_delta_p
+        bi_G = b_G - F_half * tan_delta_G
+        put("38", bi_P, bi_G)
+        val_39 = b0P + b0G
+        put("39", val_39, val_39)
+        val_40 = bi_P + bi_G
+        put("40", val_40, val_40)
+
+        val_41 = t0PL
+        put("41", val_41)
+        val_42 = safe_division(Ai * p, A0)
+        fail(np.isinf(val_42), E_42)
+        put("42", val_42)
+        WG_prime = cos_psi * val_41 - 2 * tan_phi * b_G
+        put("43", R=WG_prime)
+
+        # WG, WRG (Öğe 44): 3.5" kesici 0.005, diğerleri 0.010 adımla
+        cutter_35 = rc == 1.75
+        WG = np.where(cutter_35, round_to(WG_prime, 0.005), round_to(WG_prime, 0.010))
+        WRG = np.where(Pd >= 3, WG - 0.030, WG - 0.020)
+        put("44", WG, WRG)
+
+        val_45 = p * cos_Psi_o - 2 * tan_phi * val_39 - WG
+        put("45", val_45)
+        val_46 = val_42 * cos_Psi_i - 2 * tan_phi * val_40 - WG
+        put("46", val_46)
+        WLP = py_min(val_45, val_46)
+        put("47", WLP)
+        WRP_calc = WLP - STOCK_ALLOWANCE
+        WRP = np.where(cutter_35, round_to(WRP_calc, 0.005), round_to(WRP_calc, 0.010))
+        WRP = np.where((rc >= 3.0) & (WRP < 0.040), 0.040, WRP)
+        put("48", WRP)
+
+        lap("SB1")
+        # --- SB2 ---
+        htP = a0P + b0P
+        htG = a0G + b0G
+        put("82", htP, htG)
+        WMP = py_max(val_45, val_46)
+        put("49", WMP, WMP)
+        catalog = default_cutter_catalog()
+        WB_P = catalog.select_column(rc, "WB", WMP / 2.0 + 0.003)
+        WB_G = catalog.select_column(rc, "WB", WG / 2.0 + 0.003)
+        put("50", WB_P, WB_G)
+        val_51 = cos_psi ** 2
+        put("51", val_51, val_51)
+        val_52 = 1.0 - sin_phi
+        put("52", val_52, val_52)
+        val_53 = safe_division(val_52, cos_phi)
+        fail(np.isinf(val_53), E_53)
+        put("53", val_53, val_53)
+        val_54 = safe_division(Ai * Bmax, A0)
+        fail(np.isinf(val_54), E_54)
+        put("54", val_54, val_54)
+        val_55 = safe_division(0.5 * val_54, tan_phi)
+        fail(np.isinf(val_55), E_55)
+        put("55", val_55, val_55)
+        c_clearance = ((b0P - a0G) + (b0G - a0P)) / 2.0
+        put("56", c_clearance, c_clearance)
+        val_57 = safe_division(Ai * tan_Gamma_G, val_51)
+        fail(np.isinf(val_57), E_57)
+        put("57", val_57)
+        val_58_L = bi_G - c_clearance
+        val_58_R = bi_P - c_clearance
+        put("58", val_58_L, val_58_R)
+        val_59_L = safe_division(n, cos_gamma_p)
+        val_59_R = safe_division(N, cos_Gamma_G)
+        fail(np.isinf(val_59_L) | np.isinf(val_59_R), E_59)
+        put("59", val_59_L, val_59_R)
+        val_60 = val_59_L + val_59_R
+        put("60", val_60, val_60)
+        val_61 = safe_division(val_55 * val_59_L, val_60)
+        val_61_R = safe_division(val_55 * val_59_R, val_60)
+        fail(np.isinf(val_61) | np.isinf(val_61_R), E_61)
+        put("61", val_61, val_61_R)
+        put("62", val_57, val_57)
+        put("63", val_61_R, val_61)
+        a1_P = val_58_L + val_61_R
+        a1_G = val_58_R + val_61
+        put("64", a1_P, a1_G)
+        R1_P_corr = val_57 - val_61_R
+        R1_G_corr = val_57 - val_61
+        put("65", R1_P_corr, R1_G_corr)
+        ratio_P = safe_division(R1_P_corr, a1_P)
+        ratio_G = safe_division(R1_G_corr, a1_G)
+        fail(np.isinf(ratio_P) | np.isinf(ratio_G), E_66)
+        put("66", ratio_P, ratio_G)
+
+        # Öğe 67 K1
+        # Pinyon ve dişli tek çağrıda (phi'ye bağlı terimler bir kez hesaplanır)
+        K1_P, K1_G = k1(np.stack([ratio_P, ratio_G]), phi)
+        put("67", K1_P, K1_G)
+        ro_P = a1_P * K1_P
+        ro_G = a1_G * K1_G
+        put("68", ro_P, ro_G)
+        val_69 = safe_division(c_clearance - val_55, val_52)
+        fail(np.isinf(val_69), E_69)
+        put("69", val_69, val_69)
+        r1_P = ro_P + val_69
+        r1_G = ro_G + val_69
+        put("70", r1_P, r1_G)
+        r2_P = safe_division(WB_P - 0.015, val_53)
+        r2_G = safe_division(WB_G - 0.015, val_53)
+        fail(np.isinf(r2_P) | np.isinf(r2_G), E_71)
+        put("71", r2_P, r2_G)
+        val_72 = WLP - WB_P
+        put("72", val_72)
+        val_73 = val_53 * val_72 + 0.001
+        put("73", val_73, val_73)
+        val_75 = val_73 + 0.002
+        put("75", val_75, val_75)
+        val_74 = safe_sqrt(val_75)
+        put("74", val_74, val_74)
+        val_76 = val_73 ** 2
+        put("76", val_76, val_76)
+        r3 = safe_division(0.063 * val_74 + val_75, val_76) # 76 ≈ 0: sınırlamayan sonsuz r3
+        put("77", r3, r3)
+        # np.minimum NaN'ı yayar: bıçak ucu yoksa (Öğe 50 NaN) rE de NaN
+        rE_P = catalog.select_column(rc, "rE", np.minimum(np.minimum(r1_P, r2_P), r3))
+        rE_G = catalog.select_column(rc, "rE", np.minimum(np.minimum(r1_G, r2_G), r3))
+        put("78", rE_P, rE_G)
+        c_prime = safe_division(sin_psi * delta_p, 10.0)
+        put("79", c_prime, c_prime)
+        put("81", CF_FINISH, CF_FINISH)
+
+        val_83 = safe_division(rc, cos_psi)
+        fail(np.isinf(val_83), E_83)
+        put("83", val_83, val_83)
+        val_84 = A0 - rc * sin_psi
+        put("84", val_84, val_84)
+        val_85 = val_83 ** 2 + val_84 ** 2
+        put("85", val_85, val_85)
+        val_86 = safe_sqrt(val_85)
+        put("86", val_86, val_86)
+        val_87_L = bi_P + val_58_R
+        val_87_R = htG
+        put("87", val_87_L, val_87_R)
+        val_88_L = 0.5 * WG + tan_phi * val_87_L
+        val_88_R = 0.5 * WG + tan_phi * val_87_R
+        put("88", val_88_L, val_88_R)
+        val_89_L_plus, val_89_R_plus = rc + val_88_L, rc + val_88_R
+        extras["89L+"], extras["89L-"] = val_89_L_plus, rc - val_88_L
+        extras["89R+"], extras["89R-"] = val_89_R_plus, rc - val_88_R
+        put("90", Ai, A0)
+        val_91_L = safe_division(val_86 * val_89_L_plus, 0.5)
+        val_91_R = safe_division(val_86 * val_89_R_plus, 0.5)
+        fail(np.isinf(val_91_L) | np.isinf(val_91_R), E_91)
+        put("91", val_91_L, val_91_R)
+        cos_theta_L_val = safe_division(Ai ** 2 - val_89_L_plus ** 2 - val_85, val_91_L)
+        fail(np.isinf(cos_theta_L_val), E_92L)
+        cos_theta_R_val = safe_division(A0 ** 2 - val_89_R_plus ** 2 - val_85, val_91_R)
+        fail(np.isinf(cos_theta_R_val), E_92R)
+        cos_theta_L = clamp(cos_theta_L_val)
+        cos_theta_R = clamp(cos_theta_R_val)
+        put("92", cos_theta_L, cos_theta_R)
+        theta_L_deg = np.degrees(safe_acos(cos_theta_L))
+        theta_R_deg = np.degrees(safe_acos(cos_theta_R))
+        put("93", theta_L_deg, theta_R_deg)
+        delta_theta_deg = theta_L_deg - theta_R_deg - 1.0
+        put("94", delta_theta_deg, delta_theta_deg)
+        Nb_prime = safe_division(360.0, delta_theta_deg)
+        fail(np.isinf(Nb_prime), E_95)
+        put("95", Nb_prime, Nb_prime)
+        NB = catalog.select_column(rc, "NB", np.abs(Nb_prime), strict=True, smallest=True)
+        put("96", NB, NB)
+
+        lap("SB2")
+        # --- SB3 ---
+        delta_A = np.zeros(size)
+        val_97 = safe_division(tan_phi * b0G + WG, 0.5)
+        put("97", val_97, val_97)
+        val_98 = p * Psi_o - val_97
+        put("98", val_98, val_98)
+        val_99_L = safe_division(sin_Psi_o * val_97 + sin_Psi_o * val_98, 2.0)
+        val_99_R = safe_division(sin_Psi_o * val_97 - sin_Psi_o * val_98, 2.0)
+        put("99", val_99_L, val_99_R)
+        put("100", delta_A, delta_A)
+        val_101_L = py_max(val_99_L, delta_A)
+        val_101_R = py_max(val_99_R, delta_A)
+        put("101", val_101_L, val_101_R)
+        val_102_L = A0 - val_101_L
+        val_102_R = A0 - val_101_R
+        put("102", val_102_L, val_102_R)
+        val_103 = val_101_R * tan_delta_G
+        put("103", R=val_103)
+        val_104 = val_101_L * tan_delta_p
+        put("104", val_104)
+        val_105 = safe_division(b0G - val_103, 0.5)
+        put("105", R=val_105)
+        val_106 = safe_division(tan_phi * val_105 + WG, 0.5)
+        put("106", val_106, val_106)
+        val_108 = a0P - val_104
+        put("108", val_108)
+        val_109 = A0 * val_27 + val_102_L
+        put("109", val_109, val_109)
+        sin_PhiM = clamp(safe_division(val_109, 2 * rc))
+        put("110", sin_PhiM, sin_PhiM)
+        PhiM = safe_asin(sin_PhiM)
+        put("111", np.degrees(PhiM), np.degrees(PhiM))
+        cos_PhiM = np.cos(PhiM)
+        put("112", cos_PhiM, cos_PhiM)
+        val_113_R = p * cos_PhiM
+        put("113", R=val_113_R)
+        val_114 = safe_division(val_113_R * val_102_R, A0)
+        fail(np.isinf(val_114), E_114)
+        put("114", R=val_114)
+        tM_min = val_106 - Bmin
+        tM_max = val_114 - val_106
+        put("115", tM_min, tM_max)
+        val_116 = cos_PhiM ** 2 / 4.0
+        put("116", val_116, val_116)
+        val_117 = safe_division(d * val_102_L, A0)
+        fail(np.isinf(val_117), E_117)
+        put("117", val_117)
+        tM_avg = (tM_min + tM_max) / 2.0
+        val_118 = safe_division(tM_avg ** 2, val_117)
+        fail(np.isinf(val_118), E_118)
+        put("118", val_118)
+        val_119 = cos_gamma_p * val_118
+        put("119", val_119)
+        put("120", val_108 + val_116 * val_119)
+
+        val_121 = F * Pd
+        put("121", val_121, val_121)
+        mF = (0.3865 * tan_psi - 0.0171 * tan_psi ** 3) * val_121
+        put("122", mF, mF)
+        put("123", A0 * tan_delta_p - b0P, A0 * tan_delta_G - b0G)
+        V = rc * cos_psi
+        put("124", V, V)
+        H = A0 - rc * sin_psi
+        put("125", H, H)
+        ctn_q = safe_division(H, V)
+        fail(np.isinf(ctn_q), E_126)
+        put("126", ctn_q, ctn_q)
+        q = np.arctan2(V, H)
+        q_deg = np.degrees(q)
+        put("127", q_deg, q_deg)
+        sin_q = np.sin(q)
+        put("128", sin_q, sin_q)
+        Ra_P = safe_division(cos_delta_p, sin_gamma_p)
+        fail(np.isinf(Ra_P), E_129L)
+        Ra_G = safe_division(cos_delta_G, sin_Gamma_G)
+        fail(np.isinf(Ra_G), E_129R)
+        put("129", Ra_P, Ra_G)
+        val_130_L = safe_division(n * Ra_P, 150.0)
+        val_130_R = safe_division(N * Ra_G, 150.0)
+        put("130", val_130_L, val_130_R)
+        put("131", 2 * val_130_L, 2 * val_130_R)
+        put("133", 3 * val_130_L, 3 * val_130_R)
+        extras["work_roll_P"] = math.radians(20) * Ra_P
+        extras["work_roll_G"] = math.radians(30) * Ra_G
+        S = safe_division(V, sin_q)
+        fail(np.isinf(S), E_136)
+        put("136", S, S)
+        put("137", 360.0 - q_deg, q_deg)
+        put("138", K2, K2)
+        sin_beta_half = clamp(safe_division(S, 2 * K2), item='139')
+        put("139", sin_beta_half, sin_beta_half)
+        beta_half_deg = np.degrees(safe_asin(sin_beta_half))
+        put("140", beta_half_deg, beta_half_deg)
+        put("141", 2 * beta_half_deg, 2 * beta_half_deg)
+        Q_alt_LH = 270.0 + beta_half_deg - q_deg
+        Q_alt_RH = 270.0 + beta_half_deg + q_deg
+        put("142", Q_alt_LH, Q_alt_RH)
+        put("143", safe_sqrt(K2 ** 2 - S ** 2), safe_sqrt(K2 ** 2 - S ** 2))
+        put("144", 360.0 - Q_alt_LH, 360.0 - Q_alt_RH)
+
+    failed = error != 0
+    if failed.any():
+        for key in cols:
+            cols[key] = np.where(failed, np.nan, cols[key])
+        for key in extras:
+            extras[key] = np.where(failed, np.nan, extras[key])
+    lap("SB3")
+    return BatchResult(cols, extras, error)
+
+
+def _no_lap(name):
+    """Profiler etkin değilken calculate_batch aşama işaretleri."""
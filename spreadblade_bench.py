@@ -0,0 +1,500 @@
+"""Hesaplayıcının performans ölçümleri ve kayıtlı taban çizgileri.
+
+Her ölçüm, @benchmark ile işaretlenmiş bir hazırlık fonksiyonudur; döndürdüğü
+çağrılabilir nesnenin süresi timeit ile ölçülür (çöp toplayıcı kapalı, en iyi
+tekrar). Sonuç saniyedeki işlem sayısıdır: tek tasarımlık ölçümlerde çağrı,
+toplu ölçümlerde tasarım. Girdiler sabittir (DEFAULT_INPUTS ve BENCH_SEED ile
+üretilen tasarımlar), bu yüzden aynı makinede sonuçlar karşılaştırılabilir:
+
+    python spreadblade_bench.py --save        # taban çizgisini kaydet
+    python spreadblade_bench.py               # karşılaştır (gerilemede çıkış kodu 1)
+    python spreadblade_bench.py -k batch,sweep --slow
+    python spreadblade_bench.py --profile-overhead   # Profiler ek yükü (sınır %2)
+
+Arayüz ölçümleri (calculate_all_gui, graph_*) bir ekran gerektirir; ekran
+yoksa atlanır. 10M tasarımlık tarama uzun sürdüğünden yalnızca --slow ile
+çalışır. Taban çizgisi makineye özgüdür; kaydedildiği ortam dosyada saklanır
+ve farklı bir ortamda karşılaştırılırken uyarı verilir. Eşiğin altında kalan
+ölçümler bir kez daha ölçülür; gerileme ancak ikinci ölçümde de sürerse
+bildirilir.
+
+--profile-overhead, spreadblade_profile.Profiler'ın (varsayılan örnekleme)
+motor ve toplu hesaplamaya eklediği süreyi ölçer: aynı iş Profiler kapalı
+ve açık olarak art arda, sırası her çiftte değişerek PROFILE_REPEATS kez
+çalıştırılır ve çift oranlarının medyanı bildirilir. Ek yük
+PROFILE_OVERHEAD_LIMIT'i aşarsa çıkış kodu 1'dir.
+"""
+import argparse
+import contextlib
+import fnmatch
+import functools
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+from spreadblade_engine import DEFAULT_INPUTS, SpreadBladeEngine
+
+BENCH_SEED = 20240611
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "spreadblade_bench_baseline.json")
+DEFAULT_THRESHOLD = 0.25 # Taban çizgisinin altında izin verilen oran
+REPEATS = 5
+TIME_BUDGET = 3.0 # Ölçüm başına en fazla süre (s); uzun ölçümlerde tekrar sayısı azalır
+PROFILE_REPEATS = 41 # Profiler açık/kapalı çift sayısı
+PROFILE_OVERHEAD_LIMIT = 0.02
+
+BENCHMARKS = {} # ad -> hazırlık fonksiyonu (bkz. benchmark)
+
+
+class BenchmarkSkipped(Exception):
+    """Ölçüm bu ortamda çalıştırılamıyor (ör. ekran yok)."""
+
+
+def benchmark(units=1, slow=False):
+    """Hazırlık fonksiyonunu BENCHMARKS'a "bench_" öneki olmadan kaydeder.
+
+    Fonksiyon ölçülecek çağrılabilir nesneyi döndürür; `units` bir çağrıdaki
+    işlem (tasarım) sayısıdır.
+    """
+    def decorate(setup):
+        setup.units = units
+        setup.slow = slow
+        BENCHMARKS[setup.__name__[len("bench_"):]] = setup
+        return setup
+    return decorate
+
+
+def design_columns(size, seed=BENCH_SEED):
+    """Toplu ölçümler için tekrarlanabilir `size` tasarımlık girdi sütunları."""
+    import numpy as np
+    from spreadblade_batch import input_columns
+    rng = np.random.default_rng(seed)
+    return input_columns(dict(
+        DEFAULT_INPUTS,
+        psi_deg=rng.uniform(20.0, 40.0, size),
+        rc=rng.uniform(3.5, 6.0, size),
+        F=rng.uniform(1.0, 2.0, size),
+        Pd=rng.choice([2.5, 3.0, 4.0, 5.0, 6.0, 8.0], size),
+    ))
+
+
+def sweep_axes(size):
+    """Yaklaşık `size` noktalı tarama ızgarası (psi x rc x F x phi)."""
+    from spreadblade_sweep import grid_axis
+    counts = {1_000: (10, 10, 10, 1), 100_000: (100, 100, 10, 1), 10_000_000: (100, 100, 100, 10)}[size]
+    ranges = [("psi_deg", 20.0, 40.0), ("rc", 3.5, 6.0), ("F", 1.0, 2.0), ("phi_deg", 14.5, 25.0)]
+    return {name: grid_axis(start, stop, count) for (name, start, stop), count in zip(ranges, counts)}
+
+
+# --- Motor adımları ---
+@benchmark()
+def bench_process_inputs():
+    engine = SpreadBladeEngine()
+    return lambda: engine.process_inputs(DEFAULT_INPUTS)
+
+
+@benchmark()
+def bench_calculate_sb1():
+    engine = SpreadBladeEngine()
+    engine.calculate_all(DEFAULT_INPUTS)
+    return engine.calculate_sb1
+
+
+@benchmark()
+def bench_calculate_sb2():
+    engine = SpreadBladeEngine()
+    engine.calculate_all(DEFAULT_INPUTS)
+    return engine.calculate_sb2
+
+
+@benchmark()
+def bench_calculate_sb3():
+    engine = SpreadBladeEngine()
+    engine.calculate_all(DEFAULT_INPUTS)
+    return engine.calculate_sb3
+
+
+@benchmark()
+def bench_calculate_all():
+    engine = SpreadBladeEngine() # Önbelleksiz
+    return lambda: engine.calculate_all(DEFAULT_INPUTS)
+
+
+# --- Arayüz ---
+@functools.lru_cache(maxsize=None)
+def _gui_app():
+    """Gizli bir pencerede hesaplanmış durumda SpiralBevelCalculator."""
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise BenchmarkSkipped(f"ekran yok ({e})") from None
+    root.withdraw()
+    from SpreadbladeSUMMARYANDMACHINESETTINGS import SpiralBevelCalculator
+    app = SpiralBevelCalculator(root)
+    engine = SpreadBladeEngine()
+    app.finish_calculation((engine, engine.calculate_all(DEFAULT_INPUTS), None), None)
+    app.setup_graph_frame()
+    root.update()
+    return app
+
+
+@benchmark()
+def bench_calculate_all_gui():
+    """Arka plan işinin gövdesi ve finish_calculation, eşzamanlı olarak.
+
+    Tk döngüsünün RESULT_POLL_MS beklemesi ölçüme katılmaz.
+    """
+    app = _gui_app()
+    inputs = {name: var.get() for name, var in app.input_vars.items()}
+
+    def run():
+        engine = SpreadBladeEngine()
+        app.finish_calculation((engine, engine.calculate_all(inputs), None), None)
+        app.root.update_idletasks()
+    return run
+
+
+def _graph(name):
+    app = _gui_app()
+    generate = getattr(app, name)
+
+    def run():
+        generate()
+        app.root.update_idletasks() # draw_idle ile bekleyen çizim
+    return run
+
+
+@benchmark()
+def bench_graph_k1():
+    return _graph("generate_k1_graph")
+
+
+@benchmark()
+def bench_graph_face_contact():
+    return _graph("generate_face_contact_graph")
+
+
+@benchmark()
+def bench_graph_gear():
+    return _graph("generate_gear_visualization")
+
+
+# --- Toplu hesaplama ve tarama ---
+def _batch(size, k1_table=False):
+    from spreadblade_batch import calculate_batch, k1_factor
+    columns = design_columns(size)
+    k1 = k1_factor
+    if k1_table:
+        from spreadblade_k1table import open_k1_table
+        k1 = open_k1_table()
+    return lambda: calculate_batch(columns, k1)
+
+
+@benchmark(units=1_000)
+def bench_batch_1k():
+    return _batch(1_000)
+
+
+@benchmark(units=100_000)
+def bench_batch_100k():
+    return _batch(100_000)
+
+
+@benchmark(units=100_000)
+def bench_batch_100k_k1table():
+    return _batch(100_000, k1_table=True)
+
+
+@benchmark(units=100_000)
+def bench_gear_match_100k():
+    from spreadblade_batch import GEAR_RATIO_ITEMS, calculate_batch
+    from spreadblade_gears import default_gear_index
+    result = calculate_batch(design_columns(100_000))
+    index = default_gear_index()
+    ratios = [result.columns[item + side] for item in GEAR_RATIO_ITEMS.values() for side in ("L", "R")]
+    return lambda: [index.match(column) for column in ratios]
+
+
+@benchmark(units=100_000)
+def bench_cutter_select_100k():
+    import numpy as np
+    from spreadblade_batch import calculate_batch
+    from spreadblade_cutters import default_cutter_catalog
+    result = calculate_batch(design_columns(100_000))
+    catalog = default_cutter_catalog()
+    rc, WMP, Nb_prime = result.columns["8L"], result.columns["49L"], result.columns["95L"]
+    return lambda: (catalog.select_column(rc, "WB", WMP / 2.0 + 0.003),
+                    catalog.select_column(rc, "NB", np.abs(Nb_prime), strict=True))
+
+
+@benchmark(units=100_000)
+def bench_machine_fit_100k():
+    from spreadblade_batch import calculate_batch
+    from spreadblade_machines import evaluate_result
+    result = calculate_batch(design_columns(100_000))
+    return lambda: evaluate_result(result)
+
+
+@benchmark(units=100_000)
+def bench_parallel_100k():
+    from spreadblade_parallel import calculate_parallel
+    columns = design_columns(100_000)
+    return lambda: calculate_parallel(columns)
+
+
+@benchmark(units=100_000)
+def bench_export_npy_100k():
+    import tempfile
+    from spreadblade_export import export_batch
+    columns = design_columns(100_000)
+    directory = tempfile.TemporaryDirectory() # Kıyaslama bitince silinir
+    path = os.path.join(directory.name, "sonuc")
+    return lambda: (directory, export_batch(columns, path))
+
+
+def _sweep(size):
+    from spreadblade_sweep import iter_sweep, sweep_size
+    axes = sweep_axes(size)
+    assert sweep_size(axes) == size
+
+    def run():
+        for _ in iter_sweep(DEFAULT_INPUTS, axes):
+            pass
+    return run
+
+
+@benchmark(units=1_000)
+def bench_sweep_1k():
+    return _sweep(1_000)
+
+
+@benchmark(units=100_000)
+def bench_sweep_100k():
+    return _sweep(100_000)
+
+
+@benchmark(units=10_000_000, slow=True)
+def bench_sweep_10M():
+    return _sweep(10_000_000)
+
+
+@benchmark(units=100_000)
+def bench_tolerance_100k():
+    from spreadblade_tolerance import analyze
+    return lambda: analyze(DEFAULT_INPUTS, samples=100_000, seed=BENCH_SEED)
+
+
+@benchmark(units=1_000)
+def bench_sensitivity_1k():
+    from spreadblade_sensitivity import sensitivity
+    columns = design_columns(1_000)
+    return lambda: sensitivity(columns)
+# --- ---
+
+
+def measure(func, repeats=REPEATS, budget=TIME_BUDGET):
+    """Bir çağrının en iyi süresi (s).
+
+    Çağrı sayısı timeit.autorange ile en az 0.2 s sürecek şekilde seçilir;
+    toplam süre `budget`'ı aşınca tekrar kesilir.
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    best, total = elapsed / number, elapsed
+    for _ in range(repeats - 1):
+        if total > budget:
+            break
+        elapsed = timer.timeit(number)
+        best = min(best, elapsed / number)
+        total += elapsed
+    return best
+
+
+def _overhead_cases():
+    """Profiler ek yükü ölçülen işler: ad -> çağrılabilir."""
+    from spreadblade_batch import calculate_batch
+    engine = SpreadBladeEngine() # Önbelleksiz
+    columns = design_columns(20_000)
+
+    def engine_200():
+        for _ in range(200):
+            engine.calculate_all(DEFAULT_INPUTS)
+    return {"calculate_all_x200": engine_200, "batch_20k": lambda: calculate_batch(columns)}
+
+
+def profile_overhead(repeats=PROFILE_REPEATS, report=print):
+    """Profiler'ın ek yükü: ad -> (açık / kapalı) süre oranlarının medyanı - 1.
+
+    Her çiftte iki ölçüm arka arkaya alınır, sıra çiftten çifte değişir;
+    böylece ısınma ve frekans kaymaları iki tarafa eşit dağılır.
+    """
+    from spreadblade_profile import Profiler
+    results = {}
+    for name, func in _overhead_cases().items():
+        func() # Isınma
+        ratios = []
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for i in range(repeats):
+                times = {}
+                for profiled in ((False, True) if i % 2 else (True, False)):
+                    with Profiler() if profiled else contextlib.nullcontext():
+                        start = time.perf_counter()
+                        func()
+                        times[profiled] = time.perf_counter() - start
+                ratios.append(times[True] / times[False])
+        finally:
+            if enabled:
+                gc.enable()
+        results[name] = statistics.median(ratios) - 1.0
+        low, _, high = statistics.quantiles(ratios, n=4)
+        report(f"{name:<24} ek yük {results[name] * 100:+6.2f}%  "
+               f"(medyan, {repeats} çift; çeyrekler {(low - 1) * 100:+.2f}% / {(high - 1) * 100:+.2f}%)")
+    return results
+
+
+def environment():
+    """Taban çizgisinin kaydedildiği ortam."""
+    import numpy as np
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "system": platform.system(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def select(patterns=None, slow=False):
+    """Adları virgülle ayrılmış desenlere (fnmatch veya alt dize) uyan ölçümler."""
+    names = [name for name, setup in BENCHMARKS.items() if slow or not setup.slow]
+    if not patterns:
+        return names
+    patterns = [p.strip() for p in patterns.split(",") if p.strip()]
+    return [name for name in names if any(p in name or fnmatch.fnmatch(name, p) for p in patterns)]
+
+
+def run_benchmarks(names, report=print):
+    """Ölçümleri çalıştırır; ad -> saniyedeki işlem sayısı (atlananlar: None)."""
+    results = {}
+    for name in names:
+        setup = BENCHMARKS[name]
+        try:
+            func = setup()
+        except BenchmarkSkipped as e:
+            report(f"{name:<24} atlandı: {e}")
+            results[name] = None
+            continue
+        func() # Isınma (önbellekler, tembel içe aktarmalar)
+        results[name] = setup.units / measure(func)
+        report(f"{name:<24} {results[name]:>14,.1f} /s")
+    return results
+
+
+def load_baseline(path):
+    """Kayıtlı taban çizgisi ({"environment", "results"}); dosya yoksa None."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path, results):
+    """Ölçülen sonuçları taban çizgisine yazar; kayıtlı diğer ölçümler korunur."""
+    baseline = load_baseline(path) or {"results": {}}
+    baseline["environment"] = environment()
+    baseline["results"].update((name, value) for name, value in results.items() if value is not None)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """(ad, ölçülen, taban, oran) satırları ve eşiğin altına düşen ölçümler."""
+    rows, regressions = [], []
+    for name, value in results.items():
+        reference = baseline["results"].get(name)
+        ratio = value / reference if value is not None and reference else None
+        rows.append((name, value, reference, ratio))
+        if ratio is not None and ratio < 1.0 - threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="SB hesaplayıcının performans ölçümleri.")
+    parser.add_argument("-k", "--select", help="Çalıştırılacak ölçümler (virgülle ayrılmış ad/desen)")
+    parser.add_argument("--slow", action="store_true", help="Uzun ölçümleri de çalıştır (10M tarama)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Taban çizgisi dosyası")
+    parser.add_argument("--save", action="store_true", help="Sonuçları taban çizgisi olarak kaydet")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="İzin verilen gerileme oranı (0.25 = %%25 yavaşlama)")
+    parser.add_argument("--list", action="store_true", help="Ölçümleri listele")
+    parser.add_argument("--profile-overhead", action="store_true",
+                        help=f"Profiler'ın ek yükünü ölç (sınır %%{PROFILE_OVERHEAD_LIMIT * 100:g})")
+    return parser
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası; gerileme varsa 1 döndürür."""
+    args = build_parser().parse_args(argv)
+    if args.profile_overhead:
+        overhead = profile_overhead()
+        over = [name for name, value in overhead.items() if value > PROFILE_OVERHEAD_LIMIT]
+        if over:
+            print(f"\nProfiler ek yükü %{PROFILE_OVERHEAD_LIMIT * 100:g} sınırını aşıyor: " + ", ".join(over))
+            return 1
+        return 0
+    names = select(args.select, args.slow or args.list)
+    if args.list:
+        for name in names:
+            setup = BENCHMARKS[name]
+            print(f"{name:<24} {setup.units:>10,} işlem/çağrı" + ("  (--slow)" if setup.slow else ""))
+        return 0
+    if not names:
+        print("Seçilen ölçüm yok.", file=sys.stderr)
+        return 2
+
+    results = run_benchmarks(names)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Taban çizgisi kaydedildi: {args.baseline}")
+        return 0
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"Taban çizgisi yok ({args.baseline}); önce --save ile kaydedin.")
+        return 0
+    if baseline.get("environment") != environment():
+        print("Uyarı: taban çizgisi farklı bir ortamda kaydedilmiş; karşılaştırma yaklaşık.")
+
+    rows, regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        # Anlık yük dalgalanmalarına karşı gerileyen ölçümler bir kez daha ölçülür
+        print("\nGerileyen ölçümler yeniden ölçülüyor...")
+        retry = run_benchmarks(regressions)
+        results.update((name, max(results[name], retry[name])) for name in regressions)
+        rows, regressions = compare(results, baseline, args.threshold)
+    print(f"\n{'ölçüm':<24} {'ölçülen /s':>14} {'taban /s':>14} {'oran':>7}")
+    for name, value, reference, ratio in rows:
+        measured = f"{value:,.1f}" if value is not None else "-"
+        stored = f"{reference:,.1f}" if reference else "-"
+        change = f"{ratio:.2f}" if ratio is not None else "-"
+        flag = "  GERİLEME" if name in regressions else ""
+        print(f"{name:<24} {measured:>14} {stored:>14} {change:>7}{flag}")
+    if regressions:
+        print(f"\n{len(regressions)} ölçüm taban çizgisinin %{args.threshold * 100:.0f} altında: "
+              + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""SB hesaplama sonuçları için LRU + SQLite önbelleği.
+
+Anahtar, process_inputs'un gördüğü kanonik girdi vektörü (14 girdi float
+olarak, INPUT_PARAMETERS sırasıyla) ile koddaki sabitlerden (stok payı,
+seçilen makinenin tüm kaydı: ad, K2, β sınırları ve kızak açısı kuralı, CF),
+değişim dişlisi envanterinin imzasından (Öğe 132/134) ve FORMULA_VERSION'dan
+oluşur. Bellekteki sınırlı LRU önünde durur, kaçan sonuçlar diskteki SQLite
+deposundan okunur; her ikisinde de bulunursa calculate_sb1-calculate_sb3 hiç
+çalıştırılmaz:
+
+    engine = SpreadBladeEngine(cache=ResultCache(path="sonuclar.sqlite"))
+    engine.calculate_all(inputs)
+    engine.cache.stats()
+
+Formüller veya tablolar değiştiğinde spreadblade_engine.FORMULA_VERSION
+artırılmalıdır; eski sürümün kayıtları açılışta silinir. invalidate()
+tüm önbelleği elle temizler.
+"""
+import json
+import os
+import sqlite3
+import threading
+import warnings
+from collections import OrderedDict
+
+from spreadblade_engine import (
+    INPUT_PARAMETERS, STOCK_ALLOWANCE, CF_FINISH, DEFAULT_MACHINE, FORMULA_VERSION, SBSummary, find_machine,
+)
+
+INPUT_NAMES = [name for _, name, _, _ in INPUT_PARAMETERS]
+DEFAULT_CAPACITY = 512
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".spreadblade_cache.sqlite")
+
+
+def cache_key(inputs, machine=DEFAULT_MACHINE):
+    """Girdilerin `machine` (Öğe 138-144) için kanonik anahtarı.
+
+    Değerler process_inputs gibi float'a çevrilir (-0.0 -> 0.0). Eksik veya
+    sayıya çevrilemeyen girdiler KeyError/ValueError fırlatır.
+    """
+    # numpy'ı ilk hesaplamaya kadar yükleme
+    from spreadblade_cutters import default_signature as cutter_signature
+    from spreadblade_gears import default_signature as gear_signature
+    vector = [float(inputs[name]) + 0.0 for name in INPUT_NAMES]
+    name, K2, (beta_min, beta_max), rule = find_machine(machine)
+    vector += [STOCK_ALLOWANCE, K2, beta_min, beta_max, CF_FINISH]
+    prefix = f"v{FORMULA_VERSION}:g{gear_signature()}:c{cutter_signature()}:m{name}:{rule}:"
+    return prefix + ",".join(repr(value) for value in vector)
+
+
+def _dump(summary):
+    return json.dumps({
+        "items": dict(summary.items.items()),
+        "values": summary.values,
+        "warnings": summary.warnings,
+    }, ensure_ascii=False)
+
+
+def _load(data):
+    return SBSummary(data["items"], data["values"], data["warnings"])
+
+
+def _copy(summary):
+    return SBSummary(summary.items.copy(), dict(summary.values), summary.warnings)
+
+
+class ResultCache:
+    """Sınırlı bellek LRU'su ve isteğe bağlı SQLite deposu.
+
+    `path` None ise yalnızca bellek kullanılır. Sayaçlar: `hits` (bellek),
+    `disk_hits` (SQLite) ve `misses`.
+    """
+    def __init__(self, capacity=DEFAULT_CAPACITY, path=None):
+        self.capacity = capacity
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, version INTEGER, data TEXT)")
+            # Başka bir formül sürümüyle yazılmış kayıtlar artık geçersiz
+            self._db.execute("DELETE FROM results WHERE version != ?", (FORMULA_VERSION,))
+            self._db.commit()
+
+    def _remember(self, key, summary):
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Önbellekteki SBSummary'nin kopyasını, yoksa None döndürür."""
+        with self._lock:
+            summary = self._memory.get(key)
+            if summary is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return _copy(summary)
+            if self._db is not None:
+                row = self._db.execute("SELECT data FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    summary = _load(json.loads(row[0]))
+                    self._remember(key, summary)
+                    self.disk_hits += 1
+                    return _copy(summary)
+            self.misses += 1
+            return None
+
+    def put(self, key, summary):
+        """Başarılı bir hesaplamanın sonucunu saklar."""
+        with self._lock:
+            self._remember(key, _copy(summary))
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO results (key, version, data) VALUES (?, ?, ?)",
+                                 (key, FORMULA_VERSION, _dump(summary)))
+                self._db.commit()
+
+    def invalidate(self):
+        """Bellekteki ve diskteki tüm sonuçları siler."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def stats(self):
+        """İsabet/kaçırma sayaçları ve boyutlar."""
+        with self._lock:
+            size = len(self._memory)
+            stored = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0] if self._db is not None else 0
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_size": size,
+            "stored": stored,
+        }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def open_cache(path=DEFAULT_PATH, capacity=DEFAULT_CAPACITY):
+    """Diskteki önbelleği açar; açılamazsa yalnızca bellek kullanılır."""
+    try:
+        return ResultCache(capacity, path)
+    except (sqlite3.Error, OSError) as e:
+        warnings.warn(f"Önbellek dosyası açılamadı ({e}); yalnızca bellek kullanılacak.", RuntimeWarning, stacklevel=2)
+        return ResultCache(capacity)
@@ -0,0 +1,393 @@
+"""Komut satırından toplu SB hesaplaması (CSV / NDJSON iş dosyaları).
+
+Her satır bir tasarımdır ve arayüzdeki giriş alanlarıyla aynı adları
+taşır (n, N, Pd, phi_deg, shaft_angle_deg, psi_deg, F, rc, a0P, a0G, b0P,
+b0G, t0PL, t0G). Diğer sütunlar (ör. iş numarası) çıktıya aynen aktarılır.
+
+    python spreadblade_cli.py isler.csv -o ayarlar.csv
+    python spreadblade_cli.py isler.ndjson -o ayarlar.ndjson
+    python spreadblade_cli.py isler.csv -o ayarlar.csv --profile profil.folded
+    python spreadblade_cli.py isler.csv -o ayarlar.csv --sensitivity
+    python spreadblade_cli.py isler.csv -o ayarlar.csv --machines
+    python spreadblade_cli.py isler.csv -o sonuc --columnar
+
+--columnar tüm öğeleri sütun sütun (47L, 136R), tam hassasiyetle ve parça
+parça yazar (csv, jsonl veya uzantısız yol için npy dizini; bkz.
+spreadblade_export). Aktarılan sütunlar ve satır hataları ("error_message")
+orada da yazılır.
+
+Hatalı satırlar hesaplamayı durdurmaz; çıktıda `error` alanıyla işaretlenir.
+"""
+import argparse
+import contextlib
+import csv
+import json
+import math
+import os
+import sys
+
+import numpy as np
+
+from spreadblade_engine import DEFAULT_MACHINE, TEXT_ITEMS, machine_names
+from spreadblade_batch import INPUT_NAMES, PRECISION, calculate_batch, k1_factor
+from spreadblade_export import export_batch, result_keys
+from spreadblade_parallel import calculate_parallel
+from spreadblade_k1table import K1_TABLE_TOLERANCE, open_k1_table
+from spreadblade_machines import evaluate_result, machine_output_columns
+from spreadblade_profile import Profiler, profiled
+from spreadblade_sensitivity import sensitivity, sensitivity_columns
+
+# Makine ayarları özeti: (çıktı adı, öğe anahtarı)
+MACHINE_SETTINGS = [
+    ("S", "136L"),
+    ("Q_LH", "137L"),
+    ("Q_RH", "137R"),
+    ("beta", "141L"),
+    ("m75_L", "131L"),
+    ("m75_R", "131R"),
+    ("m50_L", "133L"),
+    ("m50_R", "133R"),
+]
+
+FORMATS = ("csv", "ndjson")
+
+
+def detect_format(path, fmt=None):
+    """Dosya biçimini uzantıdan belirler (.csv, .ndjson/.jsonl)."""
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".ndjson", ".jsonl", ".json"):
+        return "ndjson"
+    return "csv"
+
+
+def _open(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+@profiled("cli;read")
+def read_jobs(path, fmt=None):
+    """İş dosyasını okur.
+
+    (girdi sütunları, satır hataları, aktarılan sütunlar) döndürür. Sayıya
+    çevrilemeyen değerler o satır için hata kaydı olur ve NaN ile doldurulur;
+    NDJSON'da okunamayan bir satır da dosyanın geri kalanını durdurmaz,
+    satır numarasıyla hata kaydı olur.
+    """
+    fmt = detect_format(path, fmt)
+    errors = fieldnames = None
+    with _open(path, "r") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            rows = list(reader)
+            fieldnames = reader.fieldnames or []
+        else:
+            rows, errors = [], []
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    if not isinstance(row, dict):
+                        raise ValueError("JSON nesnesi bekleniyordu")
+                except ValueError as e:
+                    rows.append({})
+                    errors.append(("Giriş Hatası", f"{line_number}. satır okunamadı: {e}"))
+                    continue
+                rows.append(row)
+                errors.append(None)
+    return parse_jobs(rows, errors, fieldnames)
+
+
+def parse_jobs(rows, errors=None, fieldnames=None):
+    """Satır sözlüklerini read_jobs ile aynı biçime çevirir.
+
+    `errors` verilirse satırların önceden bilinen hatalarıdır (ör. okunamayan
+    NDJSON satırı); bu satırların hatası değişmez. `fieldnames` (CSV
+    başlığı) verilirse sütunlar ondan alınır; satır olmasa da eksik sütun
+    denetlenir. Eksik girdi sütunu varsa ValueError fırlatılır; başlıksız
+    boş bir iş listesi sıfır satırdır.
+    """
+    if fieldnames is None:
+        fieldnames = list(rows[0]) if rows else []
+        names = set().union(*(row.keys() for row in rows)) if rows else set(INPUT_NAMES)
+    else:
+        names = set(fieldnames)
+    missing = [name for name in INPUT_NAMES if name not in names]
+    if missing:
+        raise ValueError(f"İş dosyasında eksik sütun(lar): {', '.join(missing)}")
+    passthrough = [key for key in fieldnames if key not in INPUT_NAMES]
+
+    inputs = {name: np.empty(len(rows)) for name in INPUT_NAMES}
+    row_errors = list(errors) if errors is not None else [None] * len(rows)
+    for i, row in enumerate(rows):
+        for name in INPUT_NAMES:
+            try:
+                inputs[name][i] = float(row.get(name))
+            except (TypeError, ValueError):
+                inputs[name][i] = np.nan
+                if row_errors[i] is None:
+                    row_errors[i] = ("Giriş Hatası", f"Geçersiz giriş değeri: {name}={row.get(name)!r}")
+    extra = {key: [row.get(key, "") for row in rows] for key in passthrough}
+    return inputs, row_errors, extra
+
+
+def json_value(value):
+    """JSON'da karşılığı olmayan sayılar (NaN, inf) null olur; sözlük ve listelerde de."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_value(item) for item in value]
+    return value
+
+
+def _row_error(result, row_errors, i):
+    error = row_errors[i] or result.error_message(i)
+    return f"{error[0]}: {error[1]}" if error else ""
+
+
+def _csv_field(value):
+    """Tek bir CSV alanını gerekiyorsa tırnaklar."""
+    text = str(value)
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _derived_fields(derived, full_precision):
+    """Ek sütun grupları (bkz. sensitivity_columns, machine_output_columns).
+
+    `derived` grup adı -> (sayısal, metin) sütun sözlükleridir. Gruplar
+    sırayla, her grupta önce sayısal sonra metin sütunları gelir:
+    (gruplar [(ad, sütun adları, alan biçimleri)], satır değerleri, sayısal diziler).
+    """
+    if not derived:
+        return [], None, []
+    groups, columns, arrays = [], [], []
+    number = "%r" if full_precision else "%.6g"
+    for group, (numeric, text) in derived.items():
+        groups.append((group, list(numeric) + list(text), [number] * len(numeric) + ["%s"] * len(text)))
+        columns += [column.tolist() for column in numeric.values()] + list(text.values())
+        arrays += numeric.values()
+    return groups, list(zip(*columns)), arrays
+
+
+@profiled("cli;write")
+def write_csv(f, inputs, row_errors, extra, result, full_precision=False, derived=None):
+    """Sonuçları CSV olarak yazar (sayılar arayüzdeki hassasiyetle).
+
+    `derived` verilirse (grup -> (sayısal, metin) sütun sözlükleri) sütunlar
+    satırın sonuna eklenir.
+    """
+    keys = result_keys(result)
+    numeric = [key for key in keys if key[:-1] not in TEXT_ITEMS]
+    text = [key for key in keys if key[:-1] in TEXT_ITEMS]
+    groups, derived_rows, _ = _derived_fields(derived, full_precision)
+    derived_names = [name for _, names, _ in groups for name in names]
+    derived_format = ",".join(spec for _, _, specs in groups for spec in specs)
+    header = (["row"] + list(extra) + INPUT_NAMES + ["error"]
+              + [name for name, _ in MACHINE_SETTINGS] + numeric + text + derived_names)
+    f.write(",".join(_csv_field(name) for name in header) + "\n")
+
+    # Satır başına tek bir % işlemi: sütun biçimleri önceden birleştirilir
+    def spec(key):
+        return "%r" if full_precision else f"%.{PRECISION.get(key, 4)}f"
+    columns = [key for _, key in MACHINE_SETTINGS] + numeric
+    row_format = ",".join(spec(key) for key in columns)
+    matrix = np.column_stack([result.columns[key] for key in columns]).tolist()
+    input_format = ",".join(["%r"] * len(INPUT_NAMES))
+    input_matrix = np.column_stack([inputs[name] for name in INPUT_NAMES]).tolist()
+    # Metin öğeleri virgül içermez; sütun sütun biçimlendirilir
+    text_rows = zip(*[result.text_column(key[:-1], key[-1]) for key in text]) if text else None
+    empty = "," * (len(columns) + len(text) + len(derived_names) - 1)
+
+    for i in range(result.size):
+        error = _row_error(result, row_errors, i)
+        lead = str(i + 1)
+        for values in extra.values():
+            lead += "," + _csv_field(values[i])
+        lead += "," + input_format % tuple(input_matrix[i]) + "," + _csv_field(error)
+        texts = next(text_rows) if text else ()
+        if error:
+            tail = empty
+        else:
+            tail = row_format % tuple(matrix[i])
+            if text:
+                tail += "," + ",".join(texts)
+            if derived_names:
+                tail += "," + derived_format % derived_rows[i]
+        f.write(lead + "," + tail + "\n")
+
+
+@profiled("cli;write")
+def write_ndjson(f, inputs, row_errors, extra, result, full_precision=False, derived=None):
+    """Sonuçları satır başına bir JSON nesnesi olarak yazar.
+
+    Hızlı yol satırı önceden hazırlanmış bir şablonla biçimlendirir; hatalı
+    veya sonlu olmayan değer içeren satırlar json.dumps ile yazılır; NaN ve
+    inf null olur, çıktı her zaman geçerli JSON'dur. `derived` verilirse (grup -> (sayısal, metin) sütun sözlükleri) her grup
+    kendi adıyla bir nesneye ("sensitivity", "machines") yazılır.
+    """
+    keys = result_keys(result)
+    numeric = [key for key in keys if key[:-1] not in TEXT_ITEMS]
+    text = [key for key in keys if key[:-1] in TEXT_ITEMS]
+    groups, derived_rows, derived_arrays = _derived_fields(derived, full_precision)
+
+    def spec(key):
+        return "%r" if full_precision else f"%.{PRECISION.get(key, 4)}f"
+    columns = [key for _, key in MACHINE_SETTINGS] + numeric
+    names = [name for name, _ in MACHINE_SETTINGS] + numeric
+    values = np.column_stack([result.columns[key] for key in columns])
+    finite = np.isfinite(values).all(axis=1) & np.isfinite(
+        np.column_stack([inputs[name] for name in INPUT_NAMES])).all(axis=1)
+    if derived_arrays:
+        finite &= np.isfinite(np.column_stack(derived_arrays)).all(axis=1)
+    derived_template = "".join(
+        f', "{group}": {{' + ", ".join(f'"{name}": {spec}' if spec != "%s" else f'"{name}": "%s"'
+                                        for name, spec in zip(names, specs)) + "}"
+        for group, names, specs in groups)
+    values = values.tolist()
+    input_matrix = np.column_stack([inputs[name] for name in INPUT_NAMES]).tolist()
+    template = (", ".join(f'"{name}": %r' for name in INPUT_NAMES) + ", "
+                + ", ".join(f'"{name}": {spec(key)}' for name, key in MACHINE_SETTINGS)
+                + ', "items": {' + ", ".join(f'"{key}": {spec(key)}' for key in numeric))
+    text_rows = zip(*[result.text_column(key[:-1], key[-1]) for key in text]) if text else None
+
+    for i in range(result.size):
+        texts = next(text_rows) if text else ()
+        lead = '{"row": %d' % (i + 1)
+        for key, column in extra.items():
+            lead += f", {json.dumps(key, ensure_ascii=False)}: {json.dumps(json_value(column[i]), ensure_ascii=False)}"
+        error = row_errors[i] or result.error_message(i)
+        if not error and finite[i]:
+            line = lead + ", " + template % tuple(input_matrix[i] + values[i])
+            line += "".join(f', "{key}": "{value}"' for key, value in zip(text, texts)) + "}"
+            if groups:
+                line += derived_template % derived_rows[i]
+            f.write(line + "}\n")
+            continue
+        # Yavaş yol: hata kaydı veya NaN/inf içeren satır
+        record = {"row": i + 1}
+        record.update({key: column[i] for key, column in extra.items()})
+        record.update(zip(INPUT_NAMES, input_matrix[i]))
+        if error:
+            record["error"] = {"title": error[0], "message": error[1]}
+        else:
+            row = {name: value if full_precision or not math.isfinite(value)
+                   else round(value, PRECISION.get(key, 4))
+                   for name, key, value in zip(names, columns, values[i])}
+            record.update((name, row[name]) for name, _ in MACHINE_SETTINGS)
+            record["items"] = {key: row[key] for key in numeric}
+            record["items"].update(zip(text, texts))
+            start = 0
+            for group, group_names, _ in groups:
+                record[group] = dict(zip(group_names, derived_rows[i][start:start + len(group_names)]))
+                start += len(group_names)
+        f.write(json.dumps(json_value(record), ensure_ascii=False, allow_nan=False) + "\n")
+
+
+def run(input_path, output_path, input_format=None, output_format=None, full_precision=False,
+        workers=1, k1_table=False, with_sensitivity=False, with_machines=False, columnar=False,
+        machine=DEFAULT_MACHINE):
+    """İş dosyasını hesaplayıp sonucu yazar; (satır, hatalı satır) döndürür.
+
+    `workers` 1'den büyükse hesaplama süreç havuzunda yapılır. `k1_table`
+    True ise Öğe 67 (K1) önceden hesaplanmış tablodan okunur.
+    `with_sensitivity` True ise makine ayarlarının girdilere göre değişimleri
+    ve süreksizlik işaretleri de yazılır (bkz. spreadblade_sensitivity).
+    `with_machines` True ise tasarımı kesebilen makineler ve her makinedeki
+    eksantrik/kızak açıları yazılır (bkz. spreadblade_machines).
+    `columnar` True ise sonuçlar spreadblade_export ile sütunlu ve parça
+    parça yazılır (`output_format` csv, jsonl veya npy). Öğe 138-144 ve
+    duyarlılıklar `machine` (default_machines()'teki ad) ile hesaplanır.
+    """
+    if columnar:
+        if output_path == "-" or workers != 1 or with_sensitivity or with_machines:
+            raise ValueError("--columnar bir çıktı yolu gerektirir; -j, --sensitivity ve --machines ile kullanılamaz.")
+        inputs, row_errors, extra = read_jobs(input_path, input_format)
+        fmt = "jsonl" if output_format == "ndjson" else output_format
+        return export_batch(inputs, output_path, fmt, k1=open_k1_table() if k1_table else k1_factor, machine=machine,
+                            extra=extra, row_errors=row_errors)
+    if output_format == "npy":
+        raise ValueError("npy çıktısı yalnız --columnar ile yazılabilir.")
+    inputs, row_errors, extra = read_jobs(input_path, input_format)
+    if workers != 1:
+        result = calculate_parallel(inputs, workers=workers, k1_table=k1_table, machine=machine)
+    elif k1_table:
+        result = calculate_batch(inputs, open_k1_table(), machine)
+    else:
+        result = calculate_batch(inputs, machine=machine)
+    derived = {}
+    if with_sensitivity:
+        derived["sensitivity"] = sensitivity_columns(sensitivity(inputs, machine=machine))
+    if with_machines:
+        derived["machines"] = machine_output_columns(evaluate_result(result))
+    if output_format is None and output_path == "-":
+        output_format = detect_format(input_path, input_format) # stdout: girdi biçimiyle aynı
+    writer = write_csv if detect_format(output_path, output_format) == "csv" else write_ndjson
+    f = _open(output_path, "w")
+    try:
+        writer(f, inputs, row_errors, extra, result, full_precision, derived)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+    failed = sum(1 for i in range(result.size) if row_errors[i] or result.error[i])
+    return result.size, failed
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Gleason spread-blade SB1-SB3 özetini iş dosyasındaki her tasarım için hesaplar.")
+    parser.add_argument("input", help="İş dosyası (.csv veya .ndjson; '-' = stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Çıktı dosyası (varsayılan stdout)")
+    parser.add_argument("--input-format", choices=FORMATS, help="Girdi biçimi (varsayılan: uzantıdan)")
+    parser.add_argument("--output-format", choices=FORMATS + ("jsonl", "npy"),
+                        help="Çıktı biçimi (varsayılan: uzantıdan; jsonl ve npy yalnız --columnar ile)")
+    parser.add_argument("--full-precision", action="store_true",
+                        help="Sayıları arayüz hassasiyeti yerine tam hassasiyetle yaz")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="Paralel işçi süreç sayısı (0 = tüm çekirdekler)")
+    parser.add_argument("--k1-table", action="store_true",
+                        help=f"Öğe 67 K1'i önceden hesaplanmış tablodan oku (mutlak hata <= {K1_TABLE_TOLERANCE:g})")
+    parser.add_argument("--sensitivity", action="store_true",
+                        help="S, Q, beta, m75/m50, WG ve WRP'nin her girdinin 0.001 değişimine göre "
+                             "değişimini ve süreksizlik (Öğe 44, 48, 96, 139) işaretlerini ekle")
+    parser.add_argument("--machines", action="store_true",
+                        help="Tasarımı kesebilen makineleri (machine: ilk uygun, machines: tümü) ve her makinenin "
+                             "eksantrik ve kızak açılarını ekle")
+    parser.add_argument("--columnar", action="store_true",
+                        help="Her öğe ve tarafı (47L, 136R) ayrı sütun olarak tam hassasiyetle, parça parça yaz "
+                             "(csv, jsonl veya uzantısız yol için npy dizini)")
+    parser.add_argument("--machine", choices=machine_names(), default=DEFAULT_MACHINE,
+                        help=f"Öğe 138-144 ayarlarının hesaplandığı makine (varsayılan {DEFAULT_MACHINE})")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="Aşama süreleri ve geri dönüş sayaçlarını yaz (.json veya .folded; "
+                             "-j ile işçi süreçleri ölçülmez)")
+    return parser
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası."""
+    args = build_parser().parse_args(argv)
+    profiler = Profiler() if args.profile else None
+    try:
+        with profiler or contextlib.nullcontext():
+            total, failed = run(args.input, args.output, args.input_format,
+                                args.output_format, args.full_precision, args.workers or None,
+                                args.k1_table, args.sensitivity, args.machines, args.columnar, args.machine)
+        if profiler is not None:
+            profiler.write(args.profile)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    print(f"{total} tasarım hesaplandı, {failed} satırda hata.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
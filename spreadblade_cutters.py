@@ -0,0 +1,173 @@
+"""Öğe 50, 78 ve 96 için kesici ve bıçak kataloğu.
+
+Atölyedeki her kesici için mevcut bıçak uç genişlikleri (WB), bıçak
+sayıları (NB) ve kenar yarıçapları (rE) tek bir indeksli katalogda tutulur.
+Tasarımın kesicisi, rc'yi karşılayan en küçük katalog kesicisidir (rc en
+büyük kesiciden büyükse en büyüğü). O kesicide gereken değeri aşmayan en
+büyük mevcut değer seçilir:
+
+    catalog = default_cutter_catalog()
+    catalog.select(3.5, "WB", 0.058)                     # 0.050
+    catalog.select_column(rc, "NB", np.abs(Nb_prime), strict=True, smallest=True)
+
+Hiçbir değer uymuyorsa (gereken değer negatif, NaN veya kataloğun altında)
+sonuç NaN'dır: Öğe 50 ve 78'de tasarım bu kesiciyle kesilemez. Öğe 96'da
+bıçak sayısı Nb' değerinden küçük olmalıdır (strict=True) ve uygun standart
+yoksa kesicinin en küçük bıçak sayısı alınır (smallest=True).
+
+Katalog varsayılan olarak CUTTERS'tır; SPREADBLADE_CUTTERS ortam değişkeni
+"rc ; WB listesi ; NB listesi ; rE listesi" satırlarından oluşan bir
+dosyayı gösterirse o okunur.
+"""
+import bisect
+import functools
+import hashlib
+import math
+import os
+
+import numpy as np
+
+CUTTER_CATALOG_ENV = "SPREADBLADE_CUTTERS"
+
+# Kesici kataloğu: (rc, bıçak uç genişlikleri, bıçak sayıları, kenar yarıçapları), inç
+CUTTERS = [
+    (3.5, (0.020, 0.030, 0.040, 0.050, 0.060, 0.065, 0.080, 0.100), (8, 12), (0.005, 0.010, 0.015, 0.020, 0.030)),
+    (4.5, (0.030, 0.040, 0.050, 0.065, 0.080, 0.100, 0.120), (8,), (0.010, 0.015, 0.020, 0.030, 0.040)),
+    (5.0, (0.040, 0.050, 0.065, 0.080, 0.100, 0.120, 0.140), (12,), (0.010, 0.020, 0.030, 0.040, 0.050)),
+    (6.0, (0.050, 0.065, 0.080, 0.100, 0.120, 0.140, 0.160), (12, 16), (0.015, 0.020, 0.030, 0.040, 0.050)),
+    (7.5, (0.065, 0.080, 0.100, 0.120, 0.140, 0.160, 0.200), (12, 16), (0.020, 0.030, 0.040, 0.050, 0.060)),
+    (9.0, (0.080, 0.100, 0.120, 0.140, 0.160, 0.200, 0.250), (12, 16, 20), (0.020, 0.030, 0.040, 0.060, 0.080)),
+    (12.0, (0.100, 0.120, 0.140, 0.160, 0.200, 0.250, 0.300), (12, 16, 20, 24, 28), (0.030, 0.040, 0.060, 0.080, 0.100)),
+    (18.0, (0.120, 0.160, 0.200, 0.250, 0.300, 0.350, 0.400), (12, 24, 32, 36), (0.040, 0.060, 0.080, 0.100, 0.120)),
+]
+
+# Katalog sütunları: CUTTERS demetlerindeki sıra (rc'den sonra)
+CATALOG_COLUMNS = ("WB", "NB", "rE")
+
+
+def read_catalog(path):
+    """Katalog dosyasını CUTTERS biçiminde okur.
+
+    Her satır "rc ; WB listesi ; NB listesi ; rE listesi" içerir (listeler
+    boşluk veya virgülle ayrılır); "#" sonrası yok sayılır. Hatalı satırlarda
+    ValueError fırlatılır.
+    """
+    cutters = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            fields = line.split("#", 1)[0].split(";")
+            if not fields[0].strip() and len(fields) == 1:
+                continue
+            try:
+                if len(fields) != 4:
+                    raise ValueError
+                rc = float(fields[0])
+                widths, blades, radii = (field.replace(",", " ").split() for field in fields[1:])
+                cutter = (rc, tuple(map(float, widths)), tuple(map(int, blades)), tuple(map(float, radii)))
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: 'rc ; WB ; NB ; rE' bekleniyordu: {line.strip()}") from None
+            if not all(cutter[1:]):
+                raise ValueError(f"{path}:{line_number}: WB, NB ve rE listeleri boş olamaz.")
+            cutters.append(cutter)
+    return cutters
+
+
+def _canonical(cutters):
+    """Kataloğun rc'ye göre sıralı, listeleri sıralı ve tekil demeti."""
+    return tuple(sorted((float(rc), tuple(sorted(set(map(float, widths)))), tuple(sorted(set(map(int, blades)))),
+                         tuple(sorted(set(map(float, radii)))))
+                        for rc, widths, blades, radii in cutters))
+
+
+def catalog_signature(cutters):
+    """Kataloğun kısa özeti (önbellek anahtarında)."""
+    return hashlib.sha1(repr(_canonical(cutters)).encode("ascii")).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=None)
+def default_cutters():
+    """SPREADBLADE_CUTTERS dosyası veya CUTTERS (süreç başına bir kez okunur)."""
+    path = os.environ.get(CUTTER_CATALOG_ENV)
+    return _canonical(read_catalog(path) if path else CUTTERS)
+
+
+@functools.lru_cache(maxsize=None)
+def default_signature():
+    return catalog_signature(default_cutters())
+
+
+class CutterCatalog:
+    """rc'ye göre sıralı kesici kataloğu.
+
+    `radii` kesici yarıçaplarıdır; `limits` (radii[:-1]) seçilen kesicinin
+    değiştiği rc değerleridir. `tables[sütun]` (kesici, değer) dizisidir,
+    boş hücreler NaN'dır.
+    """
+    def __init__(self, cutters, signature=None):
+        cutters = _canonical(cutters)
+        if not cutters:
+            raise ValueError("Kesici kataloğu boş.")
+        self.cutters = cutters
+        self.signature = signature
+        self.radii = np.array([cutter[0] for cutter in cutters])
+        self.limits = self.radii[:-1]
+        # Skaler yol için Python listeleri
+        self._radii = self.radii.tolist()
+        self._rows = {column: [cutter[k] for cutter in cutters] for k, column in enumerate(CATALOG_COLUMNS, 1)}
+        self.tables = {}
+        for column, rows in self._rows.items():
+            table = np.full((len(rows), max(len(row) for row in rows)), np.nan)
+            for k, row in enumerate(rows):
+                table[k, :len(row)] = row
+            self.tables[column] = table
+
+    def __len__(self):
+        return len(self._radii)
+
+    def cutter(self, rc):
+        """Tek bir rc için katalog satırı (rc'yi karşılayan en küçük kesici)."""
+        if not rc <= self._radii[-1]: # NaN da en büyük kesiciye gider
+            return len(self._radii) - 1
+        return bisect.bisect_left(self._radii, rc)
+
+    def cutter_column(self, rc):
+        """rc dizisi için katalog satırları (cutter() ile aynı kural)."""
+        return np.minimum(np.searchsorted(self.radii, rc, side='left'), len(self.radii) - 1)
+
+    def select(self, rc, column, value, strict=False, smallest=False):
+        """Kesicide `value`'yu aşmayan (strict ise ondan küçük) en büyük mevcut değer.
+
+        Uygun değer yoksa NaN (smallest ise kesicinin en küçük değeri) döner.
+        NB tamsayıdır.
+        """
+        row = self._rows[column][self.cutter(rc)]
+        k = 0
+        if value == value: # NaN hiçbir değeri karşılamaz
+            k = bisect.bisect_left(row, value) if strict else bisect.bisect_right(row, value)
+        if k > 0:
+            return row[k - 1]
+        return row[0] if smallest else math.nan
+
+    def select_column(self, rc, column, values, strict=False, smallest=False):
+        """select()'in vektörel sürümü (rc ve values dizileri, float dizi)."""
+        table = self.tables[column][self.cutter_column(rc)]
+        values = np.asarray(values, dtype=float)[:, None]
+        with np.errstate(invalid='ignore'):
+            fits = table < values if strict else table <= values
+        largest = np.where(fits, table, -np.inf).max(axis=1)
+        return np.where(np.isfinite(largest), largest, table[:, 0] if smallest else np.nan)
+
+
+@functools.lru_cache(maxsize=None)
+def _open(cutters):
+    return CutterCatalog(cutters, catalog_signature(cutters))
+
+
+def open_cutter_catalog(cutters=None):
+    """Kataloğu açar (süreç başına bir kez); `cutters` verilmezse default_cutters()."""
+    return _open(default_cutters() if cutters is None else _canonical(cutters))
+
+
+def default_cutter_catalog():
+    """Öğe 50, 78 ve 96'nın kullandığı katalog (varsayılan kesiciler)."""
+    return _open(default_cutters())
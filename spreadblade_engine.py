@@ -0,0 +1,2180 @@
+"""Gleason spread-blade (SD3033C) SB1/SB2/SB3 hesaplama çekirdeği.
+
+Bu modül tkinter ve matplotlib olmadan içe aktarılabilir; arayüz
+(SpreadbladeSUMMARYANDMACHINESETTINGS.py) yalnızca bu motorun ince bir
+istemcisidir. Tek bir tasarım için:
+
+    summary = calculate({"n": 20, "N": 40, ...})
+    summary.get("136", "L")   # S (Radyal Kesici Ayarı)
+"""
+import functools
+import math
+import os
+import sys
+import time
+from array import array
+
+from spreadblade_profile import active_profiler, record_clamp, record_fallback
+
+# --- Güvenli Matematiksel İşlem Fonksiyonları ---
+# Geri dönüşler (sıkıştırma, varsayılan değer) etkin Profiler'a kaydedilir.
+def safe_acos(value):
+    """arccos için alan hatasını önler, değeri [-1, 1] aralığına sıkıştırır."""
+    if -1.0 <= value <= 1.0:
+        return math.acos(value)
+    record_fallback("safe_acos")
+    return math.acos(max(-1.0, min(1.0, value)))
+
+def safe_asin(value):
+    """arcsin için alan hatasını önler, değeri [-1, 1] aralığına sıkıştırır."""
+    if -1.0 <= value <= 1.0:
+        return math.asin(value)
+    record_fallback("safe_asin")
+    return math.asin(max(-1.0, min(1.0, value)))
+
+def safe_sqrt(value):
+    """sqrt için alan hatasını önler, negatif girdiler için 0 döndürür."""
+    if value >= 0.0:
+        return math.sqrt(value)
+    record_fallback("safe_sqrt")
+    return math.sqrt(max(0.0, value))
+
+def safe_log10(value):
+    """log10 için alan hatasını önler, <= 0 girdiler için çok küçük pozitif sayı kullanır."""
+    return math.log10(max(1e-10, value))
+
+def safe_division(numerator, denominator, default=float('inf')):
+    """Sıfıra bölme hatasını önler."""
+    if abs(denominator) < 1e-10:
+        # print(f"Uyarı: Sıfıra bölme denemesi ({numerator}/{denominator}). Varsayılan değer ({default}) döndürülüyor.")
+        record_fallback("safe_division")
+        return default
+    return numerator / denominator
+
+def nan_min(*values):
+    """min(); değerlerden biri NaN ise NaN (Python min() NaN'ı sıraya göre atlar)."""
+    if any(value != value for value in values):
+        return math.nan
+    return min(values)
+
+def clamp_unit(value, item):
+    """max(-1, min(1, value)); aralık dışı (veya NaN) değerler öğe numarasıyla kaydedilir."""
+    if -1.0 <= value <= 1.0:
+        return value
+    record_clamp(item)
+    return max(-1.0, min(1.0, value))
+# --- ---
+
+# Parametre tanımları: (Etiket, değişken adı, varsayılan değer, birim)
+# Dokümandaki referanslara göre isimlendirme
+INPUT_PARAMETERS = [
+    ("Pinyon Diş Sayısı (n)", "n", 20, ""),
+    ("Dişli Diş Sayısı (N)", "N", 40, ""),
+    ("Diametral Pitch (Pd)", "Pd", 5, "1/inç"),
+    ("Basınç Açısı (°)", "phi_deg", 20, "°"),
+    ("Mil Açısı (°)", "shaft_angle_deg", 90, "°"),
+    ("Ort. Spiral Açısı (°)", "psi_deg", 35, "°"),
+    ("Yüz Genişliği (F)", "F", 1.5, "inç"),
+    ("Kesici Yarıçapı (rc)", "rc", 3.5, "inç"),
+    ("Pinyon Addendum (a₀P)", "a0P", 0.170, "inç"), # Örnek değerler güncellendi
+    ("Dişli Addendum (a₀G)", "a0G", 0.230, "inç"), # Örnek değerler güncellendi
+    ("Pinyon Dedendum (b₀P)", "b0P", 0.269, "inç"), # Örnek değerler güncellendi
+    ("Dişli Dedendum (b₀G)", "b0G", 0.209, "inç"), # Örnek değerler güncellendi
+    ("Pinyon Dış Kalınlık (t₀PL)", "t0PL", 0.250, "inç"), # Yaklaşık, hesaplanmalı normalde
+    ("Dişli Dış Kalınlık (t₀G)", "t0G", 0.364, "inç"),   # Yaklaşık, hesaplanmalı normalde
+]
+
+# Varsayılan girdiler (arayüzdeki başlangıç değerleri)
+DEFAULT_INPUTS = {name: default for _, name, default, _ in INPUT_PARAMETERS}
+
+# Kodda sabitlenmiş değerler
+STOCK_ALLOWANCE = 0.020 # Öğe 48 stok payı (PDF sayfa 6)
+K2_MACHINE = 8.75 # Öğe 138 makine sabiti (No. 116, varsayılan makine)
+CF_FINISH = 12.0 # Öğe 81 finiş kesici no (Spiral)
+
+# Atölyedeki makineler: (ad, K2 eksantrik sabiti, eksantrik açı β sınırları (°), kızak açısı kuralı).
+# Kızak açısı kuralı, makinenin kızak ayarını veren öğedir: "137" Q = 360°-q (sol) / q (sağ),
+# "142" Q = 270°+β/2∓q, "144" Q = 360°-(142). Öğe 138-144 seçilen makineyle hesaplanır;
+# bir tasarımın tüm makinelerdeki uygunluğu ve ayarları spreadblade_machines'tedir.
+# SPREADBLADE_MACHINES ortam değişkeni bir dosyayı gösterirse kayıtları bu listeye
+# eklenir (aynı adlı kayıtların yerine geçer); bkz. default_machines().
+MACHINE_CATALOG_ENV = "SPREADBLADE_MACHINES"
+MACHINES = [
+    ("No. 116", K2_MACHINE, (0.0, 180.0), "137"),
+    ("No. 16", 6.000, (0.0, 175.0), "142"),
+    ("No. 26", 7.000, (0.0, 175.0), "142"),
+    ("No. 106", 4.500, (0.0, 170.0), "144"),
+    ("No. 463", 10.250, (0.0, 180.0), "137"),
+]
+DEFAULT_MACHINE = "No. 116"
+CRADLE_CONVENTIONS = ("137", "142", "144")
+
+# Formüller veya tablolar değiştiğinde artırılır; önbellekteki eski sonuçlar geçersiz olur
+FORMULA_VERSION = 5
+
+# PDF Sayfa 16 ve metin açıklamalarına göre liste
+# ("Öğe No", "Formül/Sembol", "Açıklama") - 4. eleman (birim) kaldırıldı
+SB1_ITEMS = [
+    ("1", "n ; N", "Diş Sayısı (Pinyon ; Dişli)"),
+    ("2", "Pd ; p", "Diametral Pitch ; Dairesel Pitch"),
+    ("3", "d ; D", "Pitch Çapları"),
+    ("4", "F ; F/2", "Yüz Genişliği ; Yarım Yüz Genişliği"),
+    ("5", "A₀", "Dış Koni Mesafesi"),
+    ("6", "A", "Ortalama Koni Mesafesi (Am)"),
+    ("7", "Ai", "İç Koni Mesafesi"),
+    ("8", "rc", "Kesici Yarıçapı"),
+    ("9", "φ", "Normal Basınç Açısı"),
+    ("10", "sin φ", "sin(Basınç Açısı)"),
+    ("11", "cos φ", "cos(Basınç Açısı)"),
+    ("12", "tan φ", "tan(Basınç Açısı)"),
+    ("13", "ψ", "Ortalama Spiral Açısı"),
+    ("14", "sin ψ", "sin(Spiral Açısı)"),
+    ("15", "cos ψ", "cos(Spiral Açısı)"),
+    ("16", "tan ψ", "tan(Spiral Açısı)"),
+    ("17", "γ ; Γ", "Pitch Açıları (Pinyon ; Dişli)"),
+    ("18", "sin γ ; sin Γ", "sin(Pitch Açıları)"),
+    ("19", "cos γ ; cos Γ", "cos(Pitch Açıları)"),
+    ("20", "tan γ ; tan Γ", "tan(Pitch Açıları)"),
+    ("21", "a₀P ; a₀G", "Dış Addendumlar"),
+    ("22", "b₀P ; b₀G", "Dış Dedendumlar"),
+    ("23", "δp ; δG", "Dedendum Açıları"),
+    ("24", "cos δp ; cos δG", "cos(Dedendum Açıları)"),
+    ("25", "tan δp ; tan δG", "tan(Dedendum Açıları)"),
+    ("26", "t₀PL ; t₀G", "Dış Çevresel Kalınlıklar"),
+    ("27", "2(8)(14)-(6)", "Hesaplama: 2*rc*sin(ψ)-A0"),
+    ("28", "(6)(27)/(5)+(5)", "Hesaplama: Öğe27+A0"), # Düzeltilmiş formül
+    ("29", "(6)(27)/(7)+(7)", "Hesaplama: (A0*Öğe27)/Ai + Ai"), # Düzeltilmiş formül
+    ("30", "sin Ψo = (28)/2(8)", "sin(Dış Spiral Açısı)"),
+    ("31", "Ψo", "Dış Spiral Açısı"),
+    ("32", "cos Ψo", "cos(Dış Spiral Açısı)"), # 35 gibi; Öğe 45'te kullanılıyor
+    ("33", "sin Ψi = (29)/2(8)", "sin(İç Spiral Açısı)"),
+    ("34", "Ψi", "İç Spiral Açısı"),
+    ("35", "cos Ψi", "cos(İç Spiral Açısı)"), # PDF'te 35 yok ama 46'da kullanılıyor
+    ("36", "Bmin ; Bmax", "Min/Max Boşluk (Backlash)"),
+    ("37", "b = (22)-(4)R(25)", "Ortalama Dedendum (b)"),
+    ("38", "bi = (37)-(4)R(25)", "İç Dedendum (bi)"),
+    ("39", "(22)L+(22)R", "Dış Dedendum Toplamı"), # PDF'te 39 = b0P+b0G
+    ("40", "(38)L+(38)R", "İç Dedendum Toplamı"),
+    ("41", "(6)(26)L / (5)", "Pinyon Dış Kalınlığı (t₀PL)"), # Düzeltilmiş formül
+    ("42", "(7)(2)R / (5)", "Hesaplama: (Ai*p)/A0"), # Düzeltilmiş formül
+    ("43", "WG'=(15)(41)-2(12)(37)R", "Teorik Dişli Nokta Genişliği"),
+    ("44", "WG ; WRG", "Dişli Finiş; Kaba Nokta Genişliği"),
+    ("45", "Wop=(2)R(32)-2(12)(39)-(44)L", "Pinyon Dış Limit Nokta Gen."),
+    ("46", "Wip=(42)(35)-2(12)(40)-(44)L", "Pinyon İç Limit Nokta Gen."),
+    ("47", "WLP=min((45),(46))", "Pinyon Limit Nokta Genişliği"),
+    ("48", "WRP=(47)-Stok Payı", "Pinyon Kaba Nokta Genişliği"),
+]
+
+# PDF Sayfa 17 ve metin açıklamalarına göre liste
+SB2_ITEMS = [
+    ("49", "WMP=max((45),(46))", "Maks Pinyon Yuva Genişliği"),
+    ("50", "WB", "Bıçak Ucu Genişliği (Kesici Kataloğu)"),
+    ("51", "(15)^2", "Hesaplama: cos(ψ)^2"), # Düzeltilmiş formül
+    ("52", "1-(10)", "Hesaplama: 1-sin(φ)"),
+    ("53", "(52)/(11)", "Hesaplama: Öğe52/cos(φ)"),
+    ("54", "(7)(36)R/(5)", "Hesaplama: (Ai*Bmax)/A0"),
+    ("55", "0.5(54)/(12)", "Hesaplama: 0.5*Öğe54/tan(φ)"),
+    ("56", "c", "İç Boşluk (Clearance)"),
+    ("57", "Ri=(7)(20)/(51)", "Hesaplama: (Ai*tan(Γ))/cos(ψ)^2"), # Pinyon için Sol Sütun
+    ("58", "ai=(38)-(56)", "İç Addendum (bi-c)"), # (58a olarak belirtilmiş)
+    ("59", "(1)/(19)", "Sanal Diş Sayısı Terimi (n/cosγ)"),
+    ("60", "(59)L+(59)R", "Sanal Diş Sayısı Terimi Toplamı"),
+    ("61", "Δa=(55)(59)/(60)", "Addendum Değişimi"),
+    ("62", "(57)R ; (57)L", "Referans: Öğe 57 Değerleri"),
+    ("63", "(61)R ; (61)L", "Referans: Öğe 61 Değerleri"),
+    ("64", "a1=(58)+(63)", "Düzeltilmiş İç Addendum"),
+    ("65", "R1=(62)-(63)", "Düzeltilmiş Ri"),
+    ("66", "R1/a1=(65)/(64)", "Oran: R1/a1"),
+    ("67", "K1", "Faktör (Grafik No. 1)"),
+    ("68", "ro=(64)(67)", "Taban Kenar Yarıçapı"),
+    ("69", "Δr=((56)-(55))/(52)", "Kenar Yarıçapı Artışı"),
+    ("70", "r1=(68)+(69)", "Maks Yarıçap (Fillet)"),
+    ("71", "r2=((50)-0.015)/(53)", "Maks Yarıçap (Taşlama)"),
+    ("72", "(47)-(50)L", "Hesaplama: WLP - WB_Pinyon"),
+    ("73", "(53)(72)+0.001", "Hesaplama: Öğe53*Öğe72+0.001"),
+    ("74", "√(75)", "Hesaplama: sqrt(Öğe75)"), # Düzeltilmiş formül
+    ("75", "(73)+0.002", "Hesaplama: Öğe73+0.002"),
+    ("76", "(73)^2", "Hesaplama: Öğe73^2"), # Düzeltilmiş formül
+    ("77", "r3=(0.063(74)+(75))/(76)", "Maks Yarıçap (Bozulma)"),
+    ("78", "rE=min((70),(71),(77))", "Kesici Kenar Yarıçapı (Kesici Kataloğu)"),
+    ("79", "#c'=(14)(23)/10.0", "Teorik Kesici No"),
+    ("80", "#CR", "Kaba İşleme Kesici No"),
+    ("81", "#CF", "Finiş Kesici No"),
+    ("82", "ht", "Tam Diş Derinliği"),
+    ("83", "(8)/(15)", "Hesaplama: rc/cos(ψ)"),
+    ("84", "(6)-(8)(14)", "Hesaplama: A0-rc*sin(ψ)"),
+    ("85", "(83)^2+(84)^2", "Hesaplama: Öğe83^2+Öğe84^2"),
+    ("86", "√(85)", "Hesaplama: sqrt(Öğe85)"),
+    ("87", "(38)L+(58)R ; (82)", "Derinlik Terimi ; Tam Derinlik"),
+    ("88", "0.5(44)L+(12)(87)", "Hesaplama: 0.5*WG+tan(φ)*Öğe87"),
+    ("89", "(8)±(88)", "Hesaplama: rc±Öğe88"),
+    ("90", "(7) ; (5)", "Referans: Ai ; A0"),
+    ("91", "(86)(89)/0.5", "Hesaplama: Öğe86*Öğe89/0.5"),
+    ("92", "cosθ=((90)^2-(89)^2-(85))/(91)", "cos(Kesici Açısal Konum)"),
+    ("93", "θ", "Kesici Açısal Konum"),
+    ("94", "Δθ=(93)L-(93)R-1°", "Açı Farkı"),
+    ("95", "Nb'=360°/(94)", "Maks Bıçak Sayısı"),
+    ("96", "NB", "Gerçek Bıçak Sayısı (< Öğe 95)"),
+]
+
+# PDF Sayfa 18 ve metin açıklamalarına göre liste
+SB3_ITEMS = [
+    ("97", "((12)(22)R+(44)L)/0.5", "Hesaplama: (tan(φ)*b0G+WG)/0.5"),
+    ("98", "(2)R(32)-(97)", "Hesaplama: p*Ψo-Öğe97"), # Formül belirsiz
+    ("99", "((30)(97)±(30)(98))/2.0", "Hesaplama (Pinyon/Dişli)"), # +/- sırası önemli
+    ("100", "ΔA", "Kalınlık Ölçüm Noktası Değişimi"),
+    ("101", "max((99),(100))", "Maks(Öğe99, Öğe100)"),
+    ("102", "(5)-(101)", "Hesaplama: A0-Öğe101"),
+    ("103", "(101)(25)R", "Hesaplama: Öğe101*tan(δG)"),
+    ("104", "(101)(25)M", "Hesaplama: Öğe101*tan(δp)"),
+    ("105", "((22)R-(103))/0.5", "Hesaplama: (b0G-Öğe103)/0.5"),
+    ("106", "((12)(105)+(44)L)/0.5", "Hesaplama: (tan(φ)*Öğe105+WG)/0.5"),
+    ("107", "(97); (98)", "Referans: Öğe 97, 98"),
+    ("108", "(21)-(104)", "Hesaplama: a0P-Öğe104"),
+    ("109", "(6)(27)+(102)", "Hesaplama: A0*Öğe27+Öğe102"),
+    ("110", "sinΦM=(109)/2(8)", "sin(Modifiye Basınç Açısı)"),
+    ("111", "ΦM", "Modifiye Basınç Açısı"),
+    ("112", "cosΦM", "cos(Modifiye Basınç Açısı)"),
+    ("113", "(2)R(112)R", "Hesaplama: p*cos(ΦM)_Dişli"), # Formül belirsiz
+    ("114", "(113)(102)R/(5)", "Hesaplama: Öğe113*Öğe102_Dişli/A0"),
+    ("115", "tM=(106)L-(36)L;(114)-(106)R", "Ölçüm Kalınlığı (Min ; Max)"),
+    ("116", "(112)^2/4.0", "Hesaplama: cos(ΦM)^2/4.0"),
+    ("117", "(3)(102)/(5)", "Hesaplama: d*Öğe102/A0"),
+    ("118", "(115)^2/(117)", "Hesaplama: tM^2/Öğe117"),
+    ("119", "(19)(118)", "Hesaplama: cos(γ)*Öğe118"),
+    ("120", "aM=(108)+(116)(119)", "Ölçüm Addendumu"),
+    ("121", "F*Pd=(2)L(4)L", "Yüz Genişliği x Pitch"),
+    ("122", "mF", "Yüzey Kavrama Oranı (Grafik 2)"),
+    ("123", "XB=(5)(25)-(22)", "Kaydırma Tabanı (Pinyon)"),
+    ("124", "V=(8)(15)", "Dikey Kesici Ayarı"),
+    ("125", "H=(6)-(8)(14)", "Yatay Kesici Ayarı"),
+    ("126", "ctn q=(125)/(124)", "cot(Kesici Açısal Konum q)"),
+    ("127", "q", "Kesici Açısal Konum q"),
+    ("128", "sin q", "sin(Kesici Açısal Konum q)"),
+    ("129", "Ra=(24)/(18)", "Rulo Oranı (Pinyon)"),
+    ("130", "(1)(129)/150.0", "Oran Dişlisi Ondalık Oran (150 d.)"),
+    ("131", "m75=2(130)", "Ondalık Oran (Nc/75)"),
+    ("132", "Nc/75", "Oran Dişlileri (Nc/75)"),
+    ("133", "m50=3(130)", "Ondalık Oran (Nc/50)"),
+    ("134", "Nc/50", "Oran Dişlileri (Nc/50)"),
+    ("135", "", "Kızak-İş Parçası Test Rulosu"),
+    ("136", "S=(124)/(128)", "Radyal Kesici Ayarı"),
+    ("137", "Q=360°-(127)L.H.;(127)R.H.", "Kızak Açısı Ayarı"),
+    ("138", "K2", "Makine Sabiti (Eksantrik)"),
+    ("139", "sin(β/2)=(136)/(2(138))", "sin(Yarım Eksantrik Açı)"),
+    ("140", "β/2", "Yarım Eksantrik Açı"),
+    ("141", "β=2(140)", "Eksantrik Açı"),
+    ("142", "Q=270°+(140)∓(127)", "Kızak Açısı (Alternatif Makine)"),
+    ("143", "√( (138)^2-(136)^2 )", "Hesaplama: sqrt(K2^2-S^2)"),
+    ("144", "Q=360°-(142)", "Kızak Açısı (Alternatif Makine)"),
+]
+
+# Tüm öğelerin sırası ve metin (sayısal olmayan) değerli öğeler
+ALL_ITEMS = SB1_ITEMS + SB2_ITEMS + SB3_ITEMS
+TEXT_ITEMS = ("80", "89", "107", "132", "134", "135")
+
+# Sabit öğe şeması: Öğe 1-144 x {L, R} -> ItemResults.data indeksi
+ITEM_COUNT = 144
+ITEM_KEYS = tuple(f"{number}{side}" for number in range(1, ITEM_COUNT + 1) for side in ("L", "R"))
+ITEM_INDEX = {key: i for i, key in enumerate(ITEM_KEYS)}
+
+# Tablo gösterimi için ondalık basamaklar (belirtilmeyenler 4)
+PRECISION = {
+    '1L': 0, '1R': 0, '96L': 0, '96R': 0, '81L': 1, '81R': 1,
+    '9L': 2, '13L': 2,
+}
+for _item in ("17", "23", "31", "34", "93", "94", "111", "127", "137", "140", "141", "142", "144"):
+    PRECISION[_item + "L"] = PRECISION[_item + "R"] = 2
+
+
+class CalculationError(Exception):
+    """Bir hesaplama aşaması başarısız olduğunda fırlatılır.
+
+    `title` arayüzdeki hata penceresi başlığı, `message` ise açıklamadır.
+    """
+    def __init__(self, title, message):
+        super().__init__(f"{title}: {message}")
+        self.title = title
+        self.message = message
+
+
+def format_value(value, precision=4):
+    """Bir sonucu tablo gösterimi için metne çevirir."""
+    if isinstance(value, (int, float)):
+        if math.isnan(value) or math.isinf(value):
+            return str(value)
+        return f"{value:.{precision}f}"
+    return str(value)
+
+
+class ItemResults:
+    """Öğe 1-144 x {L, R} sonuçlarının sıkı gösterimi.
+
+    Sayısal öğeler ITEM_KEYS sırasıyla bir float64 dizisinde (`data`),
+    metin öğeleri (TEXT_ITEMS) `text` sözlüğünde tutulur; `present` hangi
+    sayısal öğelerin hesaplandığını gösterir. Okuma ve yazma "47L" gibi
+    anahtarlarla sözlük gibi yapılır.
+    """
+    __slots__ = ("data", "present", "text")
+
+    def __init__(self, items=None):
+        self.data = array('d', bytes(8 * len(ITEM_KEYS)))
+        self.present = bytearray(len(ITEM_KEYS))
+        self.text = {}
+        if items:
+            self.update(items)
+
+    def __setitem__(self, key, value):
+        i = ITEM_INDEX[key]
+        if isinstance(value, str):
+            self.text[key] = value
+        else:
+            self.data[i] = value
+            self.present[i] = 1
+
+    def __getitem__(self, key):
+        i = ITEM_INDEX[key]
+        if self.present[i]:
+            return self.data[i]
+        return self.text[key]
+
+    def get(self, key, default=None):
+        i = ITEM_INDEX.get(key)
+        if i is None:
+            return default
+        if self.present[i]:
+            return self.data[i]
+        return self.text.get(key, default)
+
+    def __contains__(self, key):
+        i = ITEM_INDEX.get(key)
+        return i is not None and (self.present[i] == 1 or key in self.text)
+
+    def __iter__(self):
+        text = self.text
+        return (key for i, key in enumerate(ITEM_KEYS) if self.present[i] or key in text)
+
+    def __len__(self):
+        return sum(self.present) + len(self.text)
+
+    def keys(self):
+        return list(self)
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def update(self, items):
+        for key, value in dict(items).items():
+            self[key] = value
+
+    def clear(self):
+        self.data = array('d', bytes(8 * len(ITEM_KEYS)))
+        self.present = bytearray(len(ITEM_KEYS))
+        self.text.clear()
+
+    def copy(self):
+        result = ItemResults()
+        result.data = array('d', self.data)
+        result.present = bytearray(self.present)
+        result.text = dict(self.text)
+        return result
+
+
+class SBSummary:
+    """SB1/SB2/SB3 özetinin (öğe 1-144, L ve R sütunları) sonucu.
+
+    Ondalık basamaklar öğeye göre sabittir (PRECISION).
+    """
+    __slots__ = ("items", "values", "warnings")
+    precision = PRECISION # "47L" -> ondalık basamak
+
+    def __init__(self, items, values, warnings=()):
+        self.items = items if isinstance(items, ItemResults) else ItemResults(items) # "47L" -> değer
+        self.values = values # Ara değerler ('A0', 'WG', 'S', ...)
+        self.warnings = list(warnings)
+
+    def get(self, item, side, default=None):
+        """Öğe değerini döndürür (ör. get("136", "L"))."""
+        return self.items.get(f"{item}{side}", default)
+
+    def format(self, item, side):
+        """Öğe değerini arayüzdeki gibi biçimlendirir; değer yoksa "-"."""
+        key = f"{item}{side}"
+        if key not in self.items:
+            return "-"
+        return format_value(self.items[key], self.precision.get(key, 4))
+
+    def as_dict(self):
+        """{"47": {"L": ..., "R": ...}, ...} biçiminde sözlük döndürür."""
+        result = {}
+        for item_num, _, _ in ALL_ITEMS:
+            result[item_num] = {side: self.items.get(f"{item_num}{side}") for side in ("L", "R")}
+        return result
+
+
+CLEARANCE_WARNING = "Uyarı: Hesaplanan boşluk (clearance) negatif. Add/Ded değerlerini kontrol edin."
+ECCENTRIC_WARNING = ("Uyarı: Radyal ayar (S) seçilen makinenin eksantrik sınırları dışında; "
+                     "Öğe 139-144 bu makinede kesilemez (bkz. Makine seçimi).")
+BLADE_WIDTH_WARNING = ("Uyarı: Kesici kataloğunda gereken genişliği aşmayan bıçak ucu yok; "
+                       "Öğe 50 (WB) boş bırakıldı.")
+EDGE_RADIUS_WARNING = ("Uyarı: Kesici kataloğunda min(r1, r2, r3)'ü aşmayan kenar yarıçapı yok; "
+                       "Öğe 78 (rE) boş bırakıldı, tasarım bu kesiciyle kesilemez.")
+# Uyarıların gösterim sırası
+WARNINGS = (CLEARANCE_WARNING, BLADE_WIDTH_WARNING, EDGE_RADIUS_WARNING, ECCENTRIC_WARNING)
+
+
+def read_machines(path):
+    """Makine dosyasını MACHINES biçiminde okur.
+
+    Her satır "ad ; K2 ; β alt sınırı β üst sınırı ; kızak açısı kuralı"
+    içerir (ör. "No. 118 ; 9.5 ; 0 175 ; 142"); "#" sonrası yok sayılır.
+    Hatalı satırlarda ValueError fırlatılır.
+    """
+    machines = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            fields = [field.strip() for field in line.split("#", 1)[0].split(";")]
+            if not fields[0] and len(fields) == 1:
+                continue
+            try:
+                if len(fields) != 4 or not fields[0]:
+                    raise ValueError
+                beta_min, beta_max = map(float, fields[2].replace(",", " ").split())
+                machine = (fields[0], float(fields[1]), (beta_min, beta_max), fields[3])
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: 'ad ; K2 ; β sınırları ; kural' bekleniyordu: "
+                                 f"{line.strip()}") from None
+            K2 = machine[1]
+            if not (0.0 < K2 < math.inf and 0.0 <= beta_min <= beta_max <= 360.0):
+                raise ValueError(f"{path}:{line_number}: K2 pozitif, β sınırları 0-360° aralığında ve artan olmalıdır.")
+            if machine[3] not in CRADLE_CONVENTIONS:
+                raise ValueError(f"{path}:{line_number}: kızak açısı kuralı {', '.join(CRADLE_CONVENTIONS)} "
+                                 f"olmalıdır: {machine[3]}")
+            machines.append(machine)
+    return machines
+
+
+@functools.lru_cache(maxsize=None)
+def default_machines():
+    """MACHINES ve SPREADBLADE_MACHINES dosyasının kayıtları (süreç başına bir kez okunur).
+
+    Dosyadaki bir makine MACHINES'teki aynı adlı kaydın yerine geçer, yeni
+    adlar katalog sırasının sonuna eklenir; böylece DEFAULT_MACHINE her
+    zaman bulunur.
+    """
+    path = os.environ.get(MACHINE_CATALOG_ENV)
+    machines = {name: (name, K2, limits, rule) for name, K2, limits, rule in MACHINES}
+    for machine in read_machines(path) if path else ():
+        machines[machine[0]] = machine
+    return tuple(machines.values())
+
+
+def machine_names():
+    """Katalogdaki makine adları (default_machines() sırasıyla)."""
+    return [name for name, _, _, _ in default_machines()]
+
+
+def find_machine(name):
+    """default_machines()'teki makine kaydı; bilinmeyen adlarda KeyError."""
+    for machine in default_machines():
+        if machine[0] == name:
+            return machine
+    raise KeyError(f"Bilinmeyen makine: {name}")
+_MISSING = object()
+
+
+def step(reads, writes):
+    """Bir hesaplama adımının okuduğu ve yazdığı anahtarları bildirir.
+
+    Anahtarlar girdi adları, ara değerler ('A0', 'WG', ...) ve "27L" gibi
+    öğe anahtarlarıdır.
+    """
+    def decorate(func):
+        func.reads = frozenset(reads)
+        func.writes = tuple(writes)
+        func.slots = tuple((key, ITEM_INDEX.get(key)) for key in writes) # ara değerler için None
+        return func
+    return decorate
+
+
+def _error_location():
+    """İşlenmekte olan istisnanın oluştuğu dosya ve satır."""
+    exc_tb = sys.exc_info()[2]
+    if exc_tb is None:
+        return 'N/A', 'N/A'
+    while exc_tb.tb_next is not None: # Hatanın oluştuğu adıma in
+        exc_tb = exc_tb.tb_next
+    return exc_tb.tb_frame.f_code.co_filename, exc_tb.tb_lineno
+
+
+class SpreadBladeEngine:
+    """Tkinter gerektirmeyen SB hesaplayıcısı.
+
+    Hatalar mesaj kutusu yerine CalculationError olarak bildirilir.
+    `cache` verilirse (ör. spreadblade_cache.ResultCache) aynı girdilerin
+    sonuçları yeniden hesaplanmadan önbellekten alınır. Öğe 138-144
+    `machine` (default_machines()'teki ad) ile hesaplanır.
+
+    Hesaplama @step ile işaretlenmiş adımlardan oluşur (bkz. STEPS); tam
+    bir hesaplamadan sonra update() yalnızca değişen girdilerden etkilenen
+    adımları yeniden çalıştırır.
+    """
+    precision = PRECISION
+
+    def __init__(self, cache=None, machine=DEFAULT_MACHINE):
+        self.machine = find_machine(machine)
+        self.values = {}
+        self.items = ItemResults()
+        self.warnings = []
+        self.cache = cache
+        self.inputs = {}
+        self.complete = False # Son hesaplama hatasız tamamlandı mı
+        self.sampler = None # Bu hesaplamanın aşama ve adım sürelerini ölçen Profiler
+
+    def reset(self):
+        """Önceki hesaplamanın tüm değerlerini temizler."""
+        self.values.clear()
+        self.items.clear()
+        self.warnings.clear()
+        self.complete = False
+
+    def set_warning(self, warning, active):
+        """Uyarıyı ekler veya (artımlı hesapta) kaldırır; sıra WARNINGS'teki gibidir."""
+        if warning in self.warnings:
+            self.warnings.remove(warning)
+        if active:
+            self.warnings.append(warning)
+            self.warnings.sort(key=WARNINGS.index)
+
+    def set_value(self, item_key_base, suffix, value):
+        """Hesaplanan öğe değerini (L veya R) saklar."""
+        item_key = item_key_base + suffix
+        i = ITEM_INDEX[item_key]
+        items = self.items
+        if value.__class__ is str:
+            items.text[item_key] = value
+        else:
+            items.data[i] = value
+            items.present[i] = 1
+
+    def get_value(self, item_key_base, suffix=None):
+        """Hesaplanan bir değeri alır.
+
+        Suffix verilirse öğe değeri ("27", "L"), verilmezse ara değer veya
+        girdi ('A0', 'rc', ...) aranır.
+        """
+        if suffix:
+            key = item_key_base + suffix
+        else:
+            value = self.values.get(item_key_base, _MISSING)
+            if value is not _MISSING:
+                return value
+            key = item_key_base # "27L" gibi tam öğe anahtarı olabilir
+        i = ITEM_INDEX.get(key)
+        if i is not None:
+            items = self.items
+            if items.present[i]:
+                return items.data[i]
+            if key in items.text:
+                return items.text[key]
+        raise KeyError(f"Gerekli değer '{item_key_base}' (suffix: {suffix}) hesaplanmadı.")
+
+    def _peek(self, slots):
+        """Bir adımın yazdığı öğe ve ara değerler (yoksa _MISSING)."""
+        values, items = self.values, self.items
+        data, present, text = items.data, items.present, items.text
+        return [values.get(key, _MISSING) if i is None else data[i] if present[i] else text.get(key, _MISSING)
+                for key, i in slots]
+
+    def summary(self):
+        """Şu ana kadar hesaplanan değerlerden bir SBSummary oluşturur."""
+        return SBSummary(self.items.copy(), dict(self.values), self.warnings)
+
+    def calculate_all(self, inputs):
+        """Tüm hesaplamaları sırayla yapar ve SBSummary döndürür.
+
+        Hata durumunda CalculationError fırlatılır; o ana kadar hesaplanan
+        öğeler self.summary() ile alınabilir. Profiler etkinse hesaplama
+        sayılır; örneklenen hesaplamalarda toplam, aşama ve adım süreleri
+        kaydedilir.
+        """
+        profiler = active_profiler()
+        if profiler is None or not profiler.start_calculation():
+            return self._calculate_all(inputs)
+        self.sampler = profiler
+        start = time.perf_counter()
+        try:
+            return self._calculate_all(inputs)
+        finally:
+            profiler.add_stage("engine", time.perf_counter() - start, sampled=True)
+            self.sampler = None
+
+    def _calculate_all(self, inputs):
+        self.reset() # Önceki değerleri temizle
+        self.inputs = dict(inputs)
+        key = self.cache_key(inputs)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None: # calculate_sb1-sb3 atlanır
+                self.load(cached)
+                return self.summary()
+        # 1. Girişleri al ve temel değerleri hesapla
+        self.process_inputs(inputs)
+        # 2. SB1 Hesaplamalarını yap
+        self.calculate_sb1()
+        # 3. SB2 Hesaplamalarını yap
+        self.calculate_sb2()
+        # 4. SB3 Hesaplamalarını yap
+        self.calculate_sb3()
+        self.complete = True
+        summary = self.summary()
+        if key is not None:
+            self.cache.put(key, summary)
+        return summary
+
+    def update(self, changes):
+        """Bazı girdiler değiştiğinde yalnızca etkilenen adımları yeniden hesaplar.
+
+        `changes` girdi adı -> yeni değer sözlüğüdür. Değeri gerçekten değişen
+        öğe anahtarlarının ("67L" gibi) kümesi döndürülür; örneğin yalnızca rc
+        değiştiğinde Öğe 1-26'dan sadece Öğe 8 yeniden hesaplanır. Motor henüz
+        hatasız bir hesaplama yapmamışsa calculate_all çalışır ve tüm öğeler
+        döndürülür. Hata durumunda CalculationError fırlatılır. Profiler
+        etkinse süre "engine_update" aşamasına kaydedilir.
+        """
+        profiler = active_profiler()
+        if profiler is None:
+            return self._update(changes)
+        start = time.perf_counter()
+        try:
+            return self._update(changes)
+        finally:
+            profiler.add_stage("engine_update", time.perf_counter() - start)
+
+    def _update(self, changes):
+        inputs = {**self.inputs, **changes}
+        if not self.complete:
+            self.calculate_all(inputs)
+            return set(self.items)
+        dirty, changed = set(), set()
+        self.complete = False # Yarıda kalırsa sonraki çağrı tam hesaplama yapar
+        self.inputs = inputs
+        self.process_inputs(inputs, dirty, changed)
+        self.calculate_sb1(dirty, changed)
+        self.calculate_sb2(dirty, changed)
+        self.calculate_sb3(dirty, changed)
+        self.complete = True
+        return changed
+
+    def cache_key(self, inputs):
+        """Önbellek anahtarı; önbellek yoksa veya girdiler geçersizse None.
+
+        Geçersiz girdilerin hatası process_inputs tarafından bildirilir.
+        """
+        if self.cache is None:
+            return None
+        from spreadblade_cache import cache_key
+        try:
+            return cache_key(inputs, self.machine[0])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def load(self, summary):
+        """Bir SBSummary'yi motorun durumuna yükler."""
+        self.items = summary.items.copy()
+        self.values.update(summary.values)
+        self.warnings.extend(summary.warnings)
+        self.complete = True
+
+    def process_inputs(self, inputs, dirty=None, changed=None):
+        """Girdi değerlerini alır, doğrular ve temel değişkenleri self.values'a ekler.
+
+        `inputs` INPUT_PARAMETERS'taki 14 değişken adını içeren bir sözlüktür;
+        değerler sayı veya sayıya çevrilebilir metin olabilir. `dirty` verilirse
+        (bkz. update) yalnızca değişen girdilerden etkilenen adımlar çalışır.
+        """
+        try:
+            # Girişleri al
+            inputs = {k: float(v) for k, v in inputs.items()}
+
+            # Girdileri doğrula (sıra spreadblade_batch hata kodlarıyla aynı)
+            if not all(map(math.isfinite, inputs.values())):
+                raise ValueError("Girdiler sonlu sayılar olmalıdır.")
+            if inputs['Pd'] <= 0 or inputs['F'] <= 0 or inputs['rc'] <= 0 or inputs['n'] <= 0 or inputs['N'] <= 0:
+                raise ValueError("Pitch, Yüz Genişliği, Kesici Yarıçapı ve Diş Sayıları pozitif olmalıdır.")
+            if inputs['a0P'] < 0 or inputs['a0G'] < 0 or inputs['b0P'] < 0 or inputs['b0G'] < 0:
+                 raise ValueError("Addendum ve Dedendum değerleri negatif olamaz.")
+
+            if dirty is not None:
+                dirty.update(k for k, v in inputs.items() if self.values.get(k) != v)
+            # Temel değerleri self.values'a ata
+            self.values.update(inputs) # Float değerleri ekle
+            # Diğer temel hesaplamalar (SB1 öncesi)
+            self.run_steps(INPUT_STEPS, dirty, changed)
+
+        except (ValueError, TypeError) as e:
+            raise CalculationError("Giriş Hatası", f"Geçersiz giriş değeri: {e}") from e
+        except Exception as e:
+            raise CalculationError("Giriş İşleme Hatası", f"Girdiler işlenirken hata: {e}") from e
+
+    def run_steps(self, steps, dirty=None, changed=None):
+        """Adımları sırayla çalıştırır.
+
+        `dirty` None ise tüm adımlar çalışır. Aksi halde yalnızca okuduğu
+        anahtarlardan biri `dirty` içinde olan adımlar çalışır; değeri
+        gerçekten değişen anahtarlar `dirty`ye, değişen öğeler `changed`e
+        eklenir. Hesaplama örnekleniyorsa (self.sampler) aşamanın ve her
+        adımın süresi kaydedilir.
+        """
+        if dirty is None:
+            if self.sampler is not None:
+                self._run_sampled(steps)
+                return
+            for func in steps:
+                func(self)
+            return
+        for func in steps:
+            if func.reads.isdisjoint(dirty):
+                continue
+            before = self._peek(func.slots)
+            func(self)
+            for (key, i), old, new in zip(func.slots, before, self._peek(func.slots)):
+                if new != old:
+                    dirty.add(key)
+                    if i is not None:
+                        changed.add(key)
+
+    def _run_sampled(self, steps):
+        stage, names = STAGE_NAMES.get(id(steps)) or ("engine;steps", step_names(steps))
+        clock = time.perf_counter
+        stamps = [clock()]
+        append = stamps.append
+        try:
+            for func in steps:
+                func(self)
+                append(clock())
+        finally:
+            self.sampler.add_steps(stage, names, stamps)
+
+    # --- Temel değerler (process_inputs) ---
+    @step(reads=('phi_deg',), writes=('phi', 'sin_phi', 'cos_phi', 'tan_phi'))
+    def _pressure_angle(self):
+        self.values['phi'] = math.radians(self.get_value('phi_deg'))
+        self.values['sin_phi'] = math.sin(self.get_value('phi'))
+        self.values['cos_phi'] = math.cos(self.get_value('phi'))
+        self.values['tan_phi'] = math.tan(self.get_value('phi'))
+
+    @step(reads=('psi_deg',), writes=('psi', 'sin_psi', 'cos_psi', 'tan_psi'))
+    def _spiral_angle(self):
+        self.values['psi'] = math.radians(self.get_value('psi_deg'))
+        self.values['sin_psi'] = math.sin(self.get_value('psi'))
+        self.values['cos_psi'] = math.cos(self.get_value('psi'))
+        self.values['tan_psi'] = math.tan(self.get_value('psi'))
+
+    @step(reads=('Pd', 'n', 'N'), writes=('p', 'd', 'D'))
+    def _pitch(self):
+        self.values['p'] = math.pi / self.get_value('Pd')
+        self.values['d'] = self.get_value('n') / self.get_value('Pd')
+        self.values['D'] = self.get_value('N') / self.get_value('Pd')
+
+    @step(reads=('shaft_angle_deg', 'n', 'N'),
+          writes=('shaft_angle', 'gamma_p', 'Gamma_G', 'sin_gamma_p', 'cos_gamma_p', 'tan_gamma_p',
+                  'sin_Gamma_G', 'cos_Gamma_G', 'tan_Gamma_G'))
+    def _pitch_angles(self):
+        # Pitch Açıları (γ, Γ)
+        self.values['shaft_angle'] = math.radians(self.get_value('shaft_angle_deg'))
+        n = self.get_value('n')
+        N = self.get_value('N')
+        shaft_angle = self.get_value('shaft_angle')
+        if abs(shaft_angle - math.pi/2) < 1e-6: # 90 derece durumu
+            tan_gamma_p = n / N
+        else: # Genel durum
+             cos_shaft = math.cos(shaft_angle)
+             sin_shaft = math.sin(shaft_angle)
+             ratio_N_n = N / n
+             tan_gamma_p = safe_division(sin_shaft, (ratio_N_n + cos_shaft))
+             if math.isinf(tan_gamma_p): raise ValueError("Pitch açısı (gamma_p) hesaplanamadı (sıfıra bölme).")
+        self.values['gamma_p'] = math.atan(tan_gamma_p)
+        self.values['Gamma_G'] = shaft_angle - self.get_value('gamma_p')
+
+        # Trigonometrik Değerler
+        self.values['sin_gamma_p'] = math.sin(self.get_value('gamma_p'))
+        self.values['cos_gamma_p'] = math.cos(self.get_value('gamma_p'))
+        self.values['tan_gamma_p'] = math.tan(self.get_value('gamma_p'))
+        self.values['sin_Gamma_G'] = math.sin(self.get_value('Gamma_G'))
+        self.values['cos_Gamma_G'] = math.cos(self.get_value('Gamma_G'))
+        self.values['tan_Gamma_G'] = math.tan(self.get_value('Gamma_G'))
+
+    @step(reads=('d', 'gamma_p', 'F'), writes=('A0', 'Ai', 'Am'))
+    def _cone_distances(self):
+        # Dış Koni Mesafesi (A0)
+        d = self.get_value('d')
+        sin_gamma_p = math.sin(self.get_value('gamma_p'))
+        self.values['A0'] = safe_division(d, (2 * sin_gamma_p))
+        if math.isinf(self.get_value('A0')): raise ValueError("A0 hesaplanamadı (sin_gamma_p sıfır?).")
+
+        # İç Koni Mesafesi (Ai)
+        self.values['Ai'] = self.get_value('A0') - self.get_value('F')
+
+        # Ortalama Koni Mesafesi (Am)
+        self.values['Am'] = self.get_value('A0') - self.get_value('F') / 2.0
+
+    @step(reads=('A0', 'b0P', 'b0G'),
+          writes=('delta_p', 'delta_G', 'tan_delta_p', 'tan_delta_G', 'sin_delta_p', 'cos_delta_p',
+                  'sin_delta_G', 'cos_delta_G'))
+    def _dedendum_angles(self):
+        # Dedendum Açıları (delta_p, delta_G)
+        A0 = self.get_value('A0')
+        b0P = self.get_value('b0P')
+        b0G = self.get_value('b0G')
+        tan_delta_p = safe_division(b0P, A0)
+        tan_delta_G = safe_division(b0G, A0)
+        if math.isinf(tan_delta_p) or math.isinf(tan_delta_G): raise ValueError("Dedendum açısı tanjantı hesaplanamadı (A0 sıfır?).")
+        self.values['delta_p'] = math.atan(tan_delta_p)
+        self.values['delta_G'] = math.atan(tan_delta_G)
+        self.values['tan_delta_p'] = tan_delta_p # Tanjantları da sakla
+        self.values['tan_delta_G'] = tan_delta_G
+        self.values['sin_delta_p'] = math.sin(self.get_value('delta_p'))
+        self.values['cos_delta_p'] = math.cos(self.get_value('delta_p'))
+        self.values['sin_delta_G'] = math.sin(self.get_value('delta_G'))
+        self.values['cos_delta_G'] = math.cos(self.get_value('delta_G'))
+
+    @step(reads=('b0P', 'a0G', 'b0G', 'a0P'), writes=('c_clearance',))
+    def _clearance(self):
+        # Boşluk (Clearance) Hesaplaması (c)
+        c_outer1 = self.get_value('b0P') - self.get_value('a0G')
+        c_outer2 = self.get_value('b0G') - self.get_value('a0P')
+        c_clearance = (c_outer1 + c_outer2) / 2.0
+        # Negatif boşluk genellikle hatadır, ancak hesaplamaya devam edilebilir.
+        self.set_warning(CLEARANCE_WARNING, c_clearance < 0)
+        self.values['c_clearance'] = c_clearance # Değeri sakla
+
+    def calculate_sb1(self, dirty=None, changed=None):
+        """SB1 Hesaplamalarını Gleason PDF'e göre yapar."""
+        try:
+            self.run_steps(SB1_STEPS, dirty, changed)
+        except KeyError as e:
+            raise CalculationError("SB1 Anahtar Hatası", f"SB1 için gerekli değer bulunamadı: {e}") from e
+        except ValueError as e:
+             raise CalculationError("SB1 Değer Hatası", f"SB1 hesaplamasında geçersiz değer: {e}") from e
+        except Exception as e:
+            fname, line_num = _error_location()
+            raise CalculationError("SB1 Hatası", f"SB1 hesaplamasında hata: {e}\nDosya: {fname}\nSatır: {line_num}") from e
+
+    # --- SB1 ---
+    # Öğeler 1-4 (Girişlerden)
+    @step(reads=('n', 'N'), writes=('1L', '1R'))
+    def _item_1(self):
+        self.set_value('1', 'L', self.get_value('n'))
+        self.set_value('1', 'R', self.get_value('N'))
+
+    @step(reads=('Pd', 'p'), writes=('2L', '2R'))
+    def _item_2(self):
+        self.set_value('2', 'L', self.get_value('Pd'))
+        self.set_value('2', 'R', self.get_value('p')) # p için 'R' sütunu kullanılıyor gibi
+
+    @step(reads=('d', 'D'), writes=('3L', '3R'))
+    def _item_3(self):
+        self.set_value('3', 'L', self.get_value('d'))
+        self.set_value('3', 'R', self.get_value('D'))
+
+    @step(reads=('F',), writes=('4L', '4R'))
+    def _item_4(self):
+        self.set_value('4', 'L', self.get_value('F'))
+        self.set_value('4', 'R', self.get_value('F') / 2.0)
+
+    # Öğeler 5-8 (Temel Hesaplamalar)
+    @step(reads=('A0',), writes=('5L', '5R'))
+    def _item_5(self):
+        self.set_value('5', 'L', self.get_value('A0')) # A0 tek değer
+        self.set_value('5', 'R', self.get_value('A0'))
+
+    @step(reads=('Am',), writes=('6L', '6R'))
+    def _item_6(self):
+        self.set_value('6', 'L', self.get_value('Am')) # Am tek değer
+        self.set_value('6', 'R', self.get_value('Am'))
+
+    @step(reads=('Ai',), writes=('7L', '7R'))
+    def _item_7(self):
+        self.set_value('7', 'L', self.get_value('Ai')) # Ai tek değer
+        self.set_value('7', 'R', self.get_value('Ai'))
+
+    @step(reads=('rc',), writes=('8L', '8R'))
+    def _item_8(self):
+        self.set_value('8', 'L', self.get_value('rc')) # rc tek değer
+        self.set_value('8', 'R', self.get_value('rc'))
+
+    # Öğeler 9-16 (Açılar ve Trigonometri)
+    # Sağ sütunlar genellikle boş bırakılır veya aynı değer yazılır
+    @step(reads=('phi',), writes=('9L', '9R'))
+    def _item_9(self):
+        self.set_value('9', 'L', math.degrees(self.get_value('phi')))
+        self.set_value('9', 'R', self.get_value('9', 'L'))
+
+    @step(reads=('sin_phi',), writes=('10L', '10R'))
+    def _item_10(self):
+        self.set_value('10', 'L', self.get_value('sin_phi'))
+        self.set_value('10', 'R', self.get_value('10', 'L'))
+
+    @step(reads=('cos_phi',), writes=('11L', '11R'))
+    def _item_11(self):
+        self.set_value('11', 'L', self.get_value('cos_phi'))
+        self.set_value('11', 'R', self.get_value('11', 'L'))
+
+    @step(reads=('tan_phi',), writes=('12L', '12R'))
+    def _item_12(self):
+        self.set_value('12', 'L', self.get_value('tan_phi'))
+        self.set_value('12', 'R', self.get_value('12', 'L'))
+
+    @step(reads=('psi',), writes=('13L', '13R'))
+    def _item_13(self):
+        self.set_value('13', 'L', math.degrees(self.get_value('psi')))
+        self.set_value('13', 'R', self.get_value('13', 'L'))
+
+    @step(reads=('sin_psi',), writes=('14L', '14R'))
+    def _item_14(self):
+        self.set_value('14', 'L', self.get_value('sin_psi'))
+        self.set_value('14', 'R', self.get_value('14', 'L'))
+
+    @step(reads=('cos_psi',), writes=('15L', '15R'))
+    def _item_15(self):
+        self.set_value('15', 'L', self.get_value('cos_psi'))
+        self.set_value('15', 'R', self.get_value('15', 'L'))
+
+    @step(reads=('tan_psi',), writes=('16L', '16R'))
+    def _item_16(self):
+        self.set_value('16', 'L', self.get_value('tan_psi'))
+        self.set_value('16', 'R', self.get_value('16', 'L'))
+
+    # Öğeler 17-26 (Pitch Açıları, Add/Ded, Kalınlık)
+    @step(reads=('gamma_p', 'Gamma_G'), writes=('17L', '17R'))
+    def _item_17(self):
+        self.set_value('17', 'L', math.degrees(self.get_value('gamma_p')))
+        self.set_value('17', 'R', math.degrees(self.get_value('Gamma_G')))
+
+    @step(reads=('sin_gamma_p', 'sin_Gamma_G'), writes=('18L', '18R'))
+    def _item_18(self):
+        self.set_value('18', 'L', self.get_value('sin_gamma_p'))
+        self.set_value('18', 'R', self.get_value('sin_Gamma_G'))
+
+    @step(reads=('cos_gamma_p', 'cos_Gamma_G'), writes=('19L', '19R'))
+    def _item_19(self):
+        self.set_value('19', 'L', self.get_value('cos_gamma_p'))
+        self.set_value('19', 'R', self.get_value('cos_Gamma_G'))
+
+    @step(reads=('tan_gamma_p', 'tan_Gamma_G'), writes=('20L', '20R'))
+    def _item_20(self):
+        self.set_value('20', 'L', self.get_value('tan_gamma_p'))
+        self.set_value('20', 'R', self.get_value('tan_Gamma_G'))
+
+    @step(reads=('a0P', 'a0G'), writes=('21L', '21R'))
+    def _item_21(self):
+        self.set_value('21', 'L', self.get_value('a0P'))
+        self.set_value('21', 'R', self.get_value('a0G'))
+
+    @step(reads=('b0P', 'b0G'), writes=('22L', '22R'))
+    def _item_22(self):
+        self.set_value('22', 'L', self.get_value('b0P'))
+        self.set_value('22', 'R', self.get_value('b0G'))
+
+    @step(reads=('delta_p', 'delta_G'), writes=('23L', '23R'))
+    def _item_23(self):
+        self.set_value('23', 'L', math.degrees(self.get_value('delta_p')))
+        self.set_value('23', 'R', math.degrees(self.get_value('delta_G')))
+
+    @step(reads=('cos_delta_p', 'cos_delta_G'), writes=('24L', '24R'))
+    def _item_24(self):
+        self.set_value('24', 'L', self.get_value('cos_delta_p'))
+        self.set_value('24', 'R', self.get_value('cos_delta_G'))
+
+    @step(reads=('tan_delta_p', 'tan_delta_G'), writes=('25L', '25R'))
+    def _item_25(self):
+        self.set_value('25', 'L', self.get_value('tan_delta_p'))
+        self.set_value('25', 'R', self.get_value('tan_delta_G'))
+
+    @step(reads=('t0PL', 't0G'), writes=('26L', '26R'))
+    def _item_26(self):
+        self.set_value('26', 'L', self.get_value('t0PL')) # Girdi olarak alındı
+        self.set_value('26', 'R', self.get_value('t0G'))  # Girdi olarak alındı
+
+    # Öğeler 27-29 (Ara Hesaplamalar)
+    @step(reads=('rc', 'sin_psi', 'A0'), writes=('27L', '27R'))
+    def _item_27(self):
+        val_27 = 2 * self.get_value('rc') * self.get_value('sin_psi') - self.get_value('A0')
+        self.set_value('27', 'L', val_27)
+        self.set_value('27', 'R', val_27)
+
+    @step(reads=('27L', 'A0'), writes=('28L', '28R'))
+    def _item_28(self):
+        val_28 = self.get_value('27', 'L') + self.get_value('A0') # PDF Formülü: Öğe27 + A0
+        self.set_value('28', 'L', val_28)
+        self.set_value('28', 'R', val_28)
+
+    @step(reads=('27L', 'Ai', 'A0'), writes=('29L', '29R'))
+    def _item_29(self):
+        Ai = self.get_value('Ai')
+        A0 = self.get_value('A0')
+        val_29 = safe_division(A0 * self.get_value('27', 'L'), Ai) + Ai # PDF Formülü: (A0 * Öğe27) / Ai + Ai
+        if math.isinf(val_29): raise ValueError("Öğe 29 hesaplanamadı (Ai sıfır?).")
+        self.set_value('29', 'L', val_29)
+        self.set_value('29', 'R', val_29)
+
+    # Öğeler 30-35 (Dış/İç Spiral Açıları)
+    @step(reads=('28L', 'rc'), writes=('30L', '30R', '31L', '31R', '32L', '32R', 'Psi_o', 'cos_Psi_o'))
+    def _items_30_32(self):
+        rc = self.get_value('rc')
+        sin_Psi_o_val = safe_division(self.get_value('28', 'L'), 2 * rc)
+        sin_Psi_o = clamp_unit(sin_Psi_o_val, '30')
+        if math.isinf(sin_Psi_o): raise ValueError("Öğe 30 hesaplanamadı (rc sıfır?).")
+        self.set_value('30', 'L', sin_Psi_o)
+        self.set_value('30', 'R', sin_Psi_o)
+        Psi_o = safe_asin(sin_Psi_o)
+        self.values['Psi_o'] = Psi_o # radyan
+        self.set_value('31', 'L', math.degrees(Psi_o))
+        self.set_value('31', 'R', math.degrees(Psi_o))
+        cos_Psi_o = math.cos(Psi_o)
+        self.values['cos_Psi_o'] = cos_Psi_o
+        self.set_value('32', 'L', cos_Psi_o)
+        self.set_value('32', 'R', cos_Psi_o)
+
+    @step(reads=('29L', 'rc'), writes=('33L', '33R', '34L', '34R', '35L', '35R', 'Psi_i', 'cos_Psi_i'))
+    def _items_33_35(self):
+        rc = self.get_value('rc')
+        sin_Psi_i_val = safe_division(self.get_value('29', 'L'), 2 * rc)
+        sin_Psi_i = clamp_unit(sin_Psi_i_val, '33')
+        if math.isinf(sin_Psi_i): raise ValueError("Öğe 33 hesaplanamadı (rc sıfır?).")
+        self.set_value('33', 'L', sin_Psi_i)
+        self.set_value('33', 'R', sin_Psi_i)
+        Psi_i = safe_asin(sin_Psi_i)
+        self.values['Psi_i'] = Psi_i # radyan
+        self.set_value('34', 'L', math.degrees(Psi_i))
+        self.set_value('34', 'R', math.degrees(Psi_i))
+        cos_Psi_i = math.cos(Psi_i)
+        self.values['cos_Psi_i'] = cos_Psi_i
+        self.set_value('35', 'L', cos_Psi_i)
+        self.set_value('35', 'R', cos_Psi_i)
+
+    # Öğeler 36-40 (Boşluk, Dedendumlar)
+    @step(reads=('Pd',), writes=('36L', '36R', 'Bmin', 'Bmax'))
+    def _item_36(self):
+        Pd = self.get_value('Pd')
+        if Pd <= 1: Bmin, Bmax = 0.020, 0.030
+        elif Pd <= 2: Bmin, Bmax = 0.012, 0.016 # PDF Tablosu
+        elif Pd <= 3: Bmin, Bmax = 0.008, 0.011
+        elif Pd <= 4: Bmin, Bmax = 0.006, 0.008 # PDF Tablosu
+        elif Pd <= 6: Bmin, Bmax = 0.004, 0.006 # PDF Tablosu
+        elif Pd <= 10: Bmin, Bmax = 0.002, 0.004
+        else: Bmin, Bmax = 0.001, 0.003 # 20 ve üzeri
+        self.set_value('36', 'L', Bmin)
+        self.set_value('36', 'R', Bmax)
+        self.values['Bmin'] = Bmin
+        self.values['Bmax'] = Bmax
+
+    @step(reads=('4R', 'b0P', 'tan_delta_p', 'b0G', 'tan_delta_G'), writes=('37L', '37R', 'b_P', 'b_G'))
+    def _item_37(self):
+        F_half = self.get_value('4','R')
+        b_P = self.get_value('b0P') - F_half * self.get_value('tan_delta_p')
+        b_G = self.get_value('b0G') - F_half * self.get_value('tan_delta_G')
+        self.set_value('37', 'L', b_P) # Pinyon (L)
+        self.set_value('37', 'R', b_G) # Dişli (R)
+        self.values['b_P'] = b_P
+        self.values['b_G'] = b_G
+
+    @step(reads=('4R', '37L', '37R', 'tan_delta_p', 'tan_delta_G'), writes=('38L', '38R', 'bi_P', 'bi_G'))
+    def _item_38(self):
+        F_half = self.get_value('4','R')
+        bi_P = self.get_value('37', 'L') - F_half * self.get_value('tan_delta_p')
+        bi_G = self.get_value('37', 'R') - F_half * self.get_value('tan_delta_G')
+        self.set_value('38', 'L', bi_P) # Pinyon (L)
+        self.set_value('38', 'R', bi_G) # Dişli (R)
+        self.values['bi_P'] = bi_P
+        self.values['bi_G'] = bi_G
+
+    @step(reads=('b0P', 'b0G'), writes=('39L', '39R'))
+    def _item_39(self):
+        val_39 = self.get_value('b0P') + self.get_value('b0G')
+        self.set_value('39', 'L', val_39)
+        self.set_value('39', 'R', val_39)
+
+    @step(reads=('38L', '38R'), writes=('40L', '40R'))
+    def _item_40(self):
+        val_40 = self.get_value('38', 'L') + self.get_value('38', 'R')
+        self.set_value('40', 'L', val_40)
+        self.set_value('40', 'R', val_40)
+
+    # Öğeler 41-48 (Nokta Genişlikleri)
+    @step(reads=('t0PL',), writes=('41L',))
+    def _item_41(self):
+        val_41 = self.get_value('t0PL') # Formül: (A0 * t0PL) / A0 = t0PL
+        self.set_value('41', 'L', val_41)
+        # Sağ sütun PDF'te boş
+
+    @step(reads=('Ai', 'p', 'A0'), writes=('42L',))
+    def _item_42(self):
+        val_42 = safe_division(self.get_value('Ai') * self.get_value('p'), self.get_value('A0'))
+        if math.isinf(val_42): raise ValueError("Öğe 42 hesaplanamadı (A0 sıfır?).")
+        self.set_value('42', 'L', val_42) # PDF'te sadece sol sütun
+        # Sağ sütun PDF'te boş
+
+    @step(reads=('cos_psi', 'tan_phi', '37R', '41L'), writes=('43R', 'WG_prime'))
+    def _item_43(self):
+        # WG' (Dişli)
+        cos_psi = self.get_value('cos_psi')
+        tan_phi = self.get_value('tan_phi')
+        b_G = self.get_value('37','R') # Dişli ortalama dedendumu
+        val_43 = cos_psi * self.get_value('41', 'L') - 2 * tan_phi * b_G # Formül: (15)(41)-2(12)(37)R
+        self.set_value('43', 'R', val_43) # WG' dişli için hesaplanır (R)
+        self.values['WG_prime'] = val_43
+
+    @step(reads=('43R', 'rc', 'Pd'), writes=('44L', '44R', 'WG', 'WRG'))
+    def _item_44(self):
+        # WG, WRG (Öğe 44) - Metinden alınacak kurallar
+        WG_prime = self.get_value('43', 'R')
+        rc = self.get_value('rc')
+        Pd = self.get_value('Pd')
+        # WG Seçimi (Dişli Finiş)
+        if rc == 1.75: # 3.5" kesici
+            WG = round(WG_prime / 0.005) * 0.005
+        else: # Diğer kesiciler (cut gear)
+            WG = round(WG_prime / 0.010) * 0.010
+        # WRG Seçimi (Dişli Kaba)
+        if Pd >= 3: # 3 DP ve kaba
+            WRG = WG - 0.030
+        else: # Daha ince pitch
+            WRG = WG - 0.020
+        # Taşlanacaksa WRG = WG - <=0.010 (bu kodda taşlama durumu yok)
+        self.set_value('44', 'L', WG) # Sol/Finish sütunu
+        self.set_value('44', 'R', WRG) # Sağ/Rough sütunu
+        self.values['WG'] = WG
+        self.values['WRG'] = WRG
+
+    @step(reads=('p', 'cos_Psi_o', 'tan_phi', '39L', 'WG'), writes=('45L', 'Wop'))
+    def _item_45(self):
+        # Wop (Pinyon)
+        # PDF Formülü: (2)R*(32)-2*(12)*(39)-(44)L -> p*cos(Psi_o) - 2*tan(phi)*(b0P+b0G) - WG
+        # (32) cos Ψo'dur (Öğe 46'daki (35) cos Ψi gibi); dış uçta pitch p'dir.
+        val_45 = (self.get_value('p') * self.get_value('cos_Psi_o')
+                  - 2 * self.get_value('tan_phi') * self.get_value('39', 'L') - self.get_value('WG'))
+        self.set_value('45', 'L', val_45) # Wop pinyon için (L)
+        self.values['Wop'] = val_45
+
+    @step(reads=('42L', 'cos_Psi_i', 'tan_phi', '40L', 'WG'), writes=('46L', 'Wip'))
+    def _item_46(self):
+        # Wip (Pinyon)
+        cos_Psi_i = self.get_value('cos_Psi_i')
+        tan_phi = self.get_value('tan_phi')
+        val_40_sum_bi = self.get_value('40','L')
+        # PDF Formülü: (42)*(35)-2*(12)*(40)-(44)L -> val_42*cos(Psi_i) - 2*tan(phi)*val_40 - WG
+        val_46 = self.get_value('42', 'L') * cos_Psi_i - 2 * tan_phi * val_40_sum_bi - self.get_value('WG')
+        self.set_value('46', 'L', val_46) # Wip pinyon için (L)
+        self.values['Wip'] = val_46
+
+    @step(reads=('45L', '46L'), writes=('47L', 'WLP'))
+    def _item_47(self):
+        # WLP (Pinyon)
+        val_47 = min(self.get_value('45', 'L'), self.get_value('46', 'L'))
+        self.set_value('47', 'L', val_47)
+        self.values['WLP'] = val_47
+
+    @step(reads=('WLP', 'rc'), writes=('48L', 'stock_allowance', 'WRP'))
+    def _item_48(self):
+        # WRP (Pinyon)
+        stock_allowance = STOCK_ALLOWANCE # Varsayılan stok payı (PDF sayfa 6 referans alınarak)
+        self.values['stock_allowance'] = stock_allowance
+        rc = self.get_value('rc')
+        val_47 = self.get_value('WLP')
+        WRP_calc = val_47 - stock_allowance
+        # Yuvarlama
+        if rc == 1.75: # 3.5" kesici
+            WRP = round(WRP_calc / 0.005) * 0.005
+        else:
+            WRP = round(WRP_calc / 0.010) * 0.010
+        # Minimum kontrolü (Metin sayfa 6)
+        if rc >= 3.0 and WRP < 0.040: # 6" ve üstü için
+             WRP = 0.040
+        self.set_value('48', 'L', WRP)
+        self.values['WRP'] = WRP
+
+    def calculate_sb2(self, dirty=None, changed=None):
+        """SB2 Hesaplamalarını Gleason PDF'e göre yapar."""
+        try:
+            if dirty is None:
+                # Gerekli değerleri kontrol et
+                required = ['Wop', 'Wip', 'rc', 'cos_psi', 'sin_phi', 'cos_phi', 'Ai', 'Bmax', 'A0', 'tan_phi',
+                            'Gamma_G', 'bi_P', 'bi_G', 'c_clearance', 'n', 'cos_gamma_p', 'WLP', 'psi', 'delta_p',
+                            'WG'] # ht eklendi
+                for k in required: self.get_value(k) # Eksikse KeyError verir
+            self.run_steps(SB2_STEPS, dirty, changed)
+        except KeyError as e:
+            raise CalculationError("SB2 Anahtar Hatası", f"SB2 için gerekli değer bulunamadı: {e}") from e
+        except ValueError as e:
+             raise CalculationError("SB2 Değer Hatası", f"SB2 hesaplamasında geçersiz değer: {e}") from e
+        except Exception as e:
+            fname, line_num = _error_location()
+            raise CalculationError("SB2 Hatası", f"SB2 hesaplamasında hata: {e}\nDosya: {fname}\nSatır: {line_num}") from e
+
+    # --- SB2 ---
+    @step(reads=('a0P', 'b0P', 'a0G', 'b0G'), writes=('82L', '82R', 'htP', 'htG'))
+    def _item_82(self):
+        # Öğe 82 ht (Tam Derinlik) - Boyut sayfasından alınır.
+        # htP = a0P + b0P, htG = a0G + b0G
+        htP = self.get_value('a0P') + self.get_value('b0P')
+        htG = self.get_value('a0G') + self.get_value('b0G')
+        self.set_value('82', 'L', htP)
+        self.set_value('82', 'R', htG)
+        self.values['htP'] = htP
+        self.values['htG'] = htG
+
+    @step(reads=('Wop', 'Wip'), writes=('49L', '49R', 'WMP'))
+    def _item_49(self):
+        # Öğe 49 WMP
+        val_49 = max(self.get_value('Wop'), self.get_value('Wip'))
+        self.set_value('49', 'L', val_49) # Genellikle pinyon için hesaplanır
+        self.set_value('49', 'R', val_49)
+        self.values['WMP'] = val_49
+
+    @step(reads=('49L', '44L', 'rc'), writes=('50L', '50R', 'WB_P', 'WB_G'))
+    def _item_50(self):
+        # Öğe 50 WB: kesici kataloğunda gereken genişliği aşmayan en büyük bıçak ucu
+        # Gereken: WB = WMP/2 + 0.003 (Sayfa 7); dişli için WMP yerine WG (Öğe 44)
+        from spreadblade_cutters import default_cutter_catalog
+        catalog = default_cutter_catalog()
+        rc = self.get_value('rc')
+        WB_P = catalog.select(rc, 'WB', self.get_value('49', 'L') / 2.0 + 0.003)
+        WB_G = catalog.select(rc, 'WB', self.get_value('44', 'L') / 2.0 + 0.003)
+        self.set_value('50', 'L', WB_P)
+        self.set_value('50', 'R', WB_G)
+        self.set_warning(BLADE_WIDTH_WARNING, math.isnan(WB_P) or math.isnan(WB_G))
+        self.values['WB_P'] = WB_P
+        self.values['WB_G'] = WB_G
+
+    @step(reads=('cos_psi',), writes=('51L', '51R'))
+    def _item_51(self):
+        val_51 = self.get_value('cos_psi')**2
+        self.set_value('51', 'L', val_51)
+        self.set_value('51', 'R', val_51)
+
+    @step(reads=('sin_phi',), writes=('52L', '52R'))
+    def _item_52(self):
+        val_52 = 1.0 - self.get_value('sin_phi')
+        self.set_value('52', 'L', val_52)
+        self.set_value('52', 'R', val_52)
+
+    @step(reads=('52L', 'cos_phi'), writes=('53L', '53R'))
+    def _item_53(self):
+        val_53 = safe_division(self.get_value('52', 'L'), self.get_value('cos_phi'))
+        if math.isinf(val_53): raise ValueError("Öğe 53 hesaplanamadı (cos phi sıfır?).")
+        self.set_value('53', 'L', val_53)
+        self.set_value('53', 'R', val_53)
+
+    @step(reads=('Ai', 'Bmax', 'A0'), writes=('54L', '54R'))
+    def _item_54(self):
+        val_54 = safe_division(self.get_value('Ai') * self.get_value('Bmax'), self.get_value('A0'))
+        if math.isinf(val_54): raise ValueError("Öğe 54 hesaplanamadı (A0 sıfır?).")
+        self.set_value('54', 'L', val_54)
+        self.set_value('54', 'R', val_54)
+
+    @step(reads=('54L', 'tan_phi'), writes=('55L', '55R'))
+    def _item_55(self):
+        val_55 = safe_division(0.5 * self.get_value('54', 'L'), self.get_value('tan_phi'))
+        if math.isinf(val_55): raise ValueError("Öğe 55 hesaplanamadı (tan phi sıfır?).")
+        self.set_value('55', 'L', val_55)
+        self.set_value('55', 'R', val_55)
+
+    @step(reads=('b0P', 'a0G', 'b0G', 'a0P'), writes=('56L', '56R', 'c_clearance'))
+    def _item_56(self):
+        # Öğe 56 c (iç boşluk) - Genellikle dış boşlukla aynı varsayılır
+        # c = biP - aiG veya biG - aiP ? ai hesaplanmalı.
+        # Veya dış boşluk c = b0P-a0G = b0G-a0P kullanılır.
+        c_outer1 = self.get_value('b0P') - self.get_value('a0G')
+        c_outer2 = self.get_value('b0G') - self.get_value('a0P')
+        c_clearance = (c_outer1 + c_outer2) / 2.0
+        self.set_value('56', 'L', c_clearance)
+        self.set_value('56', 'R', c_clearance)
+        self.values['c_clearance'] = c_clearance # Hem iç hem dış için aynı kabul edelim
+
+    @step(reads=('Ai', 'tan_Gamma_G', '51L'), writes=('57L',))
+    def _item_57(self):
+        # Öğe 57 Ri (Pinyon için Sol Sütun)
+        Ai = self.get_value('Ai')
+        tan_Gamma = self.get_value('tan_Gamma_G')
+        val_57 = safe_division(Ai * tan_Gamma, self.get_value('51', 'L')) # val_51 = cos(psi)^2
+        if math.isinf(val_57): raise ValueError("Öğe 57 hesaplanamadı (cos psi sıfır?).")
+        self.set_value('57', 'L', val_57) # Pinyon Ri
+        # Sağ sütun boş
+
+    @step(reads=('bi_G', 'bi_P', 'c_clearance'), writes=('58L', '58R'))
+    def _item_58(self):
+        c_clearance = self.get_value('c_clearance')
+        # Öğe 58 ai (Pinyon için Sol Sütun: bi_G - c)
+        # Dişli iç dedendumu (bi_G) ve boşluk (c) kullanılır
+        bi_G = self.get_value('bi_G')
+        val_58_L = bi_G - c_clearance # Pinyonun iç addendumu ai_P = bi_G - c
+        self.set_value('58', 'L', val_58_L)
+        # Öğe 58 ai (Dişli için Sağ Sütun: bi_P - c)
+        bi_P = self.get_value('bi_P')
+        val_58_R = bi_P - c_clearance # Dişlinin iç addendumu ai_G = bi_P - c
+        self.set_value('58', 'R', val_58_R)
+
+    @step(reads=('n', 'N', 'cos_gamma_p', 'cos_Gamma_G'), writes=('59L', '59R'))
+    def _item_59(self):
+        n = self.get_value('n')
+        N = self.get_value('N')
+        cos_gamma_p = self.get_value('cos_gamma_p')
+        cos_Gamma_G = self.get_value('cos_Gamma_G')
+        val_59_L = safe_division(n, cos_gamma_p)
+        val_59_R = safe_division(N, cos_Gamma_G)
+        if math.isinf(val_59_L) or math.isinf(val_59_R): raise ValueError("Öğe 59 hesaplanamadı (cos pitch açısı sıfır?).")
+        self.set_value('59', 'L', val_59_L)
+        self.set_value('59', 'R', val_59_R)
+
+    @step(reads=('59L', '59R'), writes=('60L', '60R'))
+    def _item_60(self):
+        val_60 = self.get_value('59', 'L') + self.get_value('59', 'R')
+        self.set_value('60', 'L', val_60)
+        self.set_value('60', 'R', val_60)
+
+    @step(reads=('55L', '59L', '59R', '60L'), writes=('61L', '61R'))
+    def _item_61(self):
+        # Öğe 61 Δa
+        val_55 = self.get_value('55', 'L')
+        val_60 = self.get_value('60', 'L')
+        val_61 = safe_division(val_55 * self.get_value('59', 'L'), val_60) # Pinyon için ΔaP
+        val_61_R = safe_division(val_55 * self.get_value('59', 'R'), val_60) # Dişli için ΔaG
+        if math.isinf(val_61) or math.isinf(val_61_R): raise ValueError("Öğe 61 hesaplanamadı (Öğe 60 sıfır?).")
+        self.set_value('61', 'L', val_61) # ΔaP
+        self.set_value('61', 'R', val_61_R) # ΔaG
+
+    @step(reads=('57L',), writes=('62L', '62R'))
+    def _item_62(self):
+        # Öğe 62 (Referans)
+        # PDF: 62L = 57R, 62R = 57L. Ancak 57R boştu. 57L Pinyon Ri idi.
+        # Yüksek oranlı dişlilerde basitleştirme var (Sayfa 9).
+        # Şimdilik R1 için Pinyon değerini (57L) kullanalım.
+        R1_P = self.get_value('57','L')
+        self.set_value('62', 'L', R1_P)
+        self.set_value('62', 'R', R1_P) # Dişli için de aynı değeri kullanalım? Belirsiz.
+
+    @step(reads=('61L', '61R'), writes=('63L', '63R'))
+    def _item_63(self):
+        # Öğe 63 (Referans)
+        # PDF: 63L = 61R, 63R = 61L
+        self.set_value('63', 'L', self.get_value('61', 'R')) # ΔaG
+        self.set_value('63', 'R', self.get_value('61', 'L'))   # ΔaP
+
+    @step(reads=('58L', '58R', '61L', '61R'), writes=('64L', '64R', 'a1_P', 'a1_G'))
+    def _item_64(self):
+        # Öğe 64 a1 (Düzeltilmiş İç Addendum)
+        # a1_P = ai_P + Δa_G = 58L + 63L
+        a1_P = self.get_value('58', 'L') + self.get_value('61', 'R')
+        self.set_value('64', 'L', a1_P)
+        # a1_G = ai_G + Δa_P = 58R + 63R
+        a1_G = self.get_value('58', 'R') + self.get_value('61', 'L')
+        self.set_value('64', 'R', a1_G)
+        self.values['a1_P'] = a1_P
+        self.values['a1_G'] = a1_G
+
+    @step(reads=('62L', '61L', '61R'), writes=('65L', '65R', 'R1_P_corr', 'R1_G_corr'))
+    def _item_65(self):
+        # Öğe 65 R1 (Düzeltilmiş Ri)
+        R1_P = self.get_value('62', 'L')
+        # R1_P = Ri_P - Δa_G = 62L - 63L
+        R1_P_corr = R1_P - self.get_value('61', 'R')
+        self.set_value('65', 'L', R1_P_corr)
+        # R1_G = Ri_G - Δa_P = 62R - 63R
+        # Ri_G belirsizdi, Ri_P kullanalım.
+        R1_G_corr = R1_P - self.get_value('61', 'L')
+        self.set_value('65', 'R', R1_G_corr)
+        self.values['R1_P_corr'] = R1_P_corr
+        self.values['R1_G_corr'] = R1_G_corr
+
+    @step(reads=('R1_P_corr', 'R1_G_corr', 'a1_P', 'a1_G'), writes=('66L', '66R', 'ratio_P', 'ratio_G'))
+    def _item_66(self):
+        # Öğe 66 R1/a1 Oranı
+        ratio_P = safe_division(self.get_value('R1_P_corr'), self.get_value('a1_P'))
+        ratio_G = safe_division(self.get_value('R1_G_corr'), self.get_value('a1_G'))
+        if math.isinf(ratio_P) or math.isinf(ratio_G): raise ValueError("Öğe 66 hesaplanamadı (a1 sıfır?).")
+        self.set_value('66', 'L', ratio_P)
+        self.set_value('66', 'R', ratio_G)
+        self.values['ratio_P'] = ratio_P
+        self.values['ratio_G'] = ratio_G
+
+    @step(reads=('phi', 'ratio_P', 'ratio_G'), writes=('67L', '67R', 'K1_P', 'K1_G'))
+    def _item_67(self):
+        # Öğe 67 K1 (Grafik No. 1'den veya formülden)
+        # Formülü kullanalım (Not: Grafik φ'ye bağlı, formülde yok?)
+        # Formül R/a'ya bağlı görünüyor; pinyon ve dişli birlikte hesaplanır.
+        # Formüldeki 'a' addendum mu yoksa normalizasyon mu? Belirsiz. R/a = ratio_P kullanalım.
+        # Çekirdek K1 grafiğiyle ortaktır (spreadblade_batch.k1_factor).
+        from spreadblade_batch import k1_factor
+        K1_P, K1_G = k1_factor((self.get_value('ratio_P'), self.get_value('ratio_G')),
+                               self.get_value('phi')).tolist()
+        self.set_value('67', 'L', K1_P)
+        self.set_value('67', 'R', K1_G)
+        self.values['K1_P'] = K1_P
+        self.values['K1_G'] = K1_G
+
+    @step(reads=('a1_P', 'K1_P', 'a1_G', 'K1_G'), writes=('68L', '68R', 'ro_P', 'ro_G'))
+    def _item_68(self):
+        # Öğe 68 ro (Taban Kenar Yarıçapı)
+        ro_P = self.get_value('a1_P') * self.get_value('K1_P')
+        ro_G = self.get_value('a1_G') * self.get_value('K1_G')
+        self.set_value('68', 'L', ro_P)
+        self.set_value('68', 'R', ro_G)
+        self.values['ro_P'] = ro_P
+        self.values['ro_G'] = ro_G
+
+    @step(reads=('c_clearance', '55L', '52L'), writes=('69L', '69R'))
+    def _item_69(self):
+        # Öğe 69 Δr
+        val_69 = safe_division(self.get_value('c_clearance') - self.get_value('55', 'L'), self.get_value('52', 'L'))
+        if math.isinf(val_69): raise ValueError("Öğe 69 hesaplanamadı (Öğe 52 sıfır?).")
+        self.set_value('69', 'L', val_69)
+        self.set_value('69', 'R', val_69)
+
+    @step(reads=('ro_P', 'ro_G', '69L'), writes=('70L', '70R', 'r1_P', 'r1_G'))
+    def _item_70(self):
+        # Öğe 70 r1
+        val_69 = self.get_value('69', 'L')
+        r1_P = self.get_value('ro_P') + val_69
+        r1_G = self.get_value('ro_G') + val_69
+        self.set_value('70', 'L', r1_P)
+        self.set_value('70', 'R', r1_G)
+        self.values['r1_P'] = r1_P
+        self.values['r1_G'] = r1_G
+
+    @step(reads=('WB_P', 'WB_G', '53L'), writes=('71L', '71R'))
+    def _item_71(self):
+        # Öğe 71 r2
+        val_53 = self.get_value('53', 'L')
+        r2_P = safe_division(self.get_value('WB_P') - 0.015, val_53)
+        r2_G = safe_division(self.get_value('WB_G') - 0.015, val_53)
+        if math.isinf(r2_P) or math.isinf(r2_G): raise ValueError("Öğe 71 hesaplanamadı (Öğe 53 sıfır?).")
+        self.set_value('71', 'L', r2_P)
+        self.set_value('71', 'R', r2_G)
+
+    @step(reads=('WLP', 'WB_P'), writes=('72L',))
+    def _item_72(self):
+        WLP = self.get_value('WLP') # Pinyon Limit Nokta Genişliği
+        val_72 = WLP - self.get_value('WB_P')
+        self.set_value('72', 'L', val_72) # Sadece pinyon için
+
+    @step(reads=('53L', '72L'), writes=('73L', '73R'))
+    def _item_73(self):
+        val_73 = self.get_value('53', 'L') * self.get_value('72', 'L') + 0.001
+        self.set_value('73', 'L', val_73)
+        self.set_value('73', 'R', val_73)
+
+    @step(reads=('73L',), writes=('75L', '75R'))
+    def _item_75(self):
+        val_75 = self.get_value('73', 'L') + 0.002
+        self.set_value('75', 'L', val_75)
+        self.set_value('75', 'R', val_75)
+
+    @step(reads=('75L',), writes=('74L', '74R'))
+    def _item_74(self):
+        val_74 = safe_sqrt(self.get_value('75', 'L'))
+        self.set_value('74', 'L', val_74)
+        self.set_value('74', 'R', val_74)
+
+    @step(reads=('73L',), writes=('76L', '76R'))
+    def _item_76(self):
+        val_76 = self.get_value('73', 'L')**2
+        self.set_value('76', 'L', val_76)
+        self.set_value('76', 'R', val_76)
+
+    @step(reads=('74L', '75L', '76L'), writes=('77L', '77R', 'r3'))
+    def _item_77(self):
+        # Öğe 77 r3; Öğe 73 sıfıra yakınsa (76 = 73²) r3 sonsuzdur, rE'yi sınırlamaz
+        num_77 = 0.063 * self.get_value('74', 'L') + self.get_value('75', 'L')
+        r3 = safe_division(num_77, self.get_value('76', 'L'))
+        self.set_value('77', 'L', r3)
+        self.set_value('77', 'R', r3)
+        self.values['r3'] = r3
+
+    @step(reads=('r1_P', 'r1_G', '71L', '71R', 'r3', 'rc'), writes=('78L', '78R', 'rE_P', 'rE_G'))
+    def _item_78(self):
+        # Öğe 78 rE: min(r1, r2, r3)'ü aşmayan en büyük katalog kenar yarıçapı
+        # (bıçak ucu yoksa r2 ve r3 NaN'dır; rE de boş kalır)
+        from spreadblade_cutters import default_cutter_catalog
+        catalog = default_cutter_catalog()
+        rc = self.get_value('rc')
+        r3 = self.get_value('r3')
+        rE_P = catalog.select(rc, 'rE', nan_min(self.get_value('r1_P'), self.get_value('71', 'L'), r3))
+        rE_G = catalog.select(rc, 'rE', nan_min(self.get_value('r1_G'), self.get_value('71', 'R'), r3))
+        self.set_value('78', 'L', rE_P)
+        self.set_value('78', 'R', rE_G)
+        self.set_warning(EDGE_RADIUS_WARNING, math.isnan(rE_P) or math.isnan(rE_G))
+        self.values['rE_P'] = rE_P
+        self.values['rE_G'] = rE_G
+
+    @step(reads=('sin_psi', 'delta_p'), writes=('79L', '79R', 'c_prime_theor'))
+    def _item_79(self):
+        # Öğe 79 #c' (Teorik kesici no)
+        sin_psi = self.get_value('sin_psi')
+        delta_p = self.get_value('delta_p') # radyan
+        c_prime = safe_division(sin_psi * delta_p, 10.0) # PDF'te delta derece mi radyan mı? Radyan varsayalım.
+        self.set_value('79', 'L', c_prime)
+        self.set_value('79', 'R', c_prime)
+        self.values['c_prime_theor'] = c_prime
+
+    @step(reads=('c_prime_theor',), writes=('80L', '80R'))
+    def _item_80(self):
+        # Öğe 80 #CR (Kaba Kesici No) - Genellikle #c' ye yakın seçilir.
+        c_prime = self.get_value('c_prime_theor')
+        self.set_value('80', 'L', f"Yakın {c_prime:.4f}")
+        self.set_value('80', 'R', f"Yakın {c_prime:.4f}")
+
+    @step(reads=(), writes=('81L', '81R', 'CF'))
+    def _item_81(self):
+        # Öğe 81 #CF (Finiş Kesici No) - Metin: Spiral için #12, Zerol için #0 önerilir.
+        # Spiral varsayalım.
+        CF = CF_FINISH # Veya 0.0 Zerol için
+        self.set_value('81', 'L', CF)
+        self.set_value('81', 'R', CF)
+        self.values['CF'] = CF
+
+    # --- Sağ Sütun Hesaplamaları (SB2) ---
+    # (Öğe 82 ht yukarıda, SB2'nin başında hesaplanır)
+    @step(reads=('rc', 'cos_psi'), writes=('83L', '83R'))
+    def _item_83(self):
+        rc = self.get_value('rc')
+        cos_psi = self.get_value('cos_psi')
+        val_83 = safe_division(rc, cos_psi)
+        if math.isinf(val_83): raise ValueError("Öğe 83 hesaplanamadı (cos psi sıfır?).")
+        self.set_value('83', 'L', val_83)
+        self.set_value('83', 'R', val_83)
+
+    @step(reads=('A0', 'sin_psi', 'rc'), writes=('84L', '84R'))
+    def _item_84(self):
+        A0 = self.get_value('A0')
+        sin_psi = self.get_value('sin_psi')
+        val_84 = A0 - self.get_value('rc') * sin_psi
+        self.set_value('84', 'L', val_84)
+        self.set_value('84', 'R', val_84)
+
+    @step(reads=('83L', '84L'), writes=('85L', '85R'))
+    def _item_85(self):
+        val_85 = self.get_value('83', 'L')**2 + self.get_value('84', 'L')**2
+        self.set_value('85', 'L', val_85)
+        self.set_value('85', 'R', val_85)
+
+    @step(reads=('85L',), writes=('86L', '86R'))
+    def _item_86(self):
+        val_86 = safe_sqrt(self.get_value('85', 'L'))
+        self.set_value('86', 'L', val_86)
+        self.set_value('86', 'R', val_86)
+
+    @step(reads=('bi_P', '58R', 'htG'), writes=('87L', '87R'))
+    def _item_87(self):
+        # Sol: (38)L + (58)R = bi_P + ai_G
+        val_87_L = self.get_value('bi_P') + self.get_value('58','R')
+        self.set_value('87', 'L', val_87_L)
+        # Sağ: (82)R = htG
+        val_87_R = self.get_value('htG')
+        self.set_value('87', 'R', val_87_R)
+
+    @step(reads=('WG', 'tan_phi', '87L', '87R'), writes=('88L', '88R'))
+    def _item_88(self):
+        WG = self.get_value('WG')
+        tan_phi = self.get_value('tan_phi')
+        val_88_L = 0.5 * WG + tan_phi * self.get_value('87', 'L')
+        val_88_R = 0.5 * WG + tan_phi * self.get_value('87', 'R') # WG yerine WRG mi? Belirsiz. WG kullanalım.
+        self.set_value('88', 'L', val_88_L)
+        self.set_value('88', 'R', val_88_R)
+
+    @step(reads=('rc', '88L', '88R'), writes=('89L', '89R', '89L+', '89R+'))
+    def _item_89(self):
+        rc = self.get_value('rc')
+        val_88_L = self.get_value('88', 'L')
+        val_88_R = self.get_value('88', 'R')
+        val_89_L_plus = rc + val_88_L
+        val_89_L_minus = rc - val_88_L
+        val_89_R_plus = rc + val_88_R
+        val_89_R_minus = rc - val_88_R
+        self.set_value('89', 'L', f"+:{val_89_L_plus:.4f} -:{val_89_L_minus:.4f}")
+        self.set_value('89', 'R', f"+:{val_89_R_plus:.4f} -:{val_89_R_minus:.4f}")
+        self.values['89L+'] = val_89_L_plus
+        self.values['89R+'] = val_89_R_plus # Artı değerler genelde kullanılır
+
+    @step(reads=('Ai', 'A0'), writes=('90L', '90R'))
+    def _item_90(self):
+        # Öğe 90 (Referans)
+        self.set_value('90', 'L', self.get_value('Ai'))
+        self.set_value('90', 'R', self.get_value('A0'))
+
+    @step(reads=('86L', '89L+', '89R+'), writes=('91L', '91R'))
+    def _item_91(self):
+        val_86 = self.get_value('86', 'L')
+        val_91_L = safe_division(val_86 * self.get_value('89L+'), 0.5)
+        val_91_R = safe_division(val_86 * self.get_value('89R+'), 0.5)
+        if math.isinf(val_91_L) or math.isinf(val_91_R): raise ValueError("Öğe 91 hesaplanamadı.")
+        self.set_value('91', 'L', val_91_L)
+        self.set_value('91', 'R', val_91_R)
+
+    @step(reads=('Ai', 'A0', '89L+', '89R+', '85L', '91L', '91R'), writes=('92L', '92R', 'cos_theta_L', 'cos_theta_R'))
+    def _item_92(self):
+        # Öğe 92 cos θ
+        Ai = self.get_value('Ai')
+        A0 = self.get_value('A0')
+        val_85 = self.get_value('85', 'L')
+        num_92_L = Ai**2 - self.get_value('89L+')**2 - val_85
+        cos_theta_L_val = safe_division(num_92_L, self.get_value('91', 'L'))
+        if math.isinf(cos_theta_L_val): raise ValueError("Öğe 92 (L) hesaplanamadı (bölme).")
+        cos_theta_L = max(-1.0, min(1.0, cos_theta_L_val))
+        self.set_value('92', 'L', cos_theta_L)
+
+        num_92_R = A0**2 - self.get_value('89R+')**2 - val_85
+        cos_theta_R_val = safe_division(num_92_R, self.get_value('91', 'R'))
+        if math.isinf(cos_theta_R_val): raise ValueError("Öğe 92 (R) hesaplanamadı (bölme).")
+        cos_theta_R = max(-1.0, min(1.0, cos_theta_R_val))
+        self.set_value('92', 'R', cos_theta_R)
+        self.values['cos_theta_L'] = cos_theta_L
+        self.values['cos_theta_R'] = cos_theta_R
+
+    @step(reads=('cos_theta_L', 'cos_theta_R'), writes=('93L', '93R', 'theta_L', 'theta_R'))
+    def _item_93(self):
+        # Öğe 93 θ
+        theta_L = safe_acos(self.get_value('cos_theta_L')) # radyan
+        theta_R = safe_acos(self.get_value('cos_theta_R')) # radyan
+        self.set_value('93', 'L', math.degrees(theta_L))
+        self.set_value('93', 'R', math.degrees(theta_R))
+        self.values['theta_L'] = theta_L
+        self.values['theta_R'] = theta_R
+
+    @step(reads=('theta_L', 'theta_R'), writes=('94L', '94R', 'delta_theta_deg'))
+    def _item_94(self):
+        # Öğe 94 Δθ
+        delta_theta_deg = math.degrees(self.get_value('theta_L')) - math.degrees(self.get_value('theta_R')) - 1.0
+        self.set_value('94', 'L', delta_theta_deg)
+        self.set_value('94', 'R', delta_theta_deg) # Tek değer
+        self.values['delta_theta_deg'] = delta_theta_deg
+
+    @step(reads=('delta_theta_deg',), writes=('95L', '95R', 'Nb_prime'))
+    def _item_95(self):
+        # Öğe 95 Nb'
+        Nb_prime = safe_division(360.0, self.get_value('delta_theta_deg')) # Mutlak değer PDF'te yok
+        if math.isinf(Nb_prime): raise ValueError("Öğe 95 hesaplanamadı (delta_theta sıfır?).")
+        self.set_value('95', 'L', Nb_prime)
+        self.set_value('95', 'R', Nb_prime)
+        self.values['Nb_prime'] = Nb_prime
+
+    @step(reads=('rc', 'Nb_prime'), writes=('96L', '96R', 'NB'))
+    def _item_96(self):
+        # Öğe 96 NB (Standart seçimi)
+        # PDF: Öğe 95'ten küçük sonraki standart. Kesicinin bıçak sayıları kesici kataloğunda;
+        # uygun standart yoksa en küçüğü alınır.
+        from spreadblade_cutters import default_cutter_catalog
+        NB = default_cutter_catalog().select(self.get_value('rc'), 'NB', abs(self.get_value('Nb_prime')), strict=True,
+                                             smallest=True)
+
+        self.set_value('96', 'L', NB)
+        self.set_value('96', 'R', NB)
+        self.values['NB'] = NB
+
+    def calculate_sb3(self, dirty=None, changed=None):
+        """SB3 Hesaplamalarını Gleason PDF'e göre yapar."""
+        try:
+            if dirty is None:
+                # Gerekli değerleri kontrol et
+                required = ['tan_phi', 'b0G', 'WG', 'p', 'Psi_o', 'A0',
+                            'tan_delta_G', 'tan_delta_p', 'a0P', '27L', 'rc', 'Ai',
+                            'Bmin', 'Bmax', 'd', 'F', 'Pd', 'cos_psi', 'sin_psi',
+                            'cos_delta_p', 'sin_gamma_p', 'n', ]
+                for k in required: self.get_value(k)
+            self.run_steps(SB3_STEPS, dirty, changed)
+        except KeyError as e:
+            raise CalculationError("SB3 Anahtar Hatası", f"SB3 için gerekli değer bulunamadı: {e}") from e
+        except ValueError as e:
+             raise CalculationError("SB3 Değer Hatası", f"SB3 hesaplamasında geçersiz değer: {e}") from e
+        except Exception as e:
+            fname, line_num = _error_location()
+            raise CalculationError("SB3 Hatası", f"SB3 hesaplamasında hata: {e}\nDosya: {fname}\nSatır: {line_num}") from e
+
+    # --- SB3 ---
+    @step(reads=(), writes=('delta_A',))
+    def _delta_a(self):
+        delta_A = 0.0
+        self.values['delta_A'] = delta_A
+
+    @step(reads=('tan_phi', 'b0G', 'WG'), writes=('97L', '97R'))
+    def _item_97(self):
+        tan_phi = self.get_value('tan_phi')
+        b0G = self.get_value('b0G')
+        WG = self.get_value('WG')
+        val_97 = safe_division(tan_phi * b0G + WG, 0.5)
+        self.set_value('97', 'L', val_97)
+        self.set_value('97', 'R', val_97)
+
+    @step(reads=('p', 'Psi_o', '97L'), writes=('98L', '98R'))
+    def _item_98(self):
+        p = self.get_value('p')
+        Psi_o = self.get_value('Psi_o') # radyan
+        val_98 = p * Psi_o - self.get_value('97', 'L') # Boyutsal olarak hala şüpheli
+        self.set_value('98', 'L', val_98)
+        self.set_value('98', 'R', val_98)
+
+    @step(reads=('30L', '97L', '98L'), writes=('99L', '99R'))
+    def _item_99(self):
+        sin_Psi_o = self.get_value('30', 'L')
+        val_97 = self.get_value('97', 'L')
+        val_98 = self.get_value('98', 'L')
+        val_99_L = safe_division(sin_Psi_o * val_97 + sin_Psi_o * val_98, 2.0) # Pinyon (L)
+        val_99_R = safe_division(sin_Psi_o * val_97 - sin_Psi_o * val_98, 2.0) # Dişli (R)
+        self.set_value('99', 'L', val_99_L)
+        self.set_value('99', 'R', val_99_R)
+
+    @step(reads=('delta_A',), writes=('100L', '100R'))
+    def _item_100(self):
+        # Öğe 100 ΔA - SB3'ün başında tanımlandı ve self.values'a eklendi
+        delta_A_val = self.get_value('delta_A')
+        self.set_value('100', 'L', delta_A_val)
+        self.set_value('100', 'R', delta_A_val)
+
+    @step(reads=('99L', '99R', 'delta_A'), writes=('101L', '101R'))
+    def _item_101(self):
+        delta_A = self.get_value('delta_A')
+        val_101_L = max(self.get_value('99', 'L'), delta_A)
+        val_101_R = max(self.get_value('99', 'R'), delta_A)
+        self.set_value('101', 'L', val_101_L)
+        self.set_value('101', 'R', val_101_R)
+
+    @step(reads=('A0', '101L', '101R'), writes=('102L', '102R'))
+    def _item_102(self):
+        A0 = self.get_value('A0')
+        val_102_L = A0 - self.get_value('101', 'L')
+        val_102_R = A0 - self.get_value('101', 'R')
+        self.set_value('102', 'L', val_102_L)
+        self.set_value('102', 'R', val_102_R)
+
+    @step(reads=('101R', 'tan_delta_G'), writes=('103R',))
+    def _item_103(self):
+        tan_delta_G = self.get_value('tan_delta_G')
+        val_103 = self.get_value('101', 'R') * tan_delta_G # 101R dişli değeri kullanılır
+        self.set_value('103', 'R', val_103) # Sadece dişli için
+
+    @step(reads=('101L', 'tan_delta_p'), writes=('104L',))
+    def _item_104(self):
+        tan_delta_p = self.get_value('tan_delta_p')
+        val_104 = self.get_value('101', 'L') * tan_delta_p # 101L pinyon değeri kullanılır
+        self.set_value('104', 'L', val_104) # Sadece pinyon için
+
+    @step(reads=('b0G', '103R'), writes=('105R',))
+    def _item_105(self):
+        val_105 = safe_division(self.get_value('b0G') - self.get_value('103', 'R'), 0.5)
+        self.set_value('105', 'R', val_105) # Sadece dişli için
+
+    @step(reads=('tan_phi', '105R', 'WG'), writes=('106L', '106R'))
+    def _item_106(self):
+        val_106 = safe_division(self.get_value('tan_phi') * self.get_value('105', 'R') + self.get_value('WG'), 0.5)
+        self.set_value('106', 'L', val_106) # PDF'te L sütununda
+        self.set_value('106', 'R', val_106)
+
+    @step(reads=('97L', '98L'), writes=('107L', '107R'))
+    def _item_107(self):
+        # Öğe 107 (Referans)
+        val_97 = self.get_value('97', 'L')
+        val_98 = self.get_value('98', 'L')
+        self.set_value('107', 'L', f"{val_97:.4f};{val_98:.4f}")
+        self.set_value('107', 'R', f"{val_97:.4f};{val_98:.4f}")
+
+    @step(reads=('a0P', '104L'), writes=('108L',))
+    def _item_108(self):
+        a0P = self.get_value('a0P')
+        val_108 = a0P - self.get_value('104', 'L') # val_104 pinyon için hesaplandı
+        self.set_value('108', 'L', val_108) # Pinyon için
+
+    @step(reads=('A0', '27L', '102L'), writes=('109L', '109R'))
+    def _item_109(self):
+        item27 = self.get_value('27', 'L')
+        val_109 = self.get_value('A0') * item27 + self.get_value('102', 'L') # val_102 pinyon için
+        self.set_value('109', 'L', val_109)
+        self.set_value('109', 'R', val_109) # R için de aynı mı?
+
+    @step(reads=('109L', 'rc'), writes=('110L', '110R', 'sin_PhiM'))
+    def _item_110(self):
+        # Öğe 110 sin ΦM
+        rc = self.get_value('rc')
+        sin_PhiM_val = safe_division(self.get_value('109', 'L'), 2 * rc)
+        if math.isinf(sin_PhiM_val): raise ValueError("Öğe 110 hesaplanamadı (rc sıfır?).")
+        sin_PhiM = max(-1.0, min(1.0, sin_PhiM_val))
+        self.set_value('110', 'L', sin_PhiM)
+        self.set_value('110', 'R', sin_PhiM)
+        self.values['sin_PhiM'] = sin_PhiM
+
+    @step(reads=('sin_PhiM',), writes=('111L', '111R', 'PhiM'))
+    def _item_111(self):
+        # Öğe 111 ΦM
+        PhiM = safe_asin(self.get_value('sin_PhiM')) # radyan
+        self.set_value('111', 'L', math.degrees(PhiM))
+        self.set_value('111', 'R', math.degrees(PhiM))
+        self.values['PhiM'] = PhiM
+
+    @step(reads=('PhiM',), writes=('112L', '112R', 'cos_PhiM'))
+    def _item_112(self):
+        # Öğe 112 cos ΦM
+        cos_PhiM = math.cos(self.get_value('PhiM'))
+        self.set_value('112', 'L', cos_PhiM)
+        self.set_value('112', 'R', cos_PhiM)
+        self.values['cos_PhiM'] = cos_PhiM # Store for graph
+
+    @step(reads=('p', 'cos_PhiM'), writes=('113R',))
+    def _item_113(self):
+        p = self.get_value('p')
+        val_113_R = p * self.get_value('cos_PhiM') # Dişli (R) için
+        self.set_value('113', 'R', val_113_R)
+
+    @step(reads=('113R', '102R', 'A0'), writes=('114R',))
+    def _item_114(self):
+        val_114 = safe_division(self.get_value('113', 'R') * self.get_value('102', 'R'), self.get_value('A0')) # val_102 Dişli (R) için
+        if math.isinf(val_114): raise ValueError("Öğe 114 hesaplanamadı (A0 sıfır?).")
+        self.set_value('114', 'R', val_114) # Dişli (R) için
+
+    @step(reads=('106L', 'Bmin', 'Bmax', '114R'), writes=('115L', '115R', 'tM_min', 'tM_max', 'tM'))
+    def _item_115(self):
+        # Öğe 115 tM (Ölçüm Kalınlığı)
+        Bmin = self.get_value('Bmin')
+        Bmax = self.get_value('Bmax')
+        val_106 = self.get_value('106', 'L')
+        tM_min = val_106 - Bmin # 106L kullanılır PDF'te, val_106 L/R aynı
+        tM_max = self.get_value('114', 'R') - val_106 # 106R kullanılır PDF'te
+        self.set_value('115', 'L', tM_min) # Min (L)
+        self.set_value('115', 'R', tM_max) # Max (R)
+        self.values['tM_min'] = tM_min
+        self.values['tM_max'] = tM_max
+        self.values['tM'] = (tM_min + tM_max) / 2.0 # Ortalama bir değer saklayalım
+
+    @step(reads=('cos_PhiM',), writes=('116L', '116R'))
+    def _item_116(self):
+        val_116 = self.get_value('cos_PhiM')**2 / 4.0
+        self.set_value('116', 'L', val_116)
+        self.set_value('116', 'R', val_116)
+
+    @step(reads=('d', '102L', 'A0'), writes=('117L',))
+    def _item_117(self):
+        d = self.get_value('d')
+        val_117 = safe_division(d * self.get_value('102', 'L'), self.get_value('A0')) # val_102 Pinyon (L) için
+        if math.isinf(val_117): raise ValueError("Öğe 117 hesaplanamadı (A0 sıfır?).")
+        self.set_value('117', 'L', val_117) # Pinyon (L) için
+
+    @step(reads=('tM', '117L'), writes=('118L',))
+    def _item_118(self):
+        # tM kare için hangi değer? Min, Max, Ortalama? Ortalama kullanalım.
+        tM_avg = self.get_value('tM')
+        val_118 = safe_division(tM_avg**2, self.get_value('117', 'L'))
+        if math.isinf(val_118): raise ValueError("Öğe 118 hesaplanamadı (Öğe 117 sıfır?).")
+        self.set_value('118', 'L', val_118) # Pinyon (L) için
+
+    @step(reads=('cos_gamma_p', '118L'), writes=('119L',))
+    def _item_119(self):
+        cos_gamma_p = self.get_value('cos_gamma_p')
+        val_119 = cos_gamma_p * self.get_value('118', 'L')
+        self.set_value('119', 'L', val_119) # Pinyon (L) için
+
+    @step(reads=('108L', '116L', '119L'), writes=('120L', 'aM'))
+    def _item_120(self):
+        # Öğe 120 aM (Ölçüm Addendumu)
+        val_120 = self.get_value('108', 'L') + self.get_value('116', 'L') * self.get_value('119', 'L')
+        self.set_value('120', 'L', val_120) # Pinyon (L) için
+        self.values['aM'] = val_120 # Pinyon için Ölçüm Addendumu
+
+    # --- Sağ Sütun (SB3 Roughing Settings) ---
+    @step(reads=('F', 'Pd'), writes=('121L', '121R'))
+    def _item_121(self):
+        # Öğe 121 F*Pd
+        val_121 = self.get_value('F') * self.get_value('Pd')
+        self.set_value('121', 'L', val_121)
+        self.set_value('121', 'R', val_121)
+
+    @step(reads=('tan_psi', '121L'), writes=('122L', '122R', 'mF_calc'))
+    def _item_122(self):
+        # Öğe 122 mF (Grafik 2'den veya formülden)
+        # Formülü kullanalım
+        tan_psi = self.get_value('tan_psi')
+        K1_mf = 0.3865
+        K2_mf = 0.0171
+        mF = (K1_mf * tan_psi - K2_mf * tan_psi**3) * self.get_value('121', 'L')
+        self.set_value('122', 'L', mF)
+        self.set_value('122', 'R', mF)
+        self.values['mF_calc'] = mF
+
+    @step(reads=('A0', 'tan_delta_p', 'b0P', 'tan_delta_G', 'b0G'), writes=('123L', '123R', 'XB_P', 'XB_G'))
+    def _item_123(self):
+        # Öğe 123 XB (Pinyon)
+        A0 = self.get_value('A0')
+        tan_delta_p = self.get_value('tan_delta_p')
+        b0P = self.get_value('b0P')
+        XB_P = A0 * tan_delta_p - b0P
+        self.set_value('123', 'L', XB_P) # Pinyon (L)
+        self.values['XB_P'] = XB_P
+        # Dişli için de hesaplayalım (metinde sadece pinyon gibi ama simetri?)
+        tan_delta_G = self.get_value('tan_delta_G')
+        b0G = self.get_value('b0G')
+        XB_G = A0 * tan_delta_G - b0G
+        self.set_value('123', 'R', XB_G) # Dişli (R)
+        self.values['XB_G'] = XB_G
+
+    @step(reads=('rc', 'cos_psi'), writes=('124L', '124R', 'V'))
+    def _item_124(self):
+        # Öğe 124 V
+        V = self.get_value('rc') * self.get_value('cos_psi')
+        self.set_value('124', 'L', V)
+        self.set_value('124', 'R', V)
+        self.values['V'] = V
+
+    @step(reads=('A0', 'rc', 'sin_psi'), writes=('125L', '125R', 'H'))
+    def _item_125(self):
+        # Öğe 125 H
+        H = self.get_value('A0') - self.get_value('rc') * self.get_value('sin_psi') # PDF formülü
+        self.set_value('125', 'L', H)
+        self.set_value('125', 'R', H)
+        self.values['H'] = H
+
+    @step(reads=('H', 'V'), writes=('126L', '126R', 'ctn_q'))
+    def _item_126(self):
+        # Öğe 126 ctn q
+        ctn_q = safe_division(self.get_value('H'), self.get_value('V'))
+        if math.isinf(ctn_q): raise ValueError("Öğe 126 hesaplanamadı (V sıfır?).")
+        self.set_value('126', 'L', ctn_q)
+        self.set_value('126', 'R', ctn_q)
+        self.values['ctn_q'] = ctn_q
+
+    @step(reads=('V', 'H'), writes=('127L', '127R', 'q'))
+    def _item_127(self):
+        # Öğe 127 q
+        q = math.atan2(self.get_value('V'), self.get_value('H')) # arccot(H/V) = arctan(V/H) -> atan2(V, H)
+        self.set_value('127', 'L', math.degrees(q))
+        self.set_value('127', 'R', math.degrees(q))
+        self.values['q'] = q # radyan
+
+    @step(reads=('q',), writes=('128L', '128R', 'sin_q'))
+    def _item_128(self):
+        # Öğe 128 sin q
+        sin_q = math.sin(self.get_value('q'))
+        self.set_value('128', 'L', sin_q)
+        self.set_value('128', 'R', sin_q)
+        self.values['sin_q'] = sin_q
+
+    @step(reads=('cos_delta_p', 'sin_gamma_p', 'cos_delta_G', 'sin_Gamma_G'), writes=('129L', '129R', 'Ra_P', 'Ra_G'))
+    def _item_129(self):
+        # Öğe 129 Ra (Pinyon)
+        cos_delta_p = self.get_value('cos_delta_p')
+        sin_gamma_p = self.get_value('sin_gamma_p')
+        Ra_P = safe_division(cos_delta_p, sin_gamma_p)
+        if math.isinf(Ra_P): raise ValueError("Öğe 129 (Pinyon) hesaplanamadı (sin gamma_p sıfır?).")
+        self.set_value('129', 'L', Ra_P) # Pinyon (L)
+        self.values['Ra_P'] = Ra_P
+        # Dişli için de hesaplayalım (Ra_G)
+        cos_delta_G = self.get_value('cos_delta_G')
+        sin_Gamma_G = self.get_value('sin_Gamma_G')
+        Ra_G = safe_division(cos_delta_G, sin_Gamma_G)
+        if math.isinf(Ra_G): raise ValueError("Öğe 129 (Dişli) hesaplanamadı (sin Gamma_G sıfır?).")
+        self.set_value('129', 'R', Ra_G) # Dişli (R)
+        self.values['Ra_G'] = Ra_G
+
+    @step(reads=('n', 'N', 'Ra_P', 'Ra_G'), writes=('130L', '130R'))
+    def _item_130(self):
+        n = self.get_value('n')
+        N = self.get_value('N')
+        val_130_L = safe_division(n * self.get_value('Ra_P'), 150.0)
+        val_130_R = safe_division(N * self.get_value('Ra_G'), 150.0) # Dişli için N ve Ra_G
+        self.set_value('130', 'L', val_130_L)
+        self.set_value('130', 'R', val_130_R)
+
+    @step(reads=('130L', '130R'), writes=('131L', '131R', 'm75_L', 'm75_R'))
+    def _item_131(self):
+        # Öğe 131 m75
+        m75_L = 2 * self.get_value('130', 'L')
+        m75_R = 2 * self.get_value('130', 'R')
+        self.set_value('131', 'L', m75_L)
+        self.set_value('131', 'R', m75_R)
+        self.values['m75_L'] = m75_L
+        self.values['m75_R'] = m75_R
+
+    @step(reads=('131L', '131R'), writes=('132L', '132R'))
+    def _item_132(self):
+        # Öğe 132 Oran dişlileri: m75'e en yakın değişim dişlisi dizisi ve hatası
+        from spreadblade_gears import default_gear_index
+        index = default_gear_index()
+        self.set_value('132', 'L', index.describe(self.get_value('131', 'L')))
+        self.set_value('132', 'R', index.describe(self.get_value('131', 'R')))
+
+    @step(reads=('130L', '130R'), writes=('133L', '133R', 'm50_L', 'm50_R'))
+    def _item_133(self):
+        # Öğe 133 m50
+        m50_L = 3 * self.get_value('130', 'L')
+        m50_R = 3 * self.get_value('130', 'R')
+        self.set_value('133', 'L', m50_L)
+        self.set_value('133', 'R', m50_R)
+        self.values['m50_L'] = m50_L
+        self.values['m50_R'] = m50_R
+
+    @step(reads=('133L', '133R'), writes=('134L', '134R'))
+    def _item_134(self):
+        # Öğe 134 Oran dişlileri: m50'ye en yakın değişim dişlisi dizisi ve hatası
+        from spreadblade_gears import default_gear_index
+        index = default_gear_index()
+        self.set_value('134', 'L', index.describe(self.get_value('133', 'L')))
+        self.set_value('134', 'R', index.describe(self.get_value('133', 'R')))
+
+    @step(reads=('Ra_P', 'Ra_G'), writes=('135L', '135R', 'work_roll_P', 'work_roll_G'))
+    def _item_135(self):
+        # Öğe 135 Test Roll
+        # Varsayılan değerler: Cradle P:20, G:30
+        cradle_roll_P = math.radians(20)
+        cradle_roll_G = math.radians(30)
+        work_roll_P = cradle_roll_P * self.get_value('Ra_P')
+        work_roll_G = cradle_roll_G * self.get_value('Ra_G')
+        self.set_value('135', 'L', f"C:20 W:{math.degrees(work_roll_P):.2f}")
+        self.set_value('135', 'R', f"C:30 W:{math.degrees(work_roll_G):.2f}")
+        self.values['work_roll_P'] = work_roll_P
+        self.values['work_roll_G'] = work_roll_G
+
+    @step(reads=('V', 'sin_q'), writes=('136L', '136R', 'S'))
+    def _item_136(self):
+        # Öğe 136 S
+        S = safe_division(self.get_value('V'), self.get_value('sin_q'))
+        if math.isinf(S): raise ValueError("Öğe 136 hesaplanamadı (sin q sıfır?).")
+        self.set_value('136', 'L', S)
+        self.set_value('136', 'R', S)
+        self.values['S'] = S
+
+    @step(reads=('q',), writes=('137L', '137R', 'Q_LH', 'Q_RH'))
+    def _item_137(self):
+        # Öğe 137 Q
+        q_deg = math.degrees(self.get_value('q'))
+        Q_LH = 360.0 - q_deg
+        Q_RH = q_deg
+        self.set_value('137', 'L', Q_LH) # Sol El
+        self.set_value('137', 'R', Q_RH) # Sağ El
+        self.values['Q_LH'] = Q_LH
+        self.values['Q_RH'] = Q_RH
+
+    @step(reads=(), writes=('138L', '138R', 'K2'))
+    def _item_138(self):
+        # Öğe 138 K2 - seçilen makinenin sabiti (MACHINES; No. 116 = 8.75)
+        K2 = self.machine[1]
+        self.set_value('138', 'L', K2)
+        self.set_value('138', 'R', K2)
+        self.values['K2'] = K2
+
+    @step(reads=('S', 'K2'), writes=('139L', '139R', 'sin_beta_half'))
+    def _item_139(self):
+        # Öğe 139 sin(β/2)
+        sin_beta_half_val = safe_division(self.get_value('S'), 2 * self.get_value('K2'))
+        if math.isinf(sin_beta_half_val): raise ValueError("Öğe 139 hesaplanamadı (K2 sıfır?).")
+        sin_beta_half = clamp_unit(sin_beta_half_val, '139')
+        self.set_value('139', 'L', sin_beta_half)
+        self.set_value('139', 'R', sin_beta_half)
+        self.values['sin_beta_half'] = sin_beta_half
+
+    @step(reads=('sin_beta_half',), writes=('140L', '140R', 'beta_half'))
+    def _item_140(self):
+        # Öğe 140 β/2
+        beta_half = safe_asin(self.get_value('sin_beta_half')) # radyan
+        self.set_value('140', 'L', math.degrees(beta_half))
+        self.set_value('140', 'R', math.degrees(beta_half))
+        self.values['beta_half'] = beta_half # Store for graph maybe?
+
+    @step(reads=('beta_half', 'S', 'K2'), writes=('141L', '141R', 'beta'))
+    def _item_141(self):
+        # Öğe 141 β
+        beta = 2 * self.get_value('beta_half') # radyan
+        self.set_value('141', 'L', math.degrees(beta))
+        self.set_value('141', 'R', math.degrees(beta))
+        self.values['beta'] = beta # Store for graph maybe?
+        # Öğe 139 sıkıştırıldıysa (|S| > 2*K2) veya β makinenin sınırları dışındaysa uyar
+        beta_min, beta_max = self.machine[2]
+        self.set_warning(ECCENTRIC_WARNING, abs(self.get_value('S')) > 2 * self.get_value('K2')
+                         or not beta_min <= abs(math.degrees(beta)) <= beta_max)
+
+    @step(reads=('beta_half', 'q'), writes=('142L', '142R', 'Q_alt_LH', 'Q_alt_RH'))
+    def _item_142(self):
+        # Öğe 142 Q (Alternatif)
+        beta_half = self.get_value('beta_half')
+        q_deg = math.degrees(self.get_value('q'))
+        Q_alt_LH = 270.0 + math.degrees(beta_half) - q_deg # Sol El (-)q
+        Q_alt_RH = 270.0 + math.degrees(beta_half) + q_deg # Sağ El (+)q
+        self.set_value('142', 'L', Q_alt_LH) # Sol El
+        self.set_value('142', 'R', Q_alt_RH) # Sağ El
+        self.values['Q_alt_LH'] = Q_alt_LH
+        self.values['Q_alt_RH'] = Q_alt_RH
+
+    @step(reads=('K2', 'S'), writes=('143L', '143R'))
+    def _item_143(self):
+        sqrt_arg = self.get_value('K2')**2 - self.get_value('S')**2
+        val_143 = safe_sqrt(sqrt_arg)
+        self.set_value('143', 'L', val_143)
+        self.set_value('143', 'R', val_143)
+
+    @step(reads=('Q_alt_LH', 'Q_alt_RH'), writes=('144L', '144R'))
+    def _item_144(self):
+        # Öğe 144 Q (Alternatif 2)
+        Q_alt2_LH = 360.0 - self.get_value('Q_alt_LH')
+        Q_alt2_RH = 360.0 - self.get_value('Q_alt_RH')
+        self.set_value('144', 'L', Q_alt2_LH) # Sol El
+        self.set_value('144', 'R', Q_alt2_RH) # Sağ El
+
+
+# Hesaplama adımları, çalışma sırasıyla. Her adım yalnızca kendisinden önceki
+# adımların yazdığı anahtarları okur; bu sıra bağımlılık grafiğinin topolojik sırasıdır.
+_E = SpreadBladeEngine
+INPUT_STEPS = [
+    _E._pitch, _E._pitch_angles, _E._cone_distances, _E._pressure_angle, _E._spiral_angle,
+    _E._dedendum_angles, _E._clearance,
+]
+SB1_STEPS = [
+    _E._item_1, _E._item_2, _E._item_3, _E._item_4, _E._item_5, _E._item_6, _E._item_7, _E._item_8,
+    _E._item_9, _E._item_10, _E._item_11, _E._item_12, _E._item_13, _E._item_14, _E._item_15, _E._item_16,
+    _E._item_17, _E._item_18, _E._item_19, _E._item_20, _E._item_21, _E._item_22, _E._item_23, _E._item_24,
+    _E._item_25, _E._item_26, _E._item_27, _E._item_28, _E._item_29, _E._items_30_32, _E._items_33_35,
+    _E._item_36, _E._item_37, _E._item_38, _E._item_39, _E._item_40, _E._item_41, _E._item_42, _E._item_43,
+    _E._item_44, _E._item_45, _E._item_46, _E._item_47, _E._item_48,
+]
+SB2_STEPS = [
+    _E._item_82, _E._item_49, _E._item_50, _E._item_51, _E._item_52, _E._item_53, _E._item_54, _E._item_55,
+    _E._item_56, _E._item_57, _E._item_58, _E._item_59, _E._item_60, _E._item_61, _E._item_62, _E._item_63,
+    _E._item_64, _E._item_65, _E._item_66, _E._item_67, _E._item_68, _E._item_69, _E._item_70, _E._item_71,
+    _E._item_72, _E._item_73, _E._item_75, _E._item_74, _E._item_76, _E._item_77, _E._item_78, _E._item_79,
+    _E._item_80, _E._item_81, _E._item_83, _E._item_84, _E._item_85, _E._item_86, _E._item_87, _E._item_88,
+    _E._item_89, _E._item_90, _E._item_91, _E._item_92, _E._item_93, _E._item_94, _E._item_95, _E._item_96,
+]
+SB3_STEPS = [
+    _E._delta_a, _E._item_97, _E._item_98, _E._item_99, _E._item_100, _E._item_101, _E._item_102,
+    _E._item_103, _E._item_104, _E._item_105, _E._item_106, _E._item_107, _E._item_108, _E._item_109,
+    _E._item_110, _E._item_111, _E._item_112, _E._item_113, _E._item_114, _E._item_115, _E._item_116,
+    _E._item_117, _E._item_118, _E._item_119, _E._item_120, _E._item_121, _E._item_122, _E._item_123,
+    _E._item_124, _E._item_125, _E._item_126, _E._item_127, _E._item_128, _E._item_129, _E._item_130,
+    _E._item_131, _E._item_132, _E._item_133, _E._item_134, _E._item_135, _E._item_136, _E._item_137,
+    _E._item_138, _E._item_139, _E._item_140, _E._item_141, _E._item_142, _E._item_143, _E._item_144,
+]
+STEPS = INPUT_STEPS + SB1_STEPS + SB2_STEPS + SB3_STEPS
+# Profiler için aşama yığın adları ve adım adları (bkz. spreadblade_profile)
+def step_names(steps):
+    return tuple(func.__name__.lstrip("_") for func in steps)
+
+STAGE_NAMES = {id(steps): (stage, step_names(steps))
+               for stage, steps in (("engine;inputs", INPUT_STEPS), ("engine;SB1", SB1_STEPS),
+                                    ("engine;SB2", SB2_STEPS), ("engine;SB3", SB3_STEPS))}
+del _E
+
+
+def affected_items(names):
+    """Verilen girdi/değer anahtarları değiştiğinde yeniden hesaplanabilecek öğeler.
+
+    Bağımlılık grafiği üzerinde geçişli kapanıştır; update() ayrıca değeri
+    değişmeyen ara sonuçlarda yayılımı durdurduğundan gerçekte daha az öğe
+    değişebilir.
+    """
+    dirty = set(names)
+    items = set()
+    for func in STEPS:
+        if not func.reads.isdisjoint(dirty):
+            dirty.update(func.writes)
+            items.update(key for key in func.writes if key in ITEM_INDEX)
+    return items
+
+
+def calculate(inputs, machine=DEFAULT_MACHINE):
+    """Tek bir tasarım için SB1-SB3 özetini hesaplar (bkz. SpreadBladeEngine)."""
+    return SpreadBladeEngine(machine=machine).calculate_all(inputs)
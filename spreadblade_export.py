@@ -0,0 +1,358 @@
+"""Toplu hesaplama ve tarama sonuçlarının sütunlu, akış halinde dışa aktarımı.
+
+Sonuçlar bellekte birikmeden parça parça yazılır; her SB öğesi ve tarafı
+ayrı bir sütundur ("47L", "136R"), girdiler ve hata kodu ("error",
+spreadblade_batch.ERRORS indeksi) da sütundur; export_batch iş dosyasından
+aktarılan sütunları ve satır hatalarını ("error_message") da yazabilir. Sayılar tam hassasiyetle
+yazılır, hatalı satırların öğe sütunları NaN'dır. Üç biçim vardır:
+
+    csv     başlık satırı + satırlar (NaN "nan")
+    jsonl   satır başına bir nesne (NaN/inf null)
+    npy     dizin: her sayısal sütun "<sütun>.npy", metin öğeleri (80, 89,
+            107, 132, 134, 135) satır başına bir değer içeren "<sütun>.txt",
+            sütun listesi ve satır sayısı "columns.json"
+
+    export_batch(inputs, "sonuc")                      # uzantısız yol: npy dizini
+    export_sweep("tarama.jsonl", base_inputs, axes, columns=["136L", "141L"])
+    read_columns("sonuc", ["136L", "137L", "141L"])    # S, Q ve beta
+
+read_columns npy dizininden yalnız istenen dosyaları (bellek eşlemeli)
+açar; csv ve jsonl dosyalarında satırlar okunur ama yalnız istenen
+sütunlar tutulur.
+"""
+import csv
+import json
+import math
+import os
+import struct
+
+import numpy as np
+
+from spreadblade_engine import ALL_ITEMS, DEFAULT_MACHINE, TEXT_ITEMS
+from spreadblade_batch import ERRORS, INPUT_NAMES, calculate_batch, input_columns, k1_factor
+from spreadblade_sweep import iter_sweep
+
+FORMATS = ("csv", "jsonl", "npy")
+TEXT = "text" # Metin sütunlarının türü (npy'de .txt dosyası)
+ERROR_COLUMN = "error"
+ERROR_MESSAGE_COLUMN = "error_message" # export_batch(row_errors=...) ile
+
+DEFAULT_CHUNK_SIZE = 50_000
+MANIFEST_NAME = "columns.json"
+MANIFEST_FORMAT = 1
+# .npy başlığı sabit uzunlukta yazılır; satır sayısı kapanışta aynı yere yazılır
+NPY_HEADER_SIZE = 128
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+
+def detect_format(path, fmt=None):
+    """Biçimi uzantıdan belirler (.csv, .jsonl/.ndjson, uzantısız veya .npy = npy dizini)."""
+    if fmt:
+        if fmt not in FORMATS:
+            raise ValueError(f"Bilinmeyen dışa aktarma biçimi: {fmt}")
+        return fmt
+    ext = os.path.splitext(path.rstrip("/\\"))[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext in ("", ".npy"):
+        return "npy"
+    raise ValueError(f"Dışa aktarma biçimi uzantıdan belirlenemedi: {path}")
+
+
+def result_keys(result):
+    """Sonucun öğe anahtarları (tablo sırasıyla; metin öğeleri dahil)."""
+    keys = []
+    for item_num, _, _ in ALL_ITEMS:
+        for side in ("L", "R"):
+            key = f"{item_num}{side}"
+            if key in result.columns or item_num in TEXT_ITEMS:
+                keys.append(key)
+    return keys
+
+
+def result_layout(result, leading=INPUT_NAMES):
+    """Sütun adı -> tür ("<f8", "<i2" veya TEXT): `leading` girdileri, hata kodu ve öğeler."""
+    layout = {name: "<f8" for name in leading}
+    layout[ERROR_COLUMN] = np.dtype(result.error.dtype).str
+    for key in result_keys(result):
+        layout[key] = TEXT if key[:-1] in TEXT_ITEMS else "<f8"
+    return layout
+
+
+def select_layout(layout, columns=None):
+    """`columns` (None = tümü) sırasıyla alt düzen; bilinmeyen sütunda ValueError."""
+    if columns is None:
+        return dict(layout)
+    unknown = [name for name in columns if name not in layout]
+    if unknown:
+        raise ValueError(f"Bilinmeyen sütun(lar): {', '.join(unknown)}")
+    return {name: layout[name] for name in columns}
+
+
+def result_chunk(result, layout, leading):
+    """Bir sonucun `layout` sütunları: ad -> dizi (metin için liste).
+
+    `leading` girdi/tarama sütunlarının dizileridir.
+    """
+    chunk = {}
+    for name, kind in layout.items():
+        if name in leading:
+            chunk[name] = leading[name]
+        elif name == ERROR_COLUMN:
+            chunk[name] = result.error
+        elif kind == TEXT:
+            chunk[name] = result.text_column(name[:-1], name[-1])
+        else:
+            chunk[name] = result.columns[name]
+    return chunk
+
+
+class ColumnWriter:
+    """Sütunlu parça yazıcılarının ortak arayüzü (bağlam yöneticisi).
+
+    `layout` sütun adı -> türdür (bkz. result_layout); write() her parçada
+    tüm sütunları aynı uzunlukta alır. `rows` yazılan satır sayısıdır.
+    """
+    def __init__(self, path, layout):
+        self.path = path
+        self.layout = dict(layout)
+        self.rows = 0
+
+    def write(self, chunk):
+        sizes = {len(chunk[name]) for name in self.layout}
+        if len(sizes) > 1:
+            raise ValueError("Parçadaki sütunların uzunlukları farklı.")
+        size = sizes.pop() if sizes else 0
+        if size:
+            self._write(chunk, size)
+            self.rows += size
+
+    def _write(self, chunk, size):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _python_columns(chunk, layout):
+    """Parçanın sütunları Python listeleri olarak (satır satır yazım için)."""
+    return [chunk[name] if kind == TEXT else np.asarray(chunk[name]).tolist() for name, kind in layout.items()]
+
+
+class CsvColumnWriter(ColumnWriter):
+    def __init__(self, path, layout):
+        super().__init__(path, layout)
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.layout)
+
+    def _write(self, chunk, size):
+        self._writer.writerows(zip(*_python_columns(chunk, self.layout)))
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlColumnWriter(ColumnWriter):
+    def __init__(self, path, layout):
+        super().__init__(path, layout)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def _write(self, chunk, size):
+        columns = []
+        for (name, kind), values in zip(self.layout.items(), _python_columns(chunk, self.layout)):
+            if kind == "<f8" and not np.isfinite(chunk[name]).all():
+                values = [value if math.isfinite(value) else None for value in values]
+            columns.append(values)
+        names = list(self.layout)
+        self._file.writelines(json.dumps(dict(zip(names, row)), ensure_ascii=False) + "\n" for row in zip(*columns))
+
+    def close(self):
+        self._file.close()
+
+
+def _npy_header(dtype, rows):
+    """Sabit uzunlukta (NPY_HEADER_SIZE) .npy 1.0 başlığı."""
+    header = repr({"descr": dtype, "fortran_order": False, "shape": (rows,)})
+    header = header.ljust(NPY_HEADER_SIZE - len(NPY_MAGIC) - 3) + "\n"
+    return NPY_MAGIC + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+class NpyColumnWriter(ColumnWriter):
+    """Her sütun için bir dosya; sayısal sütunlar ham baytlar olarak eklenir."""
+    def __init__(self, path, layout):
+        super().__init__(path, layout)
+        os.makedirs(path, exist_ok=True)
+        self._files = {}
+        try:
+            for name, kind in self.layout.items():
+                if kind == TEXT:
+                    self._files[name] = open(os.path.join(path, name + ".txt"), "w", encoding="utf-8")
+                else:
+                    self._files[name] = f = open(os.path.join(path, name + ".npy"), "wb")
+                    f.write(_npy_header(kind, 0))
+        except OSError:
+            self._close_files()
+            raise
+
+    def _write(self, chunk, size):
+        for name, kind in self.layout.items():
+            if kind == TEXT:
+                self._files[name].writelines(value + "\n" for value in chunk[name])
+            else:
+                self._files[name].write(np.ascontiguousarray(chunk[name], dtype=kind).tobytes())
+
+    def _close_files(self):
+        for f in self._files.values():
+            f.close()
+
+    def close(self):
+        try:
+            for name, kind in self.layout.items():
+                if kind != TEXT:
+                    f = self._files[name]
+                    f.seek(0)
+                    f.write(_npy_header(kind, self.rows))
+        finally:
+            self._close_files()
+        manifest = {"format": MANIFEST_FORMAT, "rows": self.rows, "columns": self.layout,
+                    "errors": [list(error) if error else None for error in ERRORS]}
+        with open(os.path.join(self.path, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+
+
+WRITERS = {"csv": CsvColumnWriter, "jsonl": JsonlColumnWriter, "npy": NpyColumnWriter}
+
+
+def open_writer(path, layout, fmt=None):
+    """Biçime (verilmezse uzantıdan) uygun ColumnWriter."""
+    return WRITERS[detect_format(path, fmt)](path, layout)
+
+
+def _text(value):
+    """Aktarılan değerin metin sütunundaki karşılığı (metin dışı değerler JSON olarak)."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and not math.isfinite(value):
+        return ""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def export_batch(inputs, path, fmt=None, columns=None, chunk_size=DEFAULT_CHUNK_SIZE, k1=k1_factor,
+                 machine=DEFAULT_MACHINE, extra=None, row_errors=None):
+    """Tasarımları parça parça hesaplayıp yazar; (satır, hatalı satır) döndürür.
+
+    `columns` verilirse yalnız bu sütunlar yazılır (bkz. result_layout);
+    Öğe 138-144 `machine` ile hesaplanır. `extra` (ad -> satır değerleri,
+    ör. iş numarası) girdilerden önce metin sütunu olarak aynen yazılır.
+    `row_errors` verilirse (satır başına (başlık, mesaj) veya None, bkz.
+    spreadblade_cli.parse_jobs) hata kodundan sonra "error_message" sütunu
+    bu hatayı, yoksa hesaplama hatasını "başlık: mesaj" olarak yazar.
+    """
+    inputs = input_columns(inputs)
+    size = len(inputs["n"])
+    extra = extra or {}
+    layout = None
+    writer = None
+    failed = 0
+    try:
+        for start in range(0, max(size, 1), chunk_size):
+            stop = start + chunk_size
+            chunk = {name: values[start:stop] for name, values in inputs.items()}
+            result = calculate_batch(chunk, k1, machine)
+            if writer is None:
+                layout = {name: TEXT for name in extra}
+                for name, kind in result_layout(result).items():
+                    layout[name] = kind
+                    if name == ERROR_COLUMN and row_errors is not None:
+                        layout[ERROR_MESSAGE_COLUMN] = TEXT
+                layout = select_layout(layout, columns)
+                writer = open_writer(path, layout, fmt)
+            leading = {name: [_text(value) for value in values[start:stop]] for name, values in extra.items()}
+            leading.update(chunk)
+            if row_errors is None:
+                failed += int(np.count_nonzero(result.error))
+            else:
+                errors = [row_errors[start + i] or result.error_message(i) for i in range(result.size)]
+                leading[ERROR_MESSAGE_COLUMN] = [f"{error[0]}: {error[1]}" if error else "" for error in errors]
+                failed += sum(1 for error in errors if error)
+            writer.write(result_chunk(result, layout, leading))
+    finally:
+        if writer is not None:
+            writer.close()
+    return size, failed
+
+
+def export_sweep(path, base_inputs, axes, fmt=None, columns=None, chunk_size=DEFAULT_CHUNK_SIZE, k1=k1_factor,
+                 cancelled=None, machine=DEFAULT_MACHINE):
+    """Taramayı (bkz. spreadblade_sweep.iter_sweep) parça parça yazar; yazılan satır sayısını döndürür.
+
+    İlk sütunlar taranan girdilerdir. `cancelled` (is_set() sunan bir nesne)
+    parçalar arasında denetlenir; iptalde o ana kadar yazılanlar kalır.
+    """
+    writer = None
+    layout = None
+    try:
+        for chunk in iter_sweep(base_inputs, axes, chunk_size, outputs=(), k1=k1, machine=machine):
+            if cancelled is not None and cancelled.is_set():
+                break
+            if writer is None:
+                layout = select_layout(result_layout(chunk.result, list(axes)), columns)
+                writer = open_writer(path, layout, fmt)
+            writer.write(result_chunk(chunk.result, layout, chunk.params))
+    finally:
+        if writer is not None:
+            writer.close()
+    return writer.rows if writer is not None else 0
+
+
+def read_columns(path, names, fmt=None):
+    """Dışa aktarılmış sonuçtan yalnız `names` sütunlarını okur: ad -> dizi (metin için liste).
+
+    npy dizininde sayısal sütunlar bellek eşlemeli (salt okunur) açılır.
+    """
+    fmt = detect_format(path, fmt)
+    names = list(names)
+    if fmt == "npy":
+        with open(os.path.join(path, MANIFEST_NAME), encoding="utf-8") as f:
+            layout = select_layout(json.load(f)["columns"], names)
+        columns = {}
+        for name, kind in layout.items():
+            if kind == TEXT:
+                with open(os.path.join(path, name + ".txt"), encoding="utf-8") as f:
+                    columns[name] = f.read().splitlines()
+            else:
+                columns[name] = np.load(os.path.join(path, name + ".npy"), mmap_mode="r", allow_pickle=False)
+        return columns
+
+    values = {name: [] for name in names}
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            reader = csv.reader(f)
+            header = next(reader, [])
+            select_layout(dict.fromkeys(header), names)
+            picks = [(values[name], header.index(name)) for name in names]
+            for row in reader:
+                for column, k in picks:
+                    column.append(row[k])
+        else:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    for name in names:
+                        values[name].append(record[name])
+    columns = {}
+    for name, column in values.items():
+        try:
+            columns[name] = np.array([math.nan if value is None else float(value) for value in column])
+        except ValueError: # Metin sütunu
+            columns[name] = column
+    return columns
@@ -0,0 +1,263 @@
+"""Öğe 132/134 oran (değişim) dişlileri için önceden hesaplanmış oran indeksi.
+
+Atölyedeki değişim dişlisi envanterinden kurulabilen tüm 2 dişlili (A/B)
+ve 4 dişlili (A/B x C/D) dizilerin oranları bir kez hesaplanır, sadeleşmiş
+kesir olarak tekilleştirilir ve sıralanır. Öğe 131/133'teki ondalık oran
+(m75, m50) için en yakın dizi ikili arama (searchsorted) ile bulunur ve
+hatası (dizi oranı - ondalık oran) bildirilir:
+
+    index = default_gear_index()
+    match = index.match(result.columns["131L"])
+    index.describe(0.5952)             # "25/42 (+1.2e-05)" gibi
+
+Aynı orana giden diziler arasında 2 dişlili olan tercih edilir. 4 dişlili
+bir dizide aynı diş sayısı envanterdeki adetten fazla kullanılmaz. Oranın
+işareti (dönüş yönü) ara dişliyle sağlanır; eşleme mutlak değerle yapılır.
+
+Envanter varsayılan olarak CHANGE_GEARS'tır; SPREADBLADE_GEARS ortam
+değişkeni "diş sayısı [adet]" satırlarından oluşan bir dosyayı gösterirse o
+okunur. İndeks envanter imzasını içeren bir .npy dosyasında saklanır; dosya
+SPREADBLADE_GEAR_INDEX_DIR dizinine (yoksa ev dizinine) yazılır, değişken
+boşsa indeks yalnızca bellekte tutulur.
+"""
+import functools
+import hashlib
+import math
+import os
+import warnings
+
+import numpy as np
+
+GEAR_INVENTORY_ENV = "SPREADBLADE_GEARS"
+GEAR_INDEX_DIR_ENV = "SPREADBLADE_GEAR_INDEX_DIR"
+
+# Değişim dişlisi envanteri: diş sayısı -> adet
+CHANGE_GEARS = {teeth: 1 for teeth in (
+    20, 24, 25, 28, 30, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50,
+    51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+    75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 92, 95, 96, 97, 98, 100)}
+
+INDEX_FORMAT = 1 # Dosya biçimi veya kurulum kuralları değiştiğinde artırılır
+BUILD_CHUNK = 256 # Kurulumda aynı anda işlenen pay çifti sayısı
+_KEY_SHIFT = 32 # Sadeleşmiş kesir anahtarı: pay << _KEY_SHIFT | payda
+
+
+def read_inventory(path):
+    """Envanter dosyasını {diş sayısı: adet} sözlüğü olarak okur.
+
+    Her satır "diş sayısı" veya "diş sayısı adet" içerir; "#" sonrası yok
+    sayılır. Hatalı satırlarda ValueError fırlatılır.
+    """
+    inventory = {}
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            fields = line.split("#", 1)[0].replace(",", " ").split()
+            if not fields:
+                continue
+            try:
+                if len(fields) > 2:
+                    raise ValueError
+                teeth = int(fields[0])
+                count = int(fields[1]) if len(fields) == 2 else 1
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: 'diş sayısı [adet]' bekleniyordu: {line.strip()}") from None
+            if teeth <= 0 or count < 0:
+                raise ValueError(f"{path}:{line_number}: diş sayısı pozitif, adet negatif olmayan olmalıdır.")
+            inventory[teeth] = inventory.get(teeth, 0) + count
+    return inventory
+
+
+def _canonical(inventory):
+    """Envanterin sıralı (diş sayısı, adet) demeti (adedi sıfır olanlar atılır)."""
+    return tuple(sorted((int(teeth), int(count)) for teeth, count in dict(inventory).items() if count > 0))
+
+
+def inventory_signature(inventory):
+    """Envanterin kısa özeti (dosya adlarında ve önbellek anahtarında)."""
+    text = f"{INDEX_FORMAT};" + ",".join(f"{teeth}:{count}" for teeth, count in _canonical(inventory))
+    return hashlib.sha1(text.encode("ascii")).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=None)
+def default_inventory():
+    """SPREADBLADE_GEARS dosyası veya CHANGE_GEARS (süreç başına bir kez okunur)."""
+    path = os.environ.get(GEAR_INVENTORY_ENV)
+    return _canonical(read_inventory(path) if path else CHANGE_GEARS)
+
+
+@functools.lru_cache(maxsize=None)
+def default_signature():
+    return inventory_signature(default_inventory())
+
+
+def _reduced_keys(numerator, denominator):
+    divisor = np.gcd(numerator, denominator)
+    return (numerator // divisor << _KEY_SHIFT) | (denominator // divisor)
+
+
+def build_trains(inventory):
+    """Envanterden kurulabilen tekil oranlı diziler: (n, 4) [A, B, C, D].
+
+    2 dişlili dizilerde C = D = 0'dır. Diziler orana göre sıralıdır.
+    """
+    canonical = _canonical(inventory)
+    if not canonical:
+        raise ValueError("Değişim dişlisi envanteri boş.")
+    teeth = np.array([t for t, _ in canonical], dtype=np.int64)
+    count = np.array([c for _, c in canonical], dtype=np.int64)
+    size = len(teeth)
+
+    # 2 dişlili: A/B (A = B yalnızca iki adet varsa)
+    a, b = (x.ravel() for x in np.indices((size, size)))
+    usable = (a != b) | (count[a] >= 2)
+    a, b = a[usable], b[usable]
+    keys = [_reduced_keys(teeth[a], teeth[b])]
+    zeros = np.zeros(len(a), dtype=np.int64)
+    trains = [np.stack([teeth[a], teeth[b], zeros, zeros], axis=1)]
+
+    # 4 dişlili: (A*C)/(B*D); pay ve payda sırasız çiftlerdir (i <= j)
+    i, j = np.triu_indices(size)
+    usable = (i < j) | (count[i] >= 2)
+    i, j = i[usable], j[usable]
+    products = teeth[i] * teeth[j]
+    b, d = i[None, :], j[None, :]
+    for start in range(0, len(i), BUILD_CHUNK):
+        a, c = i[start:start + BUILD_CHUNK, None], j[start:start + BUILD_CHUNK, None]
+        # Her diş sayısı dizide envanterdeki adetten fazla kullanılamaz
+        valid = np.ones(np.broadcast_shapes(a.shape, b.shape), dtype=bool)
+        for gear, others in ((a, (c, b, d)), (c, (a, b, d)), (b, (a, c, d)), (d, (a, b, c))):
+            uses = 1 + sum((gear == other).astype(np.int64) for other in others)
+            valid &= uses <= count[gear]
+        flat = np.flatnonzero(valid)
+        chunk_keys = _reduced_keys(products[start:start + BUILD_CHUNK, None], products[None, :]).ravel()[flat]
+        chunk_keys, first = np.unique(chunk_keys, return_index=True)
+        rows, columns = np.divmod(flat[first], len(i))
+        rows += start
+        keys.append(chunk_keys)
+        trains.append(np.stack([teeth[i[rows]], teeth[i[columns]], teeth[j[rows]], teeth[j[columns]]], axis=1))
+
+    # Aynı oran için ilk aday (önce 2 dişlililer) kalır
+    _, first = np.unique(np.concatenate(keys), return_index=True)
+    trains = np.concatenate(trains)[first]
+    order = np.argsort(train_ratios(trains), kind="stable")
+    return trains[order].astype(np.uint16)
+
+
+def train_ratios(trains):
+    """Dizilerin oranları: A/B veya (A*C)/(B*D)."""
+    trains = np.asarray(trains, dtype=np.int64)
+    A, B, C, D = trains.T
+    return (A * np.maximum(C, 1)) / (B * np.maximum(D, 1))
+
+
+class GearMatch:
+    """Ondalık oranlar için en yakın diziler.
+
+    `index` GearIndex.trains satırıdır (oran sonlu ve sıfırdan farklı değilse
+    -1), `ratio` dizinin oranı, `error` dizi oranı - |ondalık oran|'dır.
+    """
+    def __init__(self, index, ratio, error):
+        self.index = index
+        self.ratio = ratio
+        self.error = error
+        self.size = len(index)
+
+
+class GearIndex:
+    """Sıralı oran indeksi; `ratios` artan sırada, `trains[k]` k. oranın dizisi."""
+    def __init__(self, trains, signature=None):
+        self.trains = trains
+        self.ratios = train_ratios(trains)
+        self.signature = signature
+        self.two_gear = int(np.count_nonzero(trains[:, 2] == 0))
+
+    def __len__(self):
+        return len(self.ratios)
+
+    def match(self, values):
+        """Her |değer| için en yakın dizi (GearMatch)."""
+        target = np.abs(np.asarray(values, dtype=float)).ravel()
+        usable = np.isfinite(target) & (target > 0)
+        ratios = self.ratios
+        upper = np.minimum(np.searchsorted(ratios, target), len(ratios) - 1)
+        lower = np.maximum(upper - 1, 0)
+        with np.errstate(invalid='ignore'):
+            nearest = np.where(np.abs(ratios[lower] - target) <= np.abs(ratios[upper] - target), lower, upper)
+        index = np.where(usable, nearest, -1)
+        ratio = np.where(usable, ratios[nearest], np.nan)
+        return GearMatch(index, ratio, ratio - np.where(usable, target, np.nan))
+
+    def train_text(self, k):
+        """k. dizinin gösterimi: "A/B" veya "A/B x C/D"."""
+        A, B, C, D = self.trains[k].tolist()
+        return f"{A}/{B}" if C == 0 else f"{A}/{B} x {C}/{D}"
+
+    def describe(self, value):
+        """Tek bir ondalık oran için öğe 132/134 metni; oran yoksa "-"."""
+        target = abs(value)
+        if not (0.0 < target < math.inf):
+            return "-"
+        ratios = self.ratios # Skaler yol: NumPy skalerleri yerine Python float'ları
+        upper = min(int(ratios.searchsorted(target)), len(ratios) - 1)
+        lower = max(upper - 1, 0)
+        below, above = ratios.item(lower), ratios.item(upper)
+        k, ratio = (lower, below) if abs(below - target) <= abs(above - target) else (upper, above)
+        return f"{self.train_text(k)} ({ratio - target:+.1e})"
+
+    def describe_column(self, values, match=None):
+        """describe() ile aynı biçimde metin listesi (eşleme verilebilir)."""
+        match = self.match(values) if match is None else match
+        return [self.train_text(k) + " (%+.1e)" % error if k >= 0 else "-"
+                for k, error in zip(match.index.tolist(), match.error.tolist())]
+
+
+def gear_index_path(signature):
+    """İndeks dosyasının yolu; SPREADBLADE_GEAR_INDEX_DIR boşsa "" (dosya yok)."""
+    directory = os.environ.get(GEAR_INDEX_DIR_ENV)
+    if directory is None:
+        directory = os.path.expanduser("~")
+    return os.path.join(directory, f".spreadblade_gears_{signature}.npy") if directory else ""
+
+
+def load_gear_index(path, inventory, signature=None):
+    """Kayıtlı indeksi okur; biçim uymuyorsa veya envanterle tutmuyorsa None."""
+    try:
+        trains = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if trains.ndim != 2 or trains.shape[1] != 4 or trains.dtype != np.uint16 or not len(trains):
+        return None
+    index = GearIndex(trains, signature)
+    teeth = np.array([t for t, _ in _canonical(inventory)] + [0])
+    if not (np.all(np.isin(trains, teeth)) and np.all(np.diff(index.ratios) > 0)):
+        return None
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _open(inventory, path):
+    signature = inventory_signature(inventory)
+    path = gear_index_path(signature) if path is None else path
+    index = load_gear_index(path, inventory, signature) if path and os.path.exists(path) else None
+    if index is None:
+        index = GearIndex(build_trains(inventory), signature)
+        if path:
+            try:
+                np.save(path, index.trains, allow_pickle=False)
+            except OSError as e:
+                warnings.warn(f"Değişim dişlisi indeksi kaydedilemedi ({e}).", RuntimeWarning, stacklevel=3)
+    return index
+
+
+def open_gear_index(inventory=None, path=None):
+    """Envanterin indeksini dosyadan açar, yoksa kurup kaydeder (süreç başına bir kez).
+
+    `inventory` verilmezse default_inventory(), `path` verilmezse
+    gear_index_path() kullanılır; `path` "" ise indeks diske yazılmaz.
+    """
+    return _open(default_inventory() if inventory is None else _canonical(inventory), path)
+
+
+def default_gear_index():
+    """Öğe 132/134'ün kullandığı indeks (varsayılan envanter)."""
+    return _open(default_inventory(), None)
@@ -0,0 +1,203 @@
+"""Öğe 67 K1 faktörü için önceden hesaplanmış (R/a, phi) tablosu.
+
+Toplu hesaplama ve taramalarda K1, her satır için arccos/sin/cos/tan
+yerine bu tablodan okunabilir. Tablo log(R/a) ve phi eksenlerinde düzgün
+bir ızgaradır; düğümlerde K1 ve iki eksendeki türevleri saklanır. Arama
+R/a yönünde Fritsch-Carlson sınırlamalı (monoton) kübik Hermite, phi
+yönünde kübik Hermite enterpolasyonudur. Tablo kurulurken her hücrenin iç
+noktalarında tam formülle karşılaştırılır; ölçülen en büyük mutlak hata
+K1_TABLE_TOLERANCE'ı aşarsa tablo kullanılmaz. Tablo alanının dışındaki
+(veya sonlu olmayan) değerler için tam formül kullanılır:
+
+    table = open_k1_table()
+    result = calculate_batch(inputs, k1=table)
+
+Tablo isteğe bağlıdır; varsayılan K1 çekirdeği tam formüldür (k1_factor).
+Tablo istendiğinde bir kez kurulup .npy dosyası olarak saklanır. Dosya
+SPREADBLADE_K1_TABLE ortam değişkeninin gösterdiği yola, değişken yoksa
+~/.spreadblade_k1_v<FORMULA_VERSION>.npy'ye yazılır; değişken boşsa tablo
+yalnızca bellekte tutulur. K1 formülü değiştiğinde sürüm artırılmalıdır.
+"""
+import functools
+import math
+import os
+import warnings
+
+import numpy as np
+
+from spreadblade_engine import FORMULA_VERSION
+from spreadblade_batch import k1_factor
+
+# Tablo alanı: R/a oranı (log ölçekli) ve basınç açısı phi (rad)
+K1_TABLE_RATIO_RANGE = (0.1, 1.0e4)
+K1_TABLE_PHI_RANGE = (math.radians(10.0), math.radians(35.0))
+K1_TABLE_SHAPE = (51, 1024) # (phi düğümleri, R/a düğümleri)
+# Tam formüle göre izin verilen en büyük mutlak hata
+K1_TABLE_TOLERANCE = 1.0e-8
+# Türevler için merkezi fark adımı (log(R/a) ve phi birimlerinde)
+DERIVATIVE_STEP = 1.0e-5
+
+K1_TABLE_ENV = "SPREADBLADE_K1_TABLE"
+
+
+def _grid():
+    u = np.linspace(math.log(K1_TABLE_RATIO_RANGE[0]), math.log(K1_TABLE_RATIO_RANGE[1]), K1_TABLE_SHAPE[1])
+    phi = np.linspace(K1_TABLE_PHI_RANGE[0], K1_TABLE_PHI_RANGE[1], K1_TABLE_SHAPE[0])
+    return u, phi
+
+
+def _monotone_slopes(K, dK, du):
+    """Fritsch-Carlson: R/a yönündeki türevleri satırlar monoton kalacak şekilde sınırlar."""
+    dK = dK.copy()
+    delta = np.diff(K, axis=1)
+    # Yerel ekstremumlarda ve sekantla ters işaretli türevlerde eğim sıfır
+    dK[:, 1:-1][delta[:, :-1] * delta[:, 1:] <= 0] = 0.0
+    dK[:, :-1][dK[:, :-1] * delta < 0] = 0.0
+    dK[:, 1:][dK[:, 1:] * delta < 0] = 0.0
+    with np.errstate(all='ignore'):
+        alpha = np.where(delta != 0, dK[:, :-1] * du / delta, 0.0)
+        beta = np.where(delta != 0, dK[:, 1:] * du / delta, 0.0)
+        radius = np.hypot(alpha, beta)
+        tau = np.where(radius > 3.0, 3.0 / radius, 1.0)
+    # Her düğüm, komşu iki aralıktan küçük olan katsayıyla ölçeklenir
+    scale = np.ones_like(dK)
+    scale[:, :-1] = tau
+    scale[:, 1:] = np.minimum(scale[:, 1:], tau)
+    return dK * scale
+
+
+def build_nodes():
+    """Düğüm değerleri: (3, phi, R/a) dizisi [K1, dK1/du, dK1/dphi] (u = log(R/a))."""
+    u, phi = _grid()
+    h = DERIVATIVE_STEP
+    P = phi[:, None]
+    K = k1_factor(np.exp(u)[None, :], P)
+    dK = (k1_factor(np.exp(u + h)[None, :], P) - k1_factor(np.exp(u - h)[None, :], P)) / (2 * h)
+    dP = (k1_factor(np.exp(u)[None, :], P + h) - k1_factor(np.exp(u)[None, :], P - h)) / (2 * h)
+    return np.stack([K, _monotone_slopes(K, dK, u[1] - u[0]), dP])
+
+
+class K1Table:
+    """K1(R/a, phi) tablo araması; k1_factor ile aynı imzayla çağrılır.
+
+    `error_bound` kurulumda hücre iç noktalarında ölçülen en büyük mutlak
+    hatadır. `lookups` tablodan, `fallbacks` tam formülle hesaplanan
+    değer sayısıdır.
+    """
+    def __init__(self, nodes):
+        u, phi = _grid()
+        self.nodes = nodes
+        self.u0 = u[0]
+        self.du = u[1] - u[0]
+        self.phi0 = phi[0]
+        self.dphi = phi[1] - phi[0]
+        self.cells = K1_TABLE_SHAPE[1] - 1
+        # Hücre başına R/a yönündeki kübik katsayılar ve phi türevinin doğrusal katsayıları
+        K, dK, dP = nodes[0], nodes[1] * self.du, nodes[2] * self.dphi
+        f0, f1, d0, d1 = K[:, :-1], K[:, 1:], dK[:, :-1], dK[:, 1:]
+        self._coefficients = [np.ascontiguousarray(c).ravel() for c in (
+            f0, d0, 3 * (f1 - f0) - 2 * d0 - d1, 2 * (f0 - f1) + d0 + d1, dP[:, :-1], dP[:, 1:] - dP[:, :-1])]
+        self.lookups = 0
+        self.fallbacks = 0
+        self.error_bound = self.measure_error()
+
+    def interpolate(self, R_a, phi):
+        """Tablo alanı içindeki değerler için enterpolasyon (alan kontrolü yapılmaz)."""
+        s = (np.log(R_a) - self.u0) / self.du
+        i = np.minimum(s.astype(np.intp), self.cells - 1)
+        t = s - i
+        r = (phi - self.phi0) / self.dphi
+        j = np.minimum(r.astype(np.intp), K1_TABLE_SHAPE[0] - 2)
+        w = r - j
+        ia = j * self.cells + i
+        ib = ia + self.cells
+        c0, c1, c2, c3, d0, d1 = self._coefficients
+        a = ((c3.take(ia) * t + c2.take(ia)) * t + c1.take(ia)) * t + c0.take(ia)
+        b = ((c3.take(ib) * t + c2.take(ib)) * t + c1.take(ib)) * t + c0.take(ib)
+        da = d1.take(ia) * t + d0.take(ia)
+        db = d1.take(ib) * t + d0.take(ib)
+        return a + w * (da + w * (3 * (b - a) - 2 * da - db + w * (2 * (a - b) + da + db)))
+
+    def __call__(self, R_a, phi):
+        R_a, phi = np.asarray(R_a, dtype=float), np.asarray(phi, dtype=float)
+        with np.errstate(all='ignore'):
+            # Hızlı yol: tümü alan içinde (NaN varsa min/max karşılaştırmaları başarısız olur).
+            # phi yayınlanmadan kullanılır; phi'ye bağlı indeksler bir kez hesaplanır.
+            if (R_a.size and phi.size and K1_TABLE_RATIO_RANGE[0] <= R_a.min() and R_a.max() <= K1_TABLE_RATIO_RANGE[1]
+                    and K1_TABLE_PHI_RANGE[0] <= phi.min() and phi.max() <= K1_TABLE_PHI_RANGE[1]):
+                K1 = self.interpolate(R_a, phi)
+                self.lookups += K1.size
+                return K1
+            R_a, phi = np.broadcast_arrays(R_a, phi)
+            inside = ((R_a >= K1_TABLE_RATIO_RANGE[0]) & (R_a <= K1_TABLE_RATIO_RANGE[1])
+                      & (phi >= K1_TABLE_PHI_RANGE[0]) & (phi <= K1_TABLE_PHI_RANGE[1]))
+            K1 = np.empty(R_a.shape)
+            K1[inside] = self.interpolate(R_a[inside], phi[inside])
+            outside = ~inside
+            K1[outside] = k1_factor(R_a[outside], phi[outside])
+        self.lookups += int(inside.sum())
+        self.fallbacks += int(outside.sum())
+        return K1
+
+    def measure_error(self):
+        """Her hücrenin iç noktalarında tam formüle göre en büyük mutlak hata."""
+        u, phi = _grid()
+        fractions = np.array([0.25, 0.5, 0.75])
+        su = (u[:-1, None] + fractions * self.du).ravel()
+        sp = (phi[:-1, None] + fractions * self.dphi).ravel()
+        R_a, P = np.exp(su)[None, :], sp[:, None]
+        R_a, P = np.broadcast_arrays(R_a, P)
+        with np.errstate(all='ignore'):
+            return float(np.max(np.abs(self.interpolate(R_a, P) - k1_factor(R_a, P))))
+
+
+def load_k1_table(path):
+    """Kayıtlı tabloyu okur; biçim uymuyorsa veya düğümler formülle tutmuyorsa None."""
+    try:
+        nodes = np.load(path, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if nodes.shape != (3,) + K1_TABLE_SHAPE or nodes.dtype != np.float64:
+        return None
+    # Eski/bozuk dosyalara karşı birkaç düğümü yeniden hesapla
+    u, phi = _grid()
+    rows = np.array([0, K1_TABLE_SHAPE[0] // 2, K1_TABLE_SHAPE[0] - 1])
+    columns = np.array([0, K1_TABLE_SHAPE[1] // 3, K1_TABLE_SHAPE[1] - 1])
+    if not np.allclose(nodes[0][rows, columns], k1_factor(np.exp(u[columns]), phi[rows]), rtol=0, atol=1e-15):
+        return None
+    return K1Table(nodes)
+
+
+def k1_table_path():
+    """SPREADBLADE_K1_TABLE veya ev dizinindeki sürümlü dosya ("" ise dosya yok)."""
+    path = os.environ.get(K1_TABLE_ENV)
+    if path is None:
+        path = os.path.join(os.path.expanduser("~"), f".spreadblade_k1_v{FORMULA_VERSION}.npy")
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def _open(path):
+    table = load_k1_table(path) if path and os.path.exists(path) else None
+    if table is None:
+        table = K1Table(build_nodes())
+        if path:
+            try:
+                np.save(path, table.nodes, allow_pickle=False)
+            except OSError as e:
+                warnings.warn(f"K1 tablosu kaydedilemedi ({e}).", RuntimeWarning, stacklevel=3)
+    if table.error_bound > K1_TABLE_TOLERANCE:
+        warnings.warn(f"K1 tablosunun hatası ({table.error_bound:.2e}) sınırı aşıyor; tam formül kullanılacak.",
+                      RuntimeWarning, stacklevel=3)
+        return k1_factor
+    return table
+
+
+def open_k1_table(path=None):
+    """Tabloyu dosyadan açar, yoksa kurup kaydeder (yol başına bir kez).
+
+    `path` verilmezse k1_table_path() kullanılır; "" ise dosya okunmaz ve
+    yazılmaz. Hata sınırı K1_TABLE_TOLERANCE'ı aşarsa tam formül
+    (k1_factor) döner.
+    """
+    return _open(k1_table_path() if path is None else path)
@@ -0,0 +1,137 @@
+"""Makine kataloğundaki tüm makineler için eksantrik ve kızak açısı ayarları.
+
+Her tasarımın radyal ayarı S (Öğe 136) ve q açısı (Öğe 127), katalogdaki
+her makine için tek bir vektörel geçişte değerlendirilir; sonuç (tasarım x
+makine) dizileridir:
+
+    fit = evaluate_result(calculate_batch(inputs))
+    fit.feasible[:, j]         # j. makinede kesilebilen tasarımlar
+    fit.machine_names(i)       # i. tasarımı kesebilen makineler
+    fit.first()                # katalog sırasıyla ilk uygun makine (-1 = yok)
+
+Bir makine tasarımı, Öğe 139 sıkıştırılmadan (|S| <= 2*K2) ve eksantrik açı
+|β| makinenin sınırları içinde kalıyorsa keser. Ayarlar Öğe 139-144
+formülleriyle makinenin K2'si ve kızak açısı kuralına göre hesaplanır;
+uygun olmayan makinelerde NaN'dır. Katalog varsayılan olarak
+spreadblade_engine.default_machines()'tir (MACHINES ve SPREADBLADE_MACHINES). Seçilen makine için değerler
+calculate_batch'in Öğe 141 ve kuralın öğesiyle (137, 142 veya 144) aynıdır.
+"""
+import numpy as np
+
+from spreadblade_engine import CRADLE_CONVENTIONS, default_machines
+
+# Uygunluk kodları (tasarım x makine)
+FIT_OK = 0
+FIT_ECCENTRIC = 1
+FIT_BETA_RANGE = 2
+FIT_DESIGN_ERROR = 3
+FIT_REASONS = [
+    "Uygun",
+    "|S| > 2*K2: eksantrik yetmiyor (Öğe 139 sıkıştırılır)",
+    "Eksantrik açı makinenin sınırları dışında",
+    "Tasarım hesaplanamadı",
+]
+
+
+def machine_columns(machines=None):
+    """Katalog dizileri: K2, β alt/üst sınırı (°) ve kızak açısı kuralının CRADLE_CONVENTIONS indeksi."""
+    machines = default_machines() if machines is None else machines
+    K2 = np.array([K2 for _, K2, _, _ in machines], dtype=float)
+    beta_min = np.array([limits[0] for _, _, limits, _ in machines], dtype=float)
+    beta_max = np.array([limits[1] for _, _, limits, _ in machines], dtype=float)
+    convention = np.array([CRADLE_CONVENTIONS.index(rule) for _, _, _, rule in machines])
+    return K2, beta_min, beta_max, convention
+
+
+class MachineFit:
+    """m tasarım x k makine uygunluğu ve ayarları.
+
+    `reason` FIT_* kodudur; `beta`, `Q_LH` ve `Q_RH` (°) makinenin eksantrik
+    açısı ve kızak açısı kuralına göre sol/sağ el kızak ayarıdır.
+    """
+    def __init__(self, machines, reason, beta, Q_LH, Q_RH):
+        self.machines = list(machines)
+        self.reason = reason
+        self.beta = beta
+        self.Q_LH = Q_LH
+        self.Q_RH = Q_RH
+        self.size = len(reason)
+
+    @property
+    def names(self):
+        return [name for name, _, _, _ in self.machines]
+
+    @property
+    def feasible(self):
+        return self.reason == FIT_OK
+
+    def machine_names(self, i):
+        """i. tasarımı kesebilen makinelerin adları (katalog sırasıyla)."""
+        return [name for name, ok in zip(self.names, self.feasible[i]) if ok]
+
+    def first(self):
+        """Tasarım başına ilk uygun makinenin indeksi; uygun makine yoksa -1."""
+        feasible = self.feasible
+        return np.where(feasible.any(axis=1), feasible.argmax(axis=1), -1)
+
+    def counts(self):
+        """Makine adı -> kesebildiği tasarım sayısı."""
+        return dict(zip(self.names, self.feasible.sum(axis=0).tolist()))
+
+    def settings(self, i, j):
+        """i. tasarımın j. makinedeki ayarları (sözlük)."""
+        name, K2, _, rule = self.machines[j]
+        return {"machine": name, "K2": K2, "cradle_item": rule, "reason": FIT_REASONS[self.reason[i, j]],
+                "beta": float(self.beta[i, j]), "Q_LH": float(self.Q_LH[i, j]), "Q_RH": float(self.Q_RH[i, j])}
+
+
+def evaluate_machines(S, q_deg, valid=None, machines=None):
+    """S ve q (°) dizileri için tüm makinelerin uygunluğu ve ayarları (MachineFit).
+
+    `valid` False olan satırlar (hatalı tasarımlar) hiçbir makineye uygun
+    değildir. `machines` verilmezse default_machines() kullanılır.
+    """
+    machines = default_machines() if machines is None else machines
+    K2, beta_min, beta_max, convention = machine_columns(machines)
+    S = np.asarray(S, dtype=float).ravel()[:, None]
+    q_deg = np.asarray(q_deg, dtype=float).ravel()[:, None]
+    with np.errstate(all='ignore'):
+        sin_beta_half = S / (2 * K2)
+        eccentric = np.abs(sin_beta_half) <= 1.0 # NaN satırlar da False
+        beta_half = np.degrees(np.arcsin(np.where(eccentric, sin_beta_half, np.nan)))
+        beta = 2 * beta_half
+        in_range = (np.abs(beta) >= beta_min) & (np.abs(beta) <= beta_max)
+        # Öğe 137, 142 ve 144 kızak açısı kuralları
+        alt_LH = 270.0 + beta_half - q_deg
+        alt_RH = 270.0 + beta_half + q_deg
+        Q_LH = np.choose(convention, [360.0 - q_deg, alt_LH, 360.0 - alt_LH])
+        Q_RH = np.choose(convention, [q_deg, alt_RH, 360.0 - alt_RH])
+    reason = np.where(eccentric, np.where(in_range, FIT_OK, FIT_BETA_RANGE), FIT_ECCENTRIC).astype(np.int8)
+    design_ok = np.isfinite(S[:, 0]) & np.isfinite(q_deg[:, 0])
+    if valid is not None:
+        design_ok &= np.asarray(valid, dtype=bool).ravel()
+    reason[~design_ok] = FIT_DESIGN_ERROR
+    usable = reason == FIT_OK
+    return MachineFit(machines, reason, np.where(usable, beta, np.nan),
+                      np.where(usable, Q_LH, np.nan), np.where(usable, Q_RH, np.nan))
+
+
+def evaluate_result(result, machines=None):
+    """Toplu hesaplama sonucunun (BatchResult) tüm makinelerdeki uygunluğu."""
+    return evaluate_machines(result.columns["136L"], result.columns["127L"], result.ok, machines)
+
+
+def machine_output_columns(fit):
+    """Toplu çıktı için sütunlar: ("<makine>:beta/Q_LH/Q_RH" -> dizi, "machine(s)" -> metin listesi)."""
+    numeric = {}
+    for j, name in enumerate(fit.names):
+        numeric[f"{name}:beta"] = fit.beta[:, j]
+        numeric[f"{name}:Q_LH"] = fit.Q_LH[:, j]
+        numeric[f"{name}:Q_RH"] = fit.Q_RH[:, j]
+    names = fit.names
+    first = fit.first().tolist()
+    text = {
+        "machine": [names[j] if j >= 0 else "" for j in first],
+        "machines": ["|".join(name for name, ok in zip(names, row) if ok) for row in fit.feasible.tolist()],
+    }
+    return numeric, text
@@ -0,0 +1,153 @@
+"""Standart kesici yarıçapı ve spiral açısının otomatik seçimi.
+
+Verilen dişli çifti (n, N, Pd, F ve diğer girdiler) için kesici
+kataloğundaki (spreadblade_cutters) yarıçaplar ile spiral açısı aralığı
+taranır; yüzey kavrama oranı mF
+(Öğe 122) ve kesici kenar yarıçapı rE (Öğe 78) en büyük olacak şekilde
+seçim yapılır. Bıçak sayısı NB (Öğe 96) ve rE her aday için aynı
+kataloğun o kesicisinden gelir. Uygun olmayan adaylar elenir:
+
+- Kesicide pinyon ve dişli için bıçak ucu WB (Öğe 50) ve kenar yarıçapı
+  rE (Öğe 78) bulunmalıdır.
+- Pinyon kaba nokta genişliği, SB1'deki minimum kontrolü (rc >= 3 için
+  WRP >= 0.040) uygulanmadan önce de minimumun üstünde olmalıdır.
+- S eksantrik sınırını aşmamalıdır: |S| <= 2*K2 (kırpılmamış Öğe 139).
+
+Arama iki aşamalıdır: kaba ızgara tüm kesicileri tek vektörel hesapla
+değerlendirir, ardından yalnızca uygun Pareto adaylarının çevresi ince
+adımla yeniden taranır:
+
+    result = optimize(inputs)
+    result.best.rc, result.best.psi_deg, result.best.NB
+"""
+import numpy as np
+
+from spreadblade_engine import DEFAULT_MACHINE, STOCK_ALLOWANCE, find_machine
+from spreadblade_batch import calculate_batch, input_columns
+from spreadblade_cutters import default_cutter_catalog
+
+SPIRAL_ANGLE_RANGE = (20.0, 45.0)
+COARSE_STEP = 1.0
+FINE_STEP = 0.1
+
+# Nokta genişliği kontrolünde kullanılan öğe: WLP = min(Wop, Wip)
+POINT_WIDTH_ITEM = "47L"
+MIN_ROUGH_POINT_WIDTH = 0.040 # rc >= 3.0 için (SB1, Öğe 48)
+
+
+class Candidate:
+    """Tek bir (kesici yarıçapı, spiral açısı) adayı ve sonuçları."""
+    def __init__(self, rc, psi_deg, NB, mF, rE, WRP, S):
+        self.rc = rc
+        self.psi_deg = psi_deg
+        self.NB = NB
+        self.mF = mF
+        self.rE = rE
+        self.WRP = WRP
+        self.S = S
+
+    def __repr__(self):
+        return (f"Candidate(rc={self.rc}, psi_deg={self.psi_deg:.2f}, NB={self.NB}, "
+                f"mF={self.mF:.4f}, rE={self.rE:.4f}, WRP={self.WRP:.3f}, S={self.S:.4f})")
+
+
+class OptimizationResult:
+    """Optimizasyon sonucu.
+
+    `front` mF ve rE bakımından baskın olmayan uygun adaylardır (mF'ye göre
+    azalan sırada), `best` seçilen adaydır (uygun aday yoksa None).
+    `evaluated` ve `feasible` hesaplanan ve uygun bulunan nokta sayılarıdır.
+    """
+    def __init__(self, best, front, evaluated, feasible):
+        self.best = best
+        self.front = front
+        self.evaluated = evaluated
+        self.feasible = feasible
+
+
+def rough_point_width(width, rc):
+    """SB1 kuralıyla yuvarlanmış kaba nokta genişliği (minimum uygulanmadan)."""
+    step = np.where(rc == 1.75, 0.005, 0.010)
+    return np.round((width - STOCK_ALLOWANCE) / step) * step
+
+
+def feasible_mask(result, rc, machine=DEFAULT_MACHINE):
+    """Hatasız, nokta genişliği ve eksantrik sınırı içindeki satırlar.
+
+    Katalogda iki taraf için de WB'si (Öğe 50) ve rE'si (Öğe 78) olmayan
+    satırlar elenir.
+    """
+    WRP = rough_point_width(result.columns[POINT_WIDTH_ITEM], rc)
+    width_ok = np.where(rc >= 3.0, WRP >= MIN_ROUGH_POINT_WIDTH - 1e-9, WRP > 0)
+    S = result.columns["136L"]
+    blade_ok = np.ones(len(rc), dtype=bool)
+    for key in ("50L", "50R", "78L", "78R"):
+        blade_ok &= np.isfinite(result.columns[key])
+    return (result.error == 0) & width_ok & blade_ok & (np.abs(S) <= 2 * find_machine(machine)[1]), WRP
+
+
+def pareto_front(mF, rE):
+    """mF ve rE'yi birlikte büyütmede baskın olmayan indeksler (mF azalan)."""
+    order = np.lexsort((-rE, -mF))
+    front = []
+    best_rE = -np.inf
+    for i in order.tolist():
+        if rE[i] > best_rE:
+            front.append(i)
+            best_rE = rE[i]
+    return front
+
+
+def _evaluate(base, rc, psi, machine):
+    result = calculate_batch({**base, "rc": rc, "psi_deg": psi}, machine=machine)
+    ok, WRP = feasible_mask(result, rc, machine)
+    return {
+        "rc": rc[ok], "psi": psi[ok], "WRP": WRP[ok],
+        "NB": result.columns["96L"][ok], "mF": result.columns["122L"][ok],
+        "rE": result.columns["78L"][ok], "S": result.columns["136L"][ok],
+    }, len(rc)
+
+
+def optimize(inputs, radii=None, psi_range=SPIRAL_ANGLE_RANGE,
+             coarse_step=COARSE_STEP, fine_step=FINE_STEP, min_face_contact=None, machine=DEFAULT_MACHINE):
+    """En iyi standart kesici yarıçapı / spiral açısı / bıçak sayısını bulur.
+
+    `inputs` arayüzdeki 14 girdinin tek tasarımlık değerleridir; rc ve
+    psi_deg aranır; `radii` verilmezse kesici kataloğunun yarıçapları
+    denenir. Eksantrik sınırı `machine`ın (default_machines()'teki ad) K2'siyle
+    denetlenir. `min_face_contact` verilirse mF bu değerin üstündeki
+    adaylar arasından rE'si en büyük olan seçilir, aksi halde mF'si en
+    büyük (eşitlikte rE'si büyük) aday seçilir.
+    """
+    base = {name: float(values[0]) for name, values in input_columns(inputs).items()
+            if name not in ("rc", "psi_deg")}
+    radii = np.asarray(default_cutter_catalog().radii if radii is None else radii, dtype=float)
+    lo, hi = psi_range
+
+    # 1) Kaba ızgara: tüm kesiciler tek hesapta
+    coarse = np.arange(lo, hi + coarse_step / 2, coarse_step)
+    rc, psi = (a.ravel() for a in np.meshgrid(radii, coarse, indexing="ij"))
+    found, evaluated = _evaluate(base, rc, psi, machine)
+
+    # 2) İnce tarama: yalnızca uygun Pareto adaylarının komşuluğu
+    if len(found["rc"]):
+        front = pareto_front(found["mF"], found["rE"])
+        offsets = np.arange(-coarse_step, coarse_step + fine_step / 2, fine_step)
+        fine_rc = np.repeat(found["rc"][front], len(offsets))
+        fine_psi = np.clip((found["psi"][front][:, None] + offsets).ravel(), lo, hi)
+        fine, count = _evaluate(base, fine_rc, fine_psi, machine)
+        evaluated += count
+        found = {key: np.concatenate([found[key], fine[key]]) for key in found}
+
+    if not len(found["rc"]):
+        return OptimizationResult(None, [], evaluated, 0)
+
+    front = [Candidate(float(found["rc"][i]), float(found["psi"][i]), int(found["NB"][i]),
+                       float(found["mF"][i]), float(found["rE"][i]), float(found["WRP"][i]),
+                       float(found["S"][i]))
+             for i in pareto_front(found["mF"], found["rE"])]
+    best = front[0]
+    if min_face_contact is not None:
+        eligible = [c for c in front if c.mF >= min_face_contact]
+        best = max(eligible, key=lambda c: c.rE) if eligible else None
+    return OptimizationResult(best, front, evaluated, len(found["rc"]))
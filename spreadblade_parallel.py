@@ -0,0 +1,184 @@
+"""Büyük tasarım gruplarının süreç havuzunda paralel hesaplanması.
+
+Girdi sütunları parçalara bölünür, her parça bir ProcessPoolExecutor
+işçisinde spreadblade_batch.calculate_batch ile hesaplanır. İşçiler
+sonuçlarını ortak belleğe (multiprocessing.shared_memory) kendi satır
+aralıklarına yazar; böylece büyük sonuç dizileri süreçler arasında
+kopyalanmaz ve birleştirme girdi sırasını korur:
+
+    result = calculate_parallel(inputs, workers=32)
+
+Ortak bellek tüm girdi için değil, işçi başına SLOTS_PER_WORKER parçalık
+yuvalar için ayrılır; bir parçanın sonucu kopyalandıktan sonra yuvası
+sıradaki parçaya verilir. Böylece ortak bellek girdi boyundan bağımsızdır.
+Sonucun tamamı gerekmiyorsa (ör. dosyaya yazarken) iter_parallel()
+parçaları girdi sırasıyla üretir:
+
+    for start, part in iter_parallel(inputs, workers=32):
+        part.columns["136L"]    # satır start, start+1, ...
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from spreadblade_engine import DEFAULT_MACHINE
+from spreadblade_batch import BatchResult, calculate_batch, input_columns, k1_factor
+from spreadblade_cutters import default_cutter_catalog
+from spreadblade_gears import default_gear_index
+from spreadblade_k1table import open_k1_table
+
+DEFAULT_CHUNK_SIZE = 50_000
+SLOTS_PER_WORKER = 2 # İşçi hesaplarken önceki parçası kopyalanabilsin
+
+
+def _init_worker(k1_table, machine):
+    """İşçi başlangıcı: katalogları, tabloları ve NumPy'yi bir kez yükler.
+
+    Kesici kataloğu (SPREADBLADE_CUTTERS), dişli indeksi (SPREADBLADE_GEARS)
+    ve gerekirse K1 tablosu işçide açılır; K2 seçilen makineden
+    (SPREADBLADE_MACHINES) gelir. Tek satırlık bir ısınma hesabı ilk
+    parçanın bu maliyeti ödemesini engeller.
+    """
+    from spreadblade_engine import DEFAULT_INPUTS
+    default_cutter_catalog()
+    default_gear_index()
+    calculate_batch(DEFAULT_INPUTS, open_k1_table() if k1_table else k1_factor, machine)
+
+
+def _result_layout():
+    """Sonuç sütunlarının ve metin bileşenlerinin anahtarları (sabit sıra)."""
+    from spreadblade_engine import DEFAULT_INPUTS
+    sample = calculate_batch(DEFAULT_INPUTS)
+    return list(sample.columns), list(sample.extras)
+
+
+def _views(buffer, keys, slots, chunk_size):
+    """Ortak bellek üzerinde (yuva x anahtar x chunk_size) float64 ve (yuva x chunk_size) hata dizisi."""
+    values = np.ndarray((slots, len(keys), chunk_size), dtype=np.float64, buffer=buffer)
+    error = np.ndarray((slots, chunk_size), dtype=np.int16, buffer=buffer, offset=values.nbytes)
+    return values, error
+
+
+def _calculate_chunk(task):
+    name, keys, slots, chunk_size, slot, chunk, k1_table, machine = task
+    # Tablo her işçide bir kez diskten açılır (open_k1_table önbellekli)
+    result = calculate_batch(chunk, open_k1_table() if k1_table else k1_factor, machine)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        values, error = _views(shm.buf, keys, slots, chunk_size)
+        for row, key in enumerate(keys):
+            values[slot, row, :result.size] = result.columns[key] if key in result.columns else result.extras[key]
+        error[slot, :result.size] = result.error
+        del values, error
+    finally:
+        shm.close()
+    return result.size
+
+
+def iter_chunks(columns, chunk_size):
+    """Girdi sütunlarını (başlangıç, parça) olarak sıralı parçalara böler."""
+    size = len(next(iter(columns.values())))
+    for start in range(0, size, chunk_size):
+        yield start, {name: values[start:start + chunk_size] for name, values in columns.items()}
+
+
+def _plan(inputs, workers, chunk_size):
+    """Girdi sütunları, satır sayısı, işçi sayısı ve parça boyu."""
+    columns = input_columns(inputs)
+    size = len(columns['n'])
+    workers = workers or os.cpu_count() or 1
+    # Parçalar işçilere eşit dağılsın, ancak chunk_size'ı aşmasın
+    chunk_size = max(1, min(chunk_size, -(-size // workers)))
+    return columns, size, workers, chunk_size
+
+
+def _iter_slots(columns, size, workers, chunk_size, k1_table, machine, keys, out=None):
+    """Parçaları girdi sırasıyla hesaplar; (başlangıç, satır, değerler, hata) üretir.
+
+    Değerler (anahtar x satır) ve hata yuvadan kopyalanır. `out`
+    (anahtar x size değerler, hata) verilirse parça doğrudan oraya yazılır
+    ve değerler/hata None'dır. Ortak bellek görünümleri dışarı verilmez;
+    yuva, parça kopyalanır kopyalanmaz sıradaki parçaya verilir.
+    """
+    slots = min(workers * SLOTS_PER_WORKER, -(-size // chunk_size))
+    shm = shared_memory.SharedMemory(create=True, size=slots * chunk_size * (len(keys) * 8 + 2))
+    values = error = None
+    try:
+        values, error = _views(shm.buf, keys, slots, chunk_size)
+        chunks = iter_chunks(columns, chunk_size)
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(k1_table, machine)) as pool:
+            def submit(slot):
+                item = next(chunks, None)
+                if item is not None:
+                    task = (shm.name, keys, slots, chunk_size, slot, item[1], k1_table, machine)
+                    pending.append((item[0], slot, pool.submit(_calculate_chunk, task)))
+
+            for slot in range(slots):
+                submit(slot)
+            while pending:
+                start, slot, future = pending.popleft()
+                rows = future.result()
+                if out is None:
+                    part = values[slot, :, :rows].copy(), error[slot, :rows].copy()
+                else:
+                    out[0][:, start:start + rows] = values[slot, :, :rows]
+                    out[1][start:start + rows] = error[slot, :rows]
+                    part = None, None
+                submit(slot)
+                yield (start, rows) + part
+    finally:
+        # Görünümler ortak bellek kapanmadan bırakılmalı
+        del values, error
+        shm.close()
+        shm.unlink()
+
+
+def iter_parallel(inputs, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, k1_table=False, machine=DEFAULT_MACHINE):
+    """Sonucu girdi sırasıyla (başlangıç satırı, BatchResult) parçaları olarak üretir.
+
+    Ortak bellek ve bekleyen sonuçlar işçi başına SLOTS_PER_WORKER parça
+    ile sınırlıdır. Tek işçi veya tek parçalık girdilerde süreç havuzu
+    açılmadan tek parça üretilir.
+    """
+    k1 = open_k1_table() if k1_table else k1_factor
+    columns, size, workers, chunk_size = _plan(inputs, workers, chunk_size)
+    if workers == 1 or size <= chunk_size:
+        yield 0, calculate_batch(columns, k1, machine)
+        return
+    column_keys, extra_keys = _result_layout()
+    for start, _, values, error in _iter_slots(columns, size, workers, chunk_size, k1_table, machine,
+                                               column_keys + extra_keys):
+        yield start, BatchResult({key: values[i] for i, key in enumerate(column_keys)},
+                                 {key: values[len(column_keys) + i] for i, key in enumerate(extra_keys)}, error)
+
+
+def calculate_parallel(inputs, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, k1_table=False, machine=DEFAULT_MACHINE):
+    """calculate_batch ile aynı sonucu birden çok süreçte hesaplar.
+
+    `workers` verilmezse tüm çekirdekler kullanılır. Tek işçi veya tek
+    parçalık girdilerde süreç havuzu açılmadan doğrudan hesaplanır.
+    `k1_table` True ise Öğe 67 K1 tablosundan okunur; Öğe 138-144 `machine`
+    ile hesaplanır. Parçalar ortak bellek yuvalarından (bkz. iter_parallel)
+    doğrudan önceden ayrılmış sonuç dizilerine kopyalanır.
+    """
+    # Tablo işçiler başlamadan kurulup diske yazılır
+    k1 = open_k1_table() if k1_table else k1_factor
+    columns, size, workers, chunk_size = _plan(inputs, workers, chunk_size)
+    if workers == 1 or size <= chunk_size:
+        return calculate_batch(columns, k1, machine)
+
+    column_keys, extra_keys = _result_layout()
+    keys = column_keys + extra_keys
+    values = np.empty((len(keys), size), dtype=np.float64)
+    error = np.empty(size, dtype=np.int16)
+    done = sum(rows for _, rows, _, _ in _iter_slots(columns, size, workers, chunk_size, k1_table, machine, keys,
+                                                     out=(values, error)))
+    if done != size:
+        raise RuntimeError(f"Paralel hesaplama eksik: {done}/{size} satır.")
+    return BatchResult({key: values[i] for i, key in enumerate(column_keys)},
+                       {key: values[len(column_keys) + i] for i, key in enumerate(extra_keys)}, error)
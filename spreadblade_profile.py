@@ -0,0 +1,300 @@
+"""İsteğe bağlı ölçüm katmanı: aşama/öğe süreleri ve sayısal geri dönüşler.
+
+Bir Profiler etkinken spreadblade_batch.calculate_batch aşama (inputs, SB1,
+SB2, SB3) sürelerini, arayüz grafikleri de kendi sürelerini kaydeder.
+SpreadBladeEngine hesaplamaları sayar; toplam, aşama ve öğe (adım) süreleri
+ek yükü düşük tutmak için her `sample_every` hesaplamadan birinde ölçülür ve
+katlanmış yığınlarda hesaplama sayısına ölçeklenir. safe_division,
+safe_acos, safe_asin ve safe_sqrt'ün geri dönüşleri çağıran öğeyle, Öğe 30,
+33 ve 139'daki [-1, 1] sıkıştırmaları öğe numarasıyla sayılır:
+
+    with Profiler() as profiler:
+        calculate_batch(inputs)
+    profiler.write("profil.json")      # veya "profil.folded" (flame graph)
+
+`with` yalnızca o iş parçacığında etkindir; install() profiler'ı tüm
+süreçte (ör. arayüzün arka plan iş parçacığında) etkinleştirir. Profiler
+etkin değilken hesaplamalara eklenen maliyet hesaplama (toplu hesaplamada
+güvenli işlem) başına tek bir denetimdir.
+"""
+import functools
+import json
+import operator
+import sys
+import threading
+import time
+
+DEFAULT_SAMPLE_EVERY = 64
+PROFILE_ENV = "SPREADBLADE_PROFILE" # Arayüz: rapor dosyası (çıkışta yazılır)
+FOLDED_EXTENSIONS = (".folded", ".txt")
+
+class _State(threading.local):
+    profiler = None # Bu iş parçacığında `with` ile etkin Profiler
+
+
+_local = _State()
+_installed = None # install() ile süreç genelinde etkin Profiler
+
+
+def active_profiler():
+    """Bu iş parçacığında etkin Profiler; yoksa süreç geneli veya None."""
+    return _local.profiler or _installed
+
+
+def record_fallback(function, count=1, location=None):
+    """Güvenli işlemin geri dönüşünü kaydeder (etkin değilse yok sayılır).
+
+    `location` verilmezse güvenli işlemi çağıran fonksiyonun (öğe adımının)
+    adı kullanılır (ad, sayaçlar okunurken kod nesnesinden alınır).
+    """
+    profiler = _local.profiler or _installed
+    if profiler is not None and count:
+        if location is None:
+            location = sys._getframe(2).f_code
+        profiler.add_fallback(function, location, count)
+
+
+def record_clamp(item, count=1):
+    """Öğedeki [-1, 1] sıkıştırmasını kaydeder (etkin değilse yok sayılır)."""
+    profiler = active_profiler()
+    if profiler is not None and count:
+        profiler.add_clamp(item, count)
+
+
+def profiled(stage):
+    """Fonksiyonun süresini Profiler etkinken `stage` aşaması olarak kaydeder."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = active_profiler()
+            if profiler is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.add_stage(stage, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+def _accumulate(table, name, seconds):
+    entry = table.get(name)
+    if entry is None:
+        table[name] = [1, seconds]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+
+
+class _Shard:
+    """Tek bir iş parçacığının sayaçları (güncelleme için kilit gerekmez)."""
+    def __init__(self):
+        self.stages = {} # yığın adı -> [çağrı, saniye]
+        self.sampled_stages = {} # örneklenen hesaplamalarda: yığın adı -> [çağrı, saniye]
+        self.steps = {} # aşama -> (adım adları, çağrılar, saniyeler)
+        self.fallbacks = {} # (fonksiyon, konum) -> sayı
+        self.clamps = {} # öğe -> sayı
+        self.calculations = 0
+        self.sampled = 0
+
+
+class Profiler:
+    """Aşama ve öğe süreleri, geri dönüş ve sıkıştırma sayaçları.
+
+    Her iş parçacığı kendi sayaçlarına yazar; `stages`, `sampled_stages` ve
+    `items` ("engine", "engine;SB1", "engine;SB1;items_30_32" gibi yığın adı
+    -> [çağrı, saniye]), `fallbacks` ((fonksiyon, konum) -> sayı) ve `clamps`
+    (öğe -> sayı) okunurken birleştirilir.
+    """
+    def __init__(self, sample_every=DEFAULT_SAMPLE_EVERY):
+        self.sample_every = max(1, int(sample_every))
+        self._shards = {} # iş parçacığı kimliği -> _Shard
+        self._lock = threading.Lock()
+        self._previous = []
+
+    def __enter__(self):
+        self._previous.append(_local.profiler)
+        _local.profiler = self
+        return self
+
+    def __exit__(self, *exc):
+        _local.profiler = self._previous.pop()
+        return False
+
+    def install(self):
+        """Profiler'ı tüm iş parçacıklarında etkinleştirir."""
+        global _installed
+        _installed = self
+        return self
+
+    def uninstall(self):
+        global _installed
+        if _installed is self:
+            _installed = None
+
+    def _shard(self):
+        shard = self._shards.get(threading.get_ident())
+        if shard is None:
+            with self._lock:
+                shard = self._shards[threading.get_ident()] = _Shard()
+        return shard
+
+    # --- Kayıt ---
+    def add_stage(self, name, seconds, sampled=False):
+        """Aşama süresini ekler; `sampled` ise örneklenen hesaplamalar tablosuna."""
+        shard = self._shard()
+        _accumulate(shard.sampled_stages if sampled else shard.stages, name, seconds)
+
+    def add_fallback(self, function, location, count=1):
+        fallbacks = self._shard().fallbacks
+        key = (function, location)
+        fallbacks[key] = fallbacks.get(key, 0) + count
+
+    def add_clamp(self, item, count=1):
+        clamps = self._shard().clamps
+        clamps[item] = clamps.get(item, 0) + int(count)
+
+    def start_calculation(self):
+        """Yeni bir tam hesaplamayı sayar; öğe süreleri ölçülecekse True."""
+        shard = self._shard()
+        shard.calculations += 1
+        if (shard.calculations - 1) % self.sample_every:
+            return False
+        shard.sampled += 1
+        return True
+
+    def add_steps(self, stage, names, stamps):
+        """Örneklenen bir aşamanın adım adları ve len(names) + 1 zaman damgası."""
+        self.add_stage(stage, stamps[-1] - stamps[0], sampled=True)
+        steps = self._shard().steps
+        entry = steps.get(stage)
+        if entry is None:
+            entry = steps[stage] = (names, [0] * len(names), [0.0] * len(names))
+        _, calls, seconds = entry
+        n = len(stamps) - 1 # Hata durumunda damgalar eksik olabilir
+        calls[:n] = [count + 1 for count in calls[:n]]
+        seconds[:n] = map(operator.add, seconds[:n], map(operator.sub, stamps[1:], stamps))
+
+    def laps(self, prefix):
+        """Ardışık aşama süreleri için lap(ad) fonksiyonu (bkz. calculate_batch)."""
+        last = [time.perf_counter()]
+
+        def lap(name):
+            now = time.perf_counter()
+            self.add_stage(f"{prefix};{name}", now - last[0])
+            last[0] = now
+        return lap
+
+    # --- Birleştirilmiş sonuçlar ---
+    def _all_shards(self):
+        with self._lock:
+            return list(self._shards.values())
+
+    def _merge(self, attribute):
+        shards = self._all_shards()
+        merged = {}
+        for shard in shards:
+            for key, value in dict(getattr(shard, attribute)).items():
+                if isinstance(value, list):
+                    entry = merged.setdefault(key, [0, 0.0])
+                    entry[0] += value[0]
+                    entry[1] += value[1]
+                else:
+                    merged[key] = merged.get(key, 0) + value
+        return merged
+
+    @property
+    def stages(self):
+        return self._merge("stages")
+
+    @property
+    def sampled_stages(self):
+        return self._merge("sampled_stages")
+
+    @property
+    def items(self):
+        shards = self._all_shards()
+        merged = {}
+        for shard in shards:
+            for stage, (names, calls, seconds) in dict(shard.steps).items():
+                for name, count, total in zip(names, calls, seconds):
+                    if count:
+                        entry = merged.setdefault(f"{stage};{name}", [0, 0.0])
+                        entry[0] += count
+                        entry[1] += total
+        return merged
+
+    @property
+    def fallbacks(self):
+        merged = {}
+        for (function, location), count in self._merge("fallbacks").items():
+            if not isinstance(location, str): # Kod nesnesi: öğe adımının adı
+                location = location.co_name.lstrip("_")
+            key = (function, location)
+            merged[key] = merged.get(key, 0) + int(count)
+        return merged
+
+    @property
+    def clamps(self):
+        return self._merge("clamps")
+
+    @property
+    def calculations(self):
+        return sum(shard.calculations for shard in self._all_shards())
+
+    @property
+    def sampled(self):
+        return sum(shard.sampled for shard in self._all_shards())
+
+    def report(self):
+        """JSON'a yazılabilir rapor sözlüğü."""
+        def timing(table):
+            return {name: {"calls": calls, "seconds": seconds, "mean_us": seconds / calls * 1e6}
+                    for name, (calls, seconds) in sorted(table.items())}
+        fallbacks = {}
+        for (function, location), count in sorted(self.fallbacks.items()):
+            entry = fallbacks.setdefault(function, {"total": 0, "by_item": {}})
+            entry["total"] += count
+            entry["by_item"][location] = count
+        return {
+            "calculations": self.calculations,
+            "sample_every": self.sample_every,
+            "sampled": self.sampled,
+            "stages": timing(self.stages),
+            "sampled_stages": timing(self.sampled_stages),
+            "items": timing(self.items),
+            "fallbacks": fallbacks,
+            "clamps": dict(sorted(self.clamps.items(), key=lambda kv: int(kv[0]))),
+        }
+
+    def folded(self):
+        """Flame graph aracı (flamegraph.pl, speedscope) için katlanmış yığınlar.
+
+        Değerler mikrosaniyedir. Örneklenen aşama ve öğe süreleri hesaplama
+        sayısına ölçeklenir; her yığının alt yığınlara düşmeyen kalan süresi
+        kendi satırına yazılır.
+        """
+        sampled = self.sampled
+        scale = self.calculations / sampled if sampled else 0.0
+        totals = {name: seconds for name, (_, seconds) in self.stages.items()}
+        for table in (self.sampled_stages, self.items):
+            for name, (_, seconds) in table.items():
+                totals[name] = totals.get(name, 0.0) + seconds * scale
+        children = {}
+        for name, seconds in totals.items():
+            if ";" in name:
+                parent = name.rsplit(";", 1)[0]
+                children[parent] = children.get(parent, 0.0) + seconds
+        lines = [f"{name} {round(max(0.0, seconds - children.get(name, 0.0)) * 1e6)}"
+                 for name, seconds in sorted(totals.items())]
+        return "\n".join(line for line in lines if not line.endswith(" 0")) + "\n"
+
+    def write(self, path):
+        """Raporu uzantıya göre JSON veya katlanmış yığın olarak yazar."""
+        with open(path, "w", encoding="utf-8") as f:
+            if path.lower().endswith(FOLDED_EXTENSIONS):
+                f.write(self.folded())
+            else:
+                json.dump(self.report(), f, indent=2, ensure_ascii=False)
+                f.write("\n")
@@ -0,0 +1,231 @@
+"""Makine ayarlarının girdilere duyarlılığı (Jacobian).
+
+Anahtar SB çıktılarının (S, Q, beta, m75/m50 oran ondalıkları, WG, WRP) 14
+girdiye göre türevleri merkezi farklarla hesaplanır. Her tasarım için
+nominal nokta ve her girdinin ±h noktaları (1 + 2 x 14 satır) tek bir
+vektörel calculate_batch çağrısında değerlendirilir:
+
+    result = sensitivity(inputs)
+    result.shift("S")[0, INPUT_NAMES.index("rc")]   # rc 0.001 artarsa S'deki değişim
+
+Yuvarlama ve sıkıştırma adımları türevi süreksiz yapar: Öğe 44 (WG) ve
+Öğe 48 (WRP) 0.005/0.010 adımlarla yuvarlanır, Öğe 96 (NB) kesici
+kataloğundan seçilir, Öğe 139 sin(beta/2)'yi [-1, 1]'e sıkıştırır. Bu
+öğelerde merkezi farkın ±h aralığı bir sıçramayı kapsıyorsa türev
+`discontinuous` ile işaretlenir. `margins` ise her girdide, doğrusal
+yaklaşımla öğe bir sonraki sıçramaya ulaşana kadar gereken değişimdir
+(girdinin biriminde; 0 = tasarım sıçrama noktasında).
+
+K1 (Öğe 67) tablo yerine tam formülle hesaplanır: tablonun enterpolasyon
+hatası (<= 1e-8) küçük adımlı farkları bozar.
+"""
+import numpy as np
+
+from spreadblade_engine import DEFAULT_MACHINE, STOCK_ALLOWANCE, find_machine
+from spreadblade_batch import ERRORS, INPUT_NAMES, calculate_batch, input_columns, k1_factor
+from spreadblade_cutters import default_cutter_catalog
+
+# Türevi alınan çıktılar: (ad, öğe anahtarı)
+SENSITIVITY_OUTPUTS = [
+    ("S", "136L"), # Öğe 136 Radyal Kesici Ayarı
+    ("Q_LH", "137L"), # Öğe 137 Kızak Açısı
+    ("Q_RH", "137R"),
+    ("beta", "141L"), # Öğe 141 Eksantrik Açı
+    ("m75_L", "131L"), # Öğe 131 Oran ondalığı (75)
+    ("m75_R", "131R"),
+    ("m50_L", "133L"), # Öğe 133 Oran ondalığı (50)
+    ("m50_R", "133R"),
+    ("WG", "44L"), # Öğe 44 Dişli Finiş Nokta Genişliği
+    ("WRP", "48L"), # Öğe 48 Pinyon Kaba Nokta Genişliği
+]
+
+# Türevi süreksiz yapan öğeler: öğe -> açıklama
+DISCONTINUOUS_ITEMS = {
+    "44": "WG yuvarlaması",
+    "48": "WRP yuvarlaması / 0.040 alt sınırı",
+    "96": "NB kesici kataloğu",
+    "139": "sin(beta/2) [-1, 1] sıkıştırması",
+}
+
+# Adım: h = RELATIVE_STEP * max(|x|, 1)
+RELATIVE_STEP = 1e-6
+# Arayüz ve raporlarda gösterilen girdi değişimi (0.001 inç, derece veya diş)
+DISPLAY_DELTA = 0.001
+MIN_ROUGH_POINT_WIDTH = 0.040 # rc >= 3.0 için (SB1, Öğe 48)
+DEFAULT_CHUNK_SIZE = 4_000 # Tasarım; her parça 29 kat satırla hesaplanır
+
+
+def stencil_columns(columns):
+    """Her tasarım için nominal ve ±h noktaları: (girdi sütunları, (m, 14) adım farkları).
+
+    Satır sırası tasarım başına [nominal, +h_0, -h_0, +h_1, -h_1, ...] dir.
+    Adım farkı (x + h) - (x - h) kayan noktada gerçekleşen değerdir.
+    """
+    x = np.column_stack([columns[name] for name in INPUT_NAMES])
+    m, k = x.shape
+    h = RELATIVE_STEP * np.maximum(np.abs(x), 1.0)
+    X = np.repeat(x[:, None, :], 1 + 2 * k, axis=1)
+    index = np.arange(k)
+    X[:, 1 + 2 * index, index] += h
+    X[:, 2 + 2 * index, index] -= h
+    width = X[:, 1 + 2 * index, index] - X[:, 2 + 2 * index, index]
+    return {name: X[:, :, j].ravel() for j, name in enumerate(INPUT_NAMES)}, width
+
+
+def _rounding_gap(value, step, lowest):
+    """Yuvarlanan değerin bir sonraki sıçramaya uzaklığı.
+
+    Sıçramalar (k + 0.5) * step noktalarındadır; `lowest`ın altındaki
+    sıçramalar alt sınır nedeniyle değeri değiştirmez.
+    """
+    below = (np.floor(value / step - 0.5) + 0.5) * step
+    gap = np.minimum(value - below, below + step - value)
+    return np.where(value < lowest, lowest - value, gap)
+
+
+def _blade_gap(rc, Nb_prime):
+    """|Nb'| değerinin NB'yi değiştiren en yakın standart bıçak sayısına uzaklığı.
+
+    Kesicinin en küçük bıçak sayısı sıçrama değildir (uygun standart yoksa da seçilir).
+    """
+    catalog = default_cutter_catalog()
+    blades = catalog.tables["NB"][catalog.cutter_column(rc)]
+    boundaries = np.where(blades > blades[:, :1], blades, np.inf) # NaN hücreler de atılır
+    return np.abs(np.abs(Nb_prime)[:, None] - boundaries).min(axis=1)
+
+
+def _margin(gap, derivative):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(derivative != 0, gap[:, None] / np.abs(derivative), np.inf)
+
+
+class SensitivityResult:
+    """Duyarlılık sonucu (m tasarım, k = 14 girdi).
+
+    `nominal` çıktı adı -> (m,) dizi, `jacobian` çıktı adı -> (m, k) türev
+    dizisi (girdi sırası INPUT_NAMES). `discontinuous` ve `margins` öğe no ->
+    (m, k) dizileridir (bkz. modül açıklaması); `clamped` Öğe 139'un nominal
+    noktada sıkıştırıldığı (beta türevlerinin S'yi izlemediği) tasarımlardır.
+    `error` nominal noktanın hata kodudur; ±h noktalarından biri hesaplanamazsa
+    o girdinin türevleri NaN olur.
+    """
+    def __init__(self, nominal, jacobian, discontinuous, margins, clamped, error):
+        self.nominal = nominal
+        self.jacobian = jacobian
+        self.discontinuous = discontinuous
+        self.margins = margins
+        self.clamped = clamped
+        self.error = error
+        self.size = len(error)
+
+    def shift(self, output, delta=DISPLAY_DELTA):
+        """Girdi `delta` kadar değiştiğinde çıktıdaki doğrusal değişim, (m, k)."""
+        return self.jacobian[output] * delta
+
+    def flags(self, i):
+        """i. tasarımın süreksizlik uyarıları: (öğe, açıklama, girdiler, en yakın sıçrama) listesi.
+
+        `girdiler` ±h aralığında sıçrama olan girdilerdir; en yakın sıçrama
+        (girdi, gereken değişim) ya da hiçbir girdi öğeyi değiştirmiyorsa None.
+        """
+        flags = []
+        for item, description in DISCONTINUOUS_ITEMS.items():
+            names = [name for name, hit in zip(INPUT_NAMES, self.discontinuous[item][i]) if hit]
+            margins = self.margins[item][i]
+            j = int(np.argmin(np.where(np.isnan(margins), np.inf, margins)))
+            nearest = (INPUT_NAMES[j], float(margins[j])) if np.isfinite(margins[j]) else None
+            if item == "139" and self.clamped[i]:
+                description += " (sınırda: beta türevleri sıfır)"
+            flags.append((item, description, names, nearest))
+        return flags
+
+    def error_message(self, i):
+        return ERRORS[self.error[i]]
+
+
+def _evaluate(columns, outputs, k1, machine):
+    stencil, width = stencil_columns(columns)
+    m, k = width.shape
+    result = calculate_batch(stencil, k1, machine)
+    error = result.error.reshape(m, 1 + 2 * k)
+    bad = (error[:, 1::2] != 0) | (error[:, 2::2] != 0) | (error[:, :1] != 0)
+
+    def grid(key):
+        return result.columns[key].reshape(m, 1 + 2 * k)
+
+    def derivative(values):
+        return np.where(bad, np.nan, (values[:, 1::2] - values[:, 2::2]) / width)
+
+    nominal, jacobian = {}, {}
+    for name, key in outputs:
+        values = grid(key)
+        nominal[name] = values[:, 0]
+        jacobian[name] = derivative(values)
+
+    def jumps(values):
+        """±h noktalarından birinde değer nominalden farklı mı, (m, k)."""
+        return ~bad & ((values[:, 1::2] != values[:, :1]) | (values[:, 2::2] != values[:, :1]))
+
+    rc = columns["rc"]
+    step = np.where(rc == 1.75, 0.005, 0.010)
+    WG_prime = grid("43R")
+    WRP_calc = grid("47L") - STOCK_ALLOWANCE
+    Nb_prime = grid("95L")
+    ratio = grid("136L") / (2 * find_machine(machine)[1])
+
+    discontinuous = {
+        "44": jumps(grid("44L")),
+        "48": jumps(grid("48L")),
+        "96": jumps(grid("96L")),
+        "139": jumps(np.abs(ratio) > 1.0),
+    }
+    lowest = np.where(rc >= 3.0, MIN_ROUGH_POINT_WIDTH + step / 2, -np.inf)
+    margins = {
+        "44": _margin(_rounding_gap(WG_prime[:, 0], step, -np.inf), derivative(WG_prime)),
+        "48": _margin(_rounding_gap(WRP_calc[:, 0], step, lowest), derivative(WRP_calc)),
+        "96": _margin(_blade_gap(rc, Nb_prime[:, 0]), derivative(np.abs(Nb_prime))),
+        "139": _margin(np.abs(1.0 - np.abs(ratio[:, 0])), derivative(ratio)),
+    }
+    # rc'nin kendi sınırları: katalog kesicisi ve WRP alt sınırının geçerliliği (rc >= 3)
+    j = INPUT_NAMES.index("rc")
+    to_limit = np.abs(rc[:, None] - default_cutter_catalog().limits).min(axis=1, initial=np.inf)
+    margins["96"][:, j] = np.minimum(margins["96"][:, j], to_limit)
+    floor_active = np.round(WRP_calc[:, 0] / step) * step < MIN_ROUGH_POINT_WIDTH
+    margins["48"][:, j] = np.where(floor_active, np.minimum(margins["48"][:, j], np.abs(rc - 3.0)), margins["48"][:, j])
+    for item in margins:
+        margins[item][bad] = np.nan
+    return nominal, jacobian, discontinuous, margins, np.abs(ratio[:, 0]) > 1.0, error[:, 0].copy()
+
+
+def sensitivity(inputs, outputs=SENSITIVITY_OUTPUTS, k1=k1_factor, chunk_size=DEFAULT_CHUNK_SIZE,
+                machine=DEFAULT_MACHINE):
+    """Tasarımların (skaler veya sütun girdileri) duyarlılıkları; SensitivityResult döndürür.
+
+    Öğe 138-144 ve Öğe 139 sınırı `machine` (default_machines()'teki ad) ile hesaplanır.
+    """
+    columns = input_columns(inputs)
+    size = len(columns["n"])
+    parts = [_evaluate({name: values[start:start + chunk_size] for name, values in columns.items()}, outputs, k1,
+                       machine)
+             for start in range(0, size, chunk_size)] or [_evaluate(columns, outputs, k1, machine)]
+    nominal, jacobian, discontinuous, margins = ({key: np.concatenate([part[index][key] for part in parts])
+                                                  for key in parts[0][index]} for index in range(4))
+    clamped = np.concatenate([part[4] for part in parts])
+    error = np.concatenate([part[5] for part in parts])
+    return SensitivityResult(nominal, jacobian, discontinuous, margins, clamped, error)
+
+
+def sensitivity_columns(result, delta=DISPLAY_DELTA):
+    """Toplu çıktı için sütunlar: ("d<çıktı>/d<girdi>" -> değişim dizisi, "disc_<öğe>" -> metin listesi).
+
+    Sayısal sütunlar girdi `delta` kadar değiştiğinde çıktıdaki değişimdir;
+    metin sütunları ±h aralığında sıçrama olan girdileri "|" ile birleştirir.
+    """
+    numeric = {f"d{name}/d{input_name}": result.shift(name, delta)[:, j]
+               for name in result.jacobian for j, input_name in enumerate(INPUT_NAMES)}
+    text = {}
+    for item in DISCONTINUOUS_ITEMS:
+        hits = result.discontinuous[item]
+        text[f"disc_{item}"] = ["|".join(name for name, hit in zip(INPUT_NAMES, row) if hit) for row in hits.tolist()]
+    text["clamp_139"] = ["1" if value else "0" for value in result.clamped.tolist()]
+    return numeric, text
@@ -0,0 +1,433 @@
+"""SB1-SB3 hesaplamasını yerel ağda JSON olarak sunan HTTP servisi.
+
+Yalnızca standart kütüphane (asyncio) kullanılır. Uç noktalar:
+
+    POST /calculate   {"n": 20, "N": 40, ...}        -> tek tasarım
+    POST /batch       [{"n": 20, ...}, ...]           -> tasarım listesi
+    GET  /health      GET /stats
+
+Tek tasarımın cevabı spreadblade_cli NDJSON kaydıyla aynı alanları
+taşır (girdiler, makine ayarları, "items", ayrıca "warnings"); hesaplama
+hatası 422 ve {"error": {"title", "message"}} ile döner. /batch her satır
+için CLI'nin NDJSON kaydını "results" listesinde döndürür; hatalı satırlar
+isteği durdurmaz. `?full_precision=1` sayıları yuvarlamadan yazar.
+Öğe 138-144 isteğe bağlı "machine" alanındaki makine (katalogdaki ad,
+varsayılan DEFAULT_MACHINE) için hesaplanır; /batch'te alan
+{"designs": [...], "machine": ...} nesnesindedir. Bilinmeyen makine ve
+sonlu olmayan girdi (NaN, inf) 422 ile reddedilir.
+
+Hesaplamalar süreç havuzunda yapılır ve cevap işçide JSON'a çevrilir.
+Aynı kanonik girdilerle (spreadblade_cache.cache_key) gelen ve hâlâ
+hesaplanan istekler tek bir işi bekler; biten tek tasarım cevapları
+sınırlı bir LRU'da tutulur. Havuzda bekleyen iş sayısı `max_pending`'e
+ulaşınca yeni işler 503 ve Retry-After ile reddedilir:
+
+    python spreadblade_service.py --port 8765 -j 8
+    curl -d '{"n": 20, "N": 40, ...}' localhost:8765/calculate
+"""
+import argparse
+import asyncio
+import functools
+import io
+import json
+import math
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from spreadblade_engine import (
+    ALL_ITEMS, DEFAULT_INPUTS, DEFAULT_MACHINE, ITEM_INDEX, PRECISION, TEXT_ITEMS, CalculationError,
+    calculate, machine_names,
+)
+from spreadblade_cache import INPUT_NAMES, cache_key
+from spreadblade_cli import MACHINE_SETTINGS, json_value, parse_jobs, write_ndjson
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_PENDING = 256 # Havuzda aynı anda bekleyen en fazla iş
+DEFAULT_MAX_BATCH = 100_000 # /batch başına en fazla satır
+DEFAULT_CACHE_SIZE = 4096 # Saklanan tek tasarım cevabı
+MAX_HEADER_SIZE = 64 * 1024
+MAX_BODY_SIZE = 64 * 1024 * 1024
+RETRY_AFTER = 1 # saniye
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 422: "Unprocessable Entity", 431: "Request Header Fields Too Large",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+ROUTES = {"/calculate": "POST", "/batch": "POST", "/health": "GET", "/stats": "GET"}
+# Cevaptaki öğe anahtarları (tablo sırasıyla) ve makine ayarlarının öğeleri
+RECORD_KEYS = [f"{item}{side}" for item, _, _ in ALL_ITEMS for side in ("L", "R")]
+MACHINE_KEYS = [key for _, key in MACHINE_SETTINGS]
+
+
+class ServiceError(Exception):
+    """HTTP durum koduyla bildirilen istek hatası."""
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _json(payload):
+    return json.dumps(json_value(payload), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+
+def _error_body(title, message):
+    return _json({"error": {"title": title, "message": message}})
+
+
+def request_machine(payload):
+    """İstek nesnesindeki makine adı (yoksa DEFAULT_MACHINE); bilinmeyen adlarda ServiceError(422)."""
+    machine = payload.get("machine", DEFAULT_MACHINE)
+    names = machine_names()
+    if machine not in names:
+        raise ServiceError(422, f"Bilinmeyen makine: {machine!r} (geçerli: {', '.join(names)})")
+    return machine
+
+
+# --- İşçi süreçte çalışan fonksiyonlar (sonuç: (durum, JSON baytları)) ---
+def _init_worker():
+    """İşçi başlangıcı: motor ve NumPy modülleri bir kez yüklenir."""
+    from spreadblade_batch import calculate_batch
+    calculate(DEFAULT_INPUTS)
+    calculate_batch(DEFAULT_INPUTS)
+
+
+def design_record(inputs, summary, full_precision=False):
+    """Tek tasarımın cevabı; alan adları spreadblade_cli.write_ndjson ile aynı."""
+    def value(key):
+        value = summary.items.get(key)
+        if full_precision or value is None or value.__class__ is str or not math.isfinite(value):
+            return value
+        return round(value, PRECISION.get(key, 4))
+    keys = [key for key in RECORD_KEYS if key in summary.items]
+    record = dict(inputs)
+    record.update((name, value(key)) for name, key in MACHINE_SETTINGS)
+    record["items"] = {key: value(key) for key in keys if key[:-1] not in TEXT_ITEMS}
+    record["items"].update((key, value(key)) for key in keys if key[:-1] in TEXT_ITEMS)
+    record["warnings"] = summary.warnings
+    return record
+
+
+@functools.lru_cache(maxsize=64)
+def _record_layout(present, full_precision):
+    """Hesaplanan öğelere göre (sayısal öğe indeksleri, JSON şablonu)."""
+    def spec(key):
+        return "%r" if full_precision else f"%.{PRECISION.get(key, 4)}f"
+    numeric = [key for key in RECORD_KEYS if key[:-1] not in TEXT_ITEMS and present[ITEM_INDEX[key]]]
+    indices = [ITEM_INDEX[key] for _, key in MACHINE_SETTINGS] + [ITEM_INDEX[key] for key in numeric]
+    template = (", ".join(f'"{name}": {spec(key)}' for name, key in MACHINE_SETTINGS)
+                + ', "items": {' + ", ".join(f'"{key}": {spec(key)}' for key in numeric))
+    return indices, template
+
+
+def design_json(inputs, summary, full_precision=False):
+    """design_record'un JSON metni.
+
+    Hızlı yol satırı, hesaplanan öğelere göre önbelleğe alınmış bir şablonla
+    biçimlendirir (bkz. spreadblade_cli.write_ndjson); makine ayarı eksik
+    veya sonlu olmayan değer içeren özetler json.dumps ile yazılır (NaN ve
+    inf null olur).
+    """
+    items = summary.items
+    if all(items.present[ITEM_INDEX[key]] for key in MACHINE_KEYS):
+        indices, template = _record_layout(bytes(items.present), full_precision)
+        data = items.data
+        values = [data[i] for i in indices]
+        if all(map(math.isfinite, values)) and all(map(math.isfinite, inputs.values())):
+            text = "".join(f', "{key}": {json.dumps(items.text[key], ensure_ascii=False)}'
+                           for key in RECORD_KEYS if key in items.text)
+            return (json.dumps(inputs)[:-1] + ", " + template % tuple(values) + text
+                    + '}, "warnings": ' + json.dumps(summary.warnings, ensure_ascii=False) + "}")
+    return json.dumps(json_value(design_record(inputs, summary, full_precision)), ensure_ascii=False,
+                      allow_nan=False)
+
+
+def calculate_design(inputs, full_precision=False, machine=DEFAULT_MACHINE):
+    """Tek tasarımı hesaplar; (200 veya 422, JSON baytları) döndürür."""
+    try:
+        summary = calculate(inputs, machine)
+    except CalculationError as e:
+        return 422, _json({**inputs, "error": {"title": e.title, "message": e.message}})
+    return 200, design_json(inputs, summary, full_precision).encode("utf-8")
+
+
+def calculate_designs(body, full_precision=False, k1_table=False, max_batch=DEFAULT_MAX_BATCH):
+    """/batch gövdesini (JSON liste veya {"designs": [...], "machine": ...}) hesaplar.
+
+    Satırlar spreadblade_cli.parse_jobs ile okunur ve write_ndjson ile
+    yazılır (sonlu olmayan değerler null); cevap {"count", "failed",
+    "results"} nesnesidir.
+    """
+    from spreadblade_batch import calculate_batch
+    try:
+        rows = json.loads(body)
+    except ValueError as e:
+        return 400, _error_body("İstek Hatası", f"Geçersiz JSON: {e}")
+    machine = DEFAULT_MACHINE
+    if isinstance(rows, dict):
+        try:
+            machine = request_machine(rows)
+        except ServiceError as e:
+            return e.status, _error_body("Giriş Hatası", e.message)
+        rows = rows.get("designs")
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        return 400, _error_body("İstek Hatası", "Gövde tasarım nesnelerinin listesi olmalıdır.")
+    if len(rows) > max_batch:
+        return 413, _error_body("İstek Hatası", f"En fazla {max_batch} tasarım gönderilebilir.")
+    if not rows:
+        return 200, _json({"count": 0, "failed": 0, "results": []})
+    try:
+        inputs, row_errors, extra = parse_jobs(rows)
+    except ValueError as e:
+        return 400, _error_body("İstek Hatası", str(e))
+    if k1_table:
+        from spreadblade_k1table import open_k1_table
+        result = calculate_batch(inputs, open_k1_table(), machine)
+    else:
+        result = calculate_batch(inputs, machine=machine)
+    f = io.StringIO()
+    write_ndjson(f, inputs, row_errors, extra, result, full_precision)
+    failed = sum(1 for i in range(result.size) if row_errors[i] or result.error[i])
+    head = '{"count": %d, "failed": %d, "results": [' % (result.size, failed)
+    return 200, (head + ",".join(f.getvalue().splitlines()) + "]}").encode("utf-8")
+# --- ---
+
+
+def parse_design(body):
+    """Tek tasarım gövdesini kanonik girdilere çevirir: (anahtar, girdiler, makine).
+
+    Girdiler process_inputs gibi float'a çevrilir; sonlu olmayan değerler
+    (spreadblade_batch gibi) reddedilir. "machine" dışındaki diğer alanlar
+    yok sayılır.
+    """
+    try:
+        design = json.loads(body)
+    except ValueError as e:
+        raise ServiceError(400, f"Geçersiz JSON: {e}") from e
+    if not isinstance(design, dict):
+        raise ServiceError(400, "Gövde bir tasarım nesnesi olmalıdır.")
+    missing = [name for name in INPUT_NAMES if name not in design]
+    if missing:
+        raise ServiceError(400, f"Eksik girdi(ler): {', '.join(missing)}")
+    inputs = {}
+    for name in INPUT_NAMES:
+        try:
+            inputs[name] = float(design[name]) + 0.0
+        except (TypeError, ValueError):
+            raise ServiceError(422, f"Geçersiz giriş değeri: {name}={design[name]!r}") from None
+        if not math.isfinite(inputs[name]):
+            raise ServiceError(422, f"Geçersiz giriş değeri: Girdiler sonlu sayılar olmalıdır ({name}={design[name]!r}).")
+    machine = request_machine(design)
+    return cache_key(inputs, machine), inputs, machine
+
+
+class CalculationService:
+    """İşçi havuzu, eş zamanlı aynı isteklerin birleştirilmesi ve geri basınç.
+
+    Yalnızca olay döngüsü iş parçacığından kullanılır. Sayaçlar: `requests`,
+    `computed` (havuza gönderilen iş), `deduplicated` (bekleyen bir işe
+    bağlanan istek), `cache_hits` ve `rejected` (503).
+    """
+    def __init__(self, workers=None, max_pending=DEFAULT_MAX_PENDING, max_batch=DEFAULT_MAX_BATCH,
+                 cache_size=DEFAULT_CACHE_SIZE, k1_table=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self.k1_table = k1_table
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker)
+        self.inflight = {} # anahtar -> bekleyen Future
+        self.responses = OrderedDict() # anahtar -> (durum, gövde)
+        self.requests = 0
+        self.computed = 0
+        self.deduplicated = 0
+        self.cache_hits = 0
+        self.rejected = 0
+
+    async def run(self, key, func, *args, cacheable=False):
+        """İşi havuzda çalıştırır; aynı anahtarlı bekleyen iş varsa onu bekler."""
+        response = self.responses.get(key)
+        if response is not None:
+            self.responses.move_to_end(key)
+            self.cache_hits += 1
+            return response
+        future = self.inflight.get(key)
+        if future is not None:
+            self.deduplicated += 1
+        else:
+            if len(self.inflight) >= self.max_pending:
+                self.rejected += 1
+                raise ServiceError(503, "Servis meşgul; daha sonra tekrar deneyin.")
+            future = asyncio.get_running_loop().run_in_executor(self.pool, func, *args)
+            self.inflight[key] = future
+            self.computed += 1
+            # Temizlik isteği bekleyen bağlantı kopsa da iş bitince yapılır
+            future.add_done_callback(lambda f: self._finished(key, f, cacheable))
+        return await asyncio.shield(future)
+
+    def _finished(self, key, future, cacheable):
+        del self.inflight[key]
+        if cacheable and not future.cancelled() and future.exception() is None:
+            self.responses[key] = future.result()
+            while len(self.responses) > self.cache_size:
+                self.responses.popitem(last=False)
+
+    async def calculate(self, body, full_precision=False):
+        key, inputs, machine = parse_design(body)
+        return await self.run((key, full_precision), calculate_design, inputs, full_precision, machine,
+                              cacheable=True)
+
+    async def calculate_batch(self, body, full_precision=False):
+        return await self.run(("batch", full_precision, body), calculate_designs,
+                              body, full_precision, self.k1_table, self.max_batch)
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "computed": self.computed,
+            "deduplicated": self.deduplicated,
+            "cache_hits": self.cache_hits,
+            "rejected": self.rejected,
+            "pending": len(self.inflight),
+            "max_pending": self.max_pending,
+            "cached": len(self.responses),
+            "workers": self.workers,
+        }
+
+    async def handle(self, method, target, body):
+        """Bir isteği yönlendirir; (durum, JSON gövdesi) döndürür."""
+        self.requests += 1
+        url = urlsplit(target)
+        route = ROUTES.get(url.path)
+        if route is None:
+            return 404, _error_body("İstek Hatası", f"Bilinmeyen yol: {url.path}")
+        if method != route:
+            return 405, _error_body("İstek Hatası", f"{url.path} için {route} kullanılmalıdır.")
+        if url.path == "/health":
+            return 200, b'{"status": "ok"}'
+        if url.path == "/stats":
+            return 200, _json(self.stats())
+        query = parse_qs(url.query)
+        full_precision = query.get("full_precision", ["0"])[-1].lower() in ("1", "true", "yes")
+        try:
+            if url.path == "/calculate":
+                return await self.calculate(body, full_precision)
+            return await self.calculate_batch(body, full_precision)
+        except ServiceError as e:
+            return e.status, _error_body("Giriş Hatası" if e.status == 422 else "İstek Hatası", e.message)
+
+    async def serve_connection(self, reader, writer):
+        """HTTP/1.1 bağlantısı: kalıcı bağlantı ve sıralı istekler."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 431, _error_body("İstek Hatası", "Başlık çok büyük."), False)
+                    return
+                try:
+                    method, target, version, headers = _parse_head(head)
+                    length = int(headers.get("content-length", 0))
+                    if length < 0 or "transfer-encoding" in headers:
+                        raise ValueError(length)
+                except ValueError:
+                    await self._respond(writer, 400, _error_body("İstek Hatası", "Geçersiz HTTP isteği."), False)
+                    return
+                if length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, _error_body("İstek Hatası", "Gövde çok büyük."), False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                try:
+                    status, payload = await self.handle(method, target, body)
+                except Exception as e: # İşçi çöktü vb.; bağlantı açık kalır
+                    status, payload = 500, _error_body("Beklenmedik Hata", str(e))
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            pass # Servis kapanırken açık kalan bağlantılar
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(payload)}\r\n")
+        if status == 503:
+            head += f"Retry-After: {RETRY_AFTER}\r\n"
+        if not keep_alive:
+            head += "Connection: close\r\n"
+        writer.write(head.encode("ascii") + b"\r\n" + payload)
+        await writer.drain()
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """Dinlemeye başlar ve asyncio.Server döndürür (port=0: boş bir port)."""
+        return await asyncio.start_server(self.serve_connection, host, port, limit=MAX_HEADER_SIZE)
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+def _parse_head(head):
+    """İstek satırı ve başlıklar: (yöntem, hedef, sürüm, başlıklar)."""
+    lines = head.decode("latin-1").split("\r\n")
+    method, target, version = lines[0].split(" ")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, **options):
+    """Servisi başlatır ve durdurulana kadar çalıştırır."""
+    service = CalculationService(**options)
+    try:
+        server = await service.start(host, port)
+        address = server.sockets[0].getsockname()
+        print(f"SB servisi http://{address[0]}:{address[1]} adresinde ({service.workers} işçi).", file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="SB1-SB3 hesaplamasını yerel HTTP/JSON servisi olarak sunar.")
+    parser.add_argument("--host", default="127.0.0.1", help="Dinlenecek adres (varsayılan yalnızca bu makine)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Dinlenecek port")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="İşçi süreç sayısı (0 = tüm çekirdekler)")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                        help="Bekleyen iş sınırı; aşılınca 503 döner")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="/batch başına en fazla tasarım")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="Saklanan cevap sayısı")
+    parser.add_argument("--k1-table", action="store_true", help="/batch için Öğe 67 K1'i tablodan oku")
+    return parser
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası."""
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers or None, max_pending=args.max_pending,
+                          max_batch=args.max_batch, cache_size=args.cache_size, k1_table=args.k1_table))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
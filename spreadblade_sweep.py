@@ -0,0 +1,123 @@
+"""Spiral açısı, kesici yarıçapı, yüz genişliği ve basınç açısı taraması.
+
+Verilen aralıkların Kartezyen ızgarası SB1-SB3 formülleriyle (vektörel
+toplu motor) parça parça hesaplanır. Izgara hiçbir zaman bütünüyle bellekte
+oluşturulmaz; her parçanın noktaları doğrusal indeksten üretilir, bu yüzden
+milyon noktalı taramalar da sabit bellekle akış halinde işlenir:
+
+    for chunk in iter_sweep(inputs, {"psi_deg": grid_axis(20, 40, 41),
+                                     "rc": [3.5, 4.5, 6.0]}):
+        chunk.outputs["S"]
+
+Öğe 67 (K1) varsayılan olarak tam formülle (k1_factor) hesaplanır; tablo
+için k1=open_k1_table() verilir (bkz. spreadblade_k1table).
+"""
+import csv
+
+import numpy as np
+
+from spreadblade_engine import DEFAULT_MACHINE
+from spreadblade_batch import calculate_batch, k1_factor
+
+# Taranabilen girdiler ve varsayılan aralıklar (başlangıç, bitiş, nokta sayısı)
+SWEEP_PARAMETERS = [
+    ("psi_deg", "Ort. Spiral Açısı (°)", (20.0, 40.0, 21)),
+    ("rc", "Kesici Yarıçapı (rc)", (3.5, 6.0, 6)),
+    ("F", "Yüz Genişliği (F)", (1.0, 2.0, 5)),
+    ("phi_deg", "Basınç Açısı (°)", (20.0, 20.0, 1)),
+]
+
+# Tarama çıktıları: (ad, öğe anahtarı)
+SWEEP_OUTPUTS = [
+    ("WLP", "47L"), # Öğe 47 Pinyon Limit Nokta Genişliği
+    ("rE", "78L"), # Öğe 78 Kesici Kenar Yarıçapı
+    ("NB", "96L"), # Öğe 96 Bıçak Sayısı
+    ("mF", "122L"), # Öğe 122 Yüzey Kavrama Oranı
+    ("S", "136L"), # Öğe 136 Radyal Kesici Ayarı
+    ("beta", "141L"), # Öğe 141 Eksantrik Açı
+]
+
+DEFAULT_CHUNK_SIZE = 20_000
+
+
+def grid_axis(start, stop, count):
+    """[start, stop] aralığında `count` eşit aralıklı nokta."""
+    return np.linspace(float(start), float(stop), max(1, int(count)))
+
+
+class SweepChunk:
+    """Taramanın ardışık bir parçası.
+
+    `start` parçanın ızgaradaki ilk doğrusal indeksi, `params` taranan
+    girdilerin değerleri, `outputs` SWEEP_OUTPUTS değerleri, `error` ise
+    spreadblade_batch hata kodlarıdır (0 = hata yok). `result` parçanın tüm
+    öğelerini içeren BatchResult'tır (bkz. spreadblade_export).
+    """
+    def __init__(self, start, params, outputs, error, result=None):
+        self.start = start
+        self.params = params
+        self.outputs = outputs
+        self.error = error
+        self.result = result
+        self.size = len(error)
+
+
+def sweep_size(axes):
+    """Izgaradaki toplam nokta sayısı."""
+    return int(np.prod([len(values) for values in axes.values()], dtype=np.int64))
+
+
+def iter_sweep(base_inputs, axes, chunk_size=DEFAULT_CHUNK_SIZE, outputs=SWEEP_OUTPUTS, k1=k1_factor,
+               machine=DEFAULT_MACHINE):
+    """Kartezyen ızgarayı SweepChunk parçaları halinde üretir.
+
+    `base_inputs` taranmayan girdilerin sabit değerleri, `axes` ise
+    girdi adı -> değer listesi sözlüğüdür. Izgara sırası `axes` sırasıdır
+    (son eksen en hızlı değişir). Öğe 138-144 `machine` ile hesaplanır.
+    """
+    axes = {name: np.asarray(values, dtype=float).ravel() for name, values in axes.items()}
+    shape = tuple(len(values) for values in axes.values())
+    total = sweep_size(axes)
+    inputs = {name: float(value) for name, value in base_inputs.items() if name not in axes}
+    for start in range(0, total, chunk_size):
+        index = np.unravel_index(np.arange(start, min(start + chunk_size, total)), shape)
+        params = {name: values[i] for (name, values), i in zip(axes.items(), index)}
+        result = calculate_batch({**inputs, **params}, k1, machine)
+        yield SweepChunk(start, params, {name: result.columns[key] for name, key in outputs}, result.error, result)
+
+
+def sweep(base_inputs, axes, outputs=SWEEP_OUTPUTS, k1=k1_factor, machine=DEFAULT_MACHINE):
+    """Küçük ızgaralar için tüm taramayı tek SweepChunk olarak döndürür."""
+    chunks = list(iter_sweep(base_inputs, axes, outputs=outputs, k1=k1, machine=machine))
+    if not chunks:
+        return SweepChunk(0, {name: np.empty(0) for name in axes}, {name: np.empty(0) for name, _ in outputs},
+                          np.empty(0, dtype=np.int16))
+    return SweepChunk(
+        0,
+        {name: np.concatenate([c.params[name] for c in chunks]) for name in axes},
+        {name: np.concatenate([c.outputs[name] for c in chunks]) for name, _ in outputs},
+        np.concatenate([c.error for c in chunks]),
+    )
+
+
+def write_sweep_csv(path, base_inputs, axes, chunk_size=DEFAULT_CHUNK_SIZE, outputs=SWEEP_OUTPUTS, k1=k1_factor,
+                    cancelled=None, machine=DEFAULT_MACHINE):
+    """Taramayı parça parça CSV dosyasına yazar; yazılan satır sayısını döndürür.
+
+    `cancelled` (threading.Event gibi is_set() sunan bir nesne) verilirse
+    parçalar arasında denetlenir; iptalde o ana kadar yazılanlar kalır.
+    """
+    names = list(axes)
+    output_names = [name for name, _ in outputs]
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(names + output_names + ["error"])
+        for chunk in iter_sweep(base_inputs, axes, chunk_size, outputs, k1, machine):
+            if cancelled is not None and cancelled.is_set():
+                break
+            columns = [chunk.params[name] for name in names] + [chunk.outputs[name] for name in output_names]
+            rows = np.column_stack(columns).tolist()
+            writer.writerows(row + [int(code)] for row, code in zip(rows, chunk.error.tolist()))
+            written += chunk.size
+    return written
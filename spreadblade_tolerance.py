@@ -0,0 +1,308 @@
+"""Tolerans analizi: girdi toleranslarının makine ayarlarına etkisi (Monte Carlo).
+
+Taslak ve kesici toleransları (F, rc, addendumlar, dedendumlar, t0PL/t0G)
+her girdi için ayrı bir dağılımdan örneklenir ve örnekler SB1-SB3
+formüllerinden vektörel toplu motorla (spreadblade_batch) parça parça
+geçirilir. Sonuçta WLP, rE, NB, S, Q ve beta dağılımları ile bıçak sayısı
+NB'nin veya yuvarlanmış nokta genişliklerinin (WG, WRP) nominal tasarıma
+göre değişme olasılığı raporlanır:
+
+    result = analyze(inputs, {"rc": ("normal", 0.002), "F": ("uniform", 0.01)},
+                     samples=100_000, seed=1)
+    result.statistics()["S"]["std"], result.change_probability("NB")
+
+Her girdinin kendi rastgele sayı akışı vardır (seed'den türetilir); aynı
+seed ile sonuçlar parça boyutundan ve diğer girdilerin toleranslarından
+bağımsız olarak tekrarlanır. Öğe 67 (K1) varsayılan olarak tam formülle
+hesaplanır.
+
+    python spreadblade_tolerance.py -N 1000000 --seed 7 --tol rc=normal:0.002
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from spreadblade_engine import DEFAULT_INPUTS, CalculationError
+from spreadblade_batch import INPUT_NAMES, calculate_batch, input_columns, k1_factor
+
+# Dağılımlar; tolerans t her zaman sınır değeridir:
+#   normal: ortalama nominal, t = 3 sigma
+#   uniform: [nominal - t, nominal + t]
+#   triangular: tepe nominalde, [nominal - t, nominal + t]
+DISTRIBUTIONS = ("normal", "uniform", "triangular")
+
+# Varsayılan toleranslar (inç): girdi -> (dağılım, tolerans)
+DEFAULT_TOLERANCES = {
+    "F": ("uniform", 0.005),
+    "rc": ("normal", 0.001),
+    "a0P": ("normal", 0.002),
+    "a0G": ("normal", 0.002),
+    "b0P": ("normal", 0.002),
+    "b0G": ("normal", 0.002),
+    "t0PL": ("normal", 0.001),
+    "t0G": ("normal", 0.001),
+}
+
+# Raporlanan çıktılar: (ad, öğe anahtarı)
+TOLERANCE_OUTPUTS = [
+    ("WLP", "47L"), # Öğe 47 Pinyon Limit Nokta Genişliği
+    ("rE", "78L"), # Öğe 78 Kesici Kenar Yarıçapı
+    ("NB", "96L"), # Öğe 96 Bıçak Sayısı
+    ("S", "136L"), # Öğe 136 Radyal Kesici Ayarı
+    ("Q", "137R"), # Öğe 137 Kızak Açısı (R.H.; L.H. = 360° - Q)
+    ("beta", "141L"), # Öğe 141 Eksantrik Açı
+    ("WG", "44L"), # Öğe 44 Dişli Finiş Nokta Genişliği (yuvarlanmış)
+    ("WRP", "48L"), # Öğe 48 Pinyon Kaba Nokta Genişliği (yuvarlanmış)
+]
+# Nominalden farklı olma olasılığı raporlanan basamaklı çıktılar
+DISCRETE_OUTPUTS = ("NB", "rE", "WG", "WRP")
+
+DEFAULT_SAMPLES = 100_000
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_PERCENTILES = (0.135, 2.275, 50.0, 97.725, 99.865) # ±3σ, ±2σ ve medyan karşılıkları
+# Basamaklı çıktılarda "değişti" sayılan en küçük fark (adımlar 0.005 inç ve 1 bıçak)
+CHANGE_EPSILON = 1e-9
+
+
+def iter_deviations(tolerances, samples, seed, chunk_size=DEFAULT_CHUNK_SIZE):
+    """`samples` örneğin girdi sapmalarını (girdi -> dizi) parça parça üretir.
+
+    Her girdinin akışı seed ve girdinin INPUT_NAMES'teki sırasından
+    türetilir; parçalar aynı akıştan ardışık çekildiği için sonuç parça
+    boyutundan bağımsızdır.
+    """
+    children = np.random.SeedSequence(seed).spawn(len(INPUT_NAMES))
+    generators = {}
+    for name, (distribution, tolerance) in tolerances.items():
+        if name not in INPUT_NAMES:
+            raise ValueError(f"Bilinmeyen girdi: {name}")
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"{name}: bilinmeyen dağılım '{distribution}' ({', '.join(DISTRIBUTIONS)})")
+        if not tolerance >= 0:
+            raise ValueError(f"{name}: tolerans negatif olamaz.")
+        generators[name] = (np.random.default_rng(children[INPUT_NAMES.index(name)]), distribution, float(tolerance))
+    for start in range(0, samples, chunk_size):
+        size = min(chunk_size, samples - start)
+        yield {name: _draw(rng, distribution, tolerance, size)
+               for name, (rng, distribution, tolerance) in generators.items()}
+
+
+def _draw(rng, distribution, tolerance, size):
+    if tolerance == 0:
+        return np.zeros(size)
+    if distribution == "normal":
+        return rng.normal(0.0, tolerance / 3.0, size)
+    if distribution == "uniform":
+        return rng.uniform(-tolerance, tolerance, size)
+    return rng.triangular(-tolerance, 0.0, tolerance, size)
+
+
+def _changed(values, nominal):
+    """Nominalden farklı örnekler (NaN yalnız NaN'a eşittir)."""
+    return ~np.isclose(values, nominal, rtol=0.0, atol=CHANGE_EPSILON, equal_nan=True)
+
+
+class ToleranceResult:
+    """Tolerans analizi sonucu.
+
+    `nominal` çıktıların nominal tasarımdaki değerleri, `outputs` her örnek
+    için TOLERANCE_OUTPUTS değerleri (hatalı örneklerde NaN), `error` ise
+    spreadblade_batch hata kodlarıdır (0 = hata yok). İstatistikler hatasız
+    örnekler üzerinden hesaplanır. Kesici kataloğunda karşılığı olmayan rE
+    (Öğe 78) hatasız örneklerde de NaN'dır: istatistikler sonlu değerlerden
+    alınır (`missing` NaN oranıdır), değişme olasılıklarında NaN ayrı bir
+    değer sayılır.
+    """
+    def __init__(self, nominal, outputs, error, tolerances, seed):
+        self.nominal = nominal
+        self.outputs = outputs
+        self.error = error
+        self.tolerances = tolerances
+        self.seed = seed
+        self.size = len(error)
+
+    @property
+    def ok(self):
+        return self.error == 0
+
+    @property
+    def failure_probability(self):
+        """Hesaplanamayan örneklerin oranı."""
+        return float(np.count_nonzero(self.error)) / self.size if self.size else 0.0
+
+    def statistics(self, percentiles=DEFAULT_PERCENTILES):
+        """Çıktı adı -> nominal, ortalama, std, min, max ve yüzdelikler."""
+        ok = self.ok
+        stats = {}
+        for name, values in self.outputs.items():
+            values = values[ok]
+            finite = np.isfinite(values)
+            entry = {"nominal": self.nominal[name],
+                     "missing": float(np.count_nonzero(~finite)) / len(values) if len(values) else 0.0}
+            values = values[finite]
+            if len(values):
+                entry.update(mean=float(values.mean()), std=float(values.std()),
+                             min=float(values.min()), max=float(values.max()))
+                entry["percentiles"] = dict(zip((f"{p:g}" for p in percentiles),
+                                                np.percentile(values, percentiles).tolist()))
+            stats[name] = entry
+        return stats
+
+    def change_probability(self, name):
+        """Hatasız örneklerde çıktının nominalden farklı olma olasılığı."""
+        values = self.outputs[name][self.ok]
+        if not len(values):
+            return 0.0
+        return float(np.count_nonzero(_changed(values, self.nominal[name]))) / len(values)
+
+    def any_change_probability(self, names=DISCRETE_OUTPUTS):
+        """Hatasız örneklerde `names` çıktılarından en az birinin değişme olasılığı."""
+        ok = self.ok
+        if not np.any(ok):
+            return 0.0
+        changed = np.zeros(np.count_nonzero(ok), dtype=bool)
+        for name in names:
+            changed |= _changed(self.outputs[name][ok], self.nominal[name])
+        return float(np.count_nonzero(changed)) / len(changed)
+
+    def distribution(self, name):
+        """Basamaklı çıktının değer -> olasılık tablosu (hatasız örnekler)."""
+        values, counts = np.unique(self.outputs[name][self.ok], return_counts=True)
+        total = counts.sum()
+        return {float(v): int(c) / total for v, c in zip(values.tolist(), counts.tolist())}
+
+    def report(self):
+        """JSON'a yazılabilir rapor sözlüğü."""
+        return {
+            "samples": self.size,
+            "seed": self.seed,
+            "tolerances": {name: list(spec) for name, spec in self.tolerances.items()},
+            "failure_probability": self.failure_probability,
+            "statistics": self.statistics(),
+            "change_probability": {**{name: self.change_probability(name) for name in DISCRETE_OUTPUTS},
+                                   "any": self.any_change_probability()},
+            "distribution": {name: {f"{value:g}": p for value, p in self.distribution(name).items()}
+                             for name in DISCRETE_OUTPUTS},
+        }
+
+
+def analyze(inputs, tolerances=DEFAULT_TOLERANCES, samples=DEFAULT_SAMPLES, seed=0,
+            chunk_size=DEFAULT_CHUNK_SIZE, outputs=TOLERANCE_OUTPUTS, k1=k1_factor):
+    """Tek bir tasarım için Monte Carlo tolerans analizi; ToleranceResult döndürür.
+
+    `inputs` 14 girdinin nominal değerleri, `tolerances` girdi adı ->
+    (dağılım, tolerans) sözlüğüdür. Nominal tasarım hesaplanamazsa
+    CalculationError fırlatılır.
+    """
+    base = {name: float(values[0]) for name, values in input_columns(inputs).items()}
+    nominal_result = calculate_batch(base, k1)
+    if nominal_result.error[0]:
+        raise CalculationError(*nominal_result.error_message(0))
+    nominal = {name: float(nominal_result.columns[key][0]) for name, key in outputs}
+
+    samples = int(samples)
+    values = {name: np.empty(samples) for name, _ in outputs}
+    error = np.empty(samples, dtype=np.int16)
+    start = 0
+    for deviations in iter_deviations(tolerances, samples, seed, chunk_size):
+        chunk = {name: base[name] + deviation for name, deviation in deviations.items()}
+        result = calculate_batch({**base, **chunk}, k1)
+        stop = start + len(result.error)
+        for name, key in outputs:
+            values[name][start:stop] = np.where(result.error == 0, result.columns[key], np.nan)
+        error[start:stop] = result.error
+        start = stop
+    return ToleranceResult(nominal, values, error, dict(tolerances), seed)
+
+
+def format_report(result):
+    """Sonucun metin tablosu (komut satırı için)."""
+    stats = result.statistics()
+    percentiles = list(next(iter(stats.values())).get("percentiles", {}))
+    lines = [f"{result.size:,} örnek, seed {result.seed}; hesaplanamayan: %{result.failure_probability * 100:.3f}", ""]
+    header = f"{'çıktı':<6} {'nominal':>10} {'ortalama':>10} {'std':>10} {'min':>10}"
+    header += "".join(f" {'p' + p:>10}" for p in percentiles) + f" {'max':>10}"
+    lines.append(header)
+    for name, entry in stats.items():
+        if "mean" not in entry:
+            lines.append(f"{name:<6} {entry['nominal']:>10.4f}")
+            continue
+        row = f"{name:<6} {entry['nominal']:>10.4f} {entry['mean']:>10.4f} {entry['std']:>10.5f} {entry['min']:>10.4f}"
+        row += "".join(f" {value:>10.4f}" for value in entry["percentiles"].values()) + f" {entry['max']:>10.4f}"
+        if entry["missing"]:
+            row += f"  (NaN: %{entry['missing'] * 100:.2f})"
+        lines.append(row)
+    lines.append("")
+    for name in DISCRETE_OUTPUTS:
+        shares = ", ".join(f"{value:g}: %{p * 100:.2f}" for value, p in result.distribution(name).items())
+        lines.append(f"{name} değişme olasılığı %{result.change_probability(name) * 100:.3f}"
+                     f" (nominal {result.nominal[name]:g}; {shares})")
+    lines.append(f"{'/'.join(DISCRETE_OUTPUTS)} çıktılarından en az biri değişir: %{result.any_change_probability() * 100:.3f}")
+    return "\n".join(lines)
+
+
+def parse_tolerance(text):
+    """"rc=normal:0.002" veya "rc=0.002" (normal) -> ("rc", ("normal", 0.002))."""
+    name, sep, spec = text.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Tolerans 'girdi=dağılım:tolerans' biçiminde olmalı: {text}")
+    distribution, sep, value = spec.rpartition(":")
+    try:
+        return name.strip(), (distribution.strip() or "normal", float(value))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz tolerans: {text}") from None
+
+
+def parse_input(text):
+    """"rc=4.5" -> ("rc", 4.5)."""
+    name, sep, value = text.partition("=")
+    try:
+        return name.strip(), float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Girdi 'ad=değer' biçiminde olmalı: {text}") from None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Girdi toleranslarının makine ayarlarına etkisini Monte Carlo ile hesaplar.")
+    parser.add_argument("-N", "--samples", type=int, default=DEFAULT_SAMPLES, help="Örnek sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgele sayı tohumu")
+    parser.add_argument("--set", dest="inputs", type=parse_input, action="append", default=[], metavar="AD=DEĞER",
+                        help="Nominal girdi (varsayılan: arayüzün başlangıç değerleri)")
+    parser.add_argument("--tol", type=parse_tolerance, action="append", default=[], metavar="AD=DAĞILIM:T",
+                        help=f"Girdi toleransı ({', '.join(DISTRIBUTIONS)}; varsayılanların yerine geçer)")
+    parser.add_argument("--no-default-tolerances", action="store_true",
+                        help="Yalnızca --tol ile verilen toleransları kullan")
+    parser.add_argument("--json", metavar="PATH", help="Raporu JSON olarak yaz ('-' = stdout)")
+    return parser
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası."""
+    args = build_parser().parse_args(argv)
+    tolerances = {} if args.no_default_tolerances else dict(DEFAULT_TOLERANCES)
+    tolerances.update(args.tol)
+    try:
+        result = analyze({**DEFAULT_INPUTS, **dict(args.inputs)}, tolerances, args.samples, args.seed)
+    except CalculationError as e:
+        print(f"Hata: {e.title}: {e.message}", file=sys.stderr)
+        return 2
+    except (KeyError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 2
+    if args.json == "-":
+        json.dump(result.report(), sys.stdout, indent=2, ensure_ascii=False)
+        print()
+        return 0
+    print(format_report(result))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result.report(), f, indent=2, ensure_ascii=False)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
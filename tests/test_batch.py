@@ -0,0 +1,106 @@
+import math
+
+import numpy as np
+import pytest
+
+from spreadblade_engine import (
+    BLADE_WIDTH_WARNING, DEFAULT_INPUTS, DEFAULT_MACHINE, EDGE_RADIUS_WARNING, TEXT_ITEMS, CalculationError,
+    SpreadBladeEngine,
+)
+from spreadblade_batch import calculate_batch, clamp, safe_acos, safe_division, safe_sqrt
+from spreadblade_profile import Profiler
+
+
+def random_designs(size, seed):
+    """Hatalı satırlar da içeren rastgele tasarımlar (geçersiz Pd, açı, rc, NaN/inf...)."""
+    rng = np.random.default_rng(seed)
+    designs = {
+        "n": rng.integers(5, 40, size).astype(float),
+        "N": rng.integers(10, 90, size).astype(float),
+        "Pd": rng.choice([0.5, 1, 2, 2.5, 4, 5, 8, 12, 20, -1], size),
+        "phi_deg": rng.choice([14.5, 20, 22.5, 25, 90], size),
+        "shaft_angle_deg": rng.choice([90, 90, 90, 60, 75, 120, 170], size),
+        "psi_deg": rng.uniform(0, 50, size).round(1),
+        "F": rng.uniform(0.2, 4, size).round(3),
+        "rc": rng.choice([1.75, 2.5, 3.5, 4.5, 5, 6, 7.5, 9, 12, 18, 0.3], size),
+        "a0P": rng.uniform(0, 0.4, size).round(3),
+        "a0G": rng.uniform(0, 0.4, size).round(3),
+        "b0P": rng.uniform(-0.01, 0.4, size).round(3),
+        "b0G": rng.uniform(0, 0.4, size).round(3),
+        "t0PL": rng.uniform(0.1, 0.5, size).round(3),
+        "t0G": rng.uniform(0.1, 0.5, size).round(3),
+    }
+    designs = {name: values.astype(float) for name, values in designs.items()}
+    names = list(designs)
+    for i in rng.choice(size, size // 20, replace=False):
+        designs[names[rng.integers(len(names))]][i] = rng.choice([np.nan, np.inf, -np.inf])
+    return designs
+
+
+def compare_with_engine(inputs, machine=DEFAULT_MACHINE):
+    """calculate_batch'i satır satır motorla karşılaştırır; (sonuç, özetler) döndürür.
+
+    Hatalı satırların özeti None'dır.
+    """
+    result = calculate_batch(inputs, machine=machine)
+    summaries = []
+    for i in range(result.size):
+        row = {name: values[i] for name, values in inputs.items()}
+        try:
+            summary = SpreadBladeEngine(machine=machine).calculate_all(row)
+            error = None
+        except CalculationError as e:
+            error = (e.title, e.message)
+        assert result.error_message(i) == error, i
+        if error:
+            assert all(math.isnan(values[i]) for values in result.columns.values())
+            summaries.append(None)
+            continue
+        summaries.append(summary)
+        for key, value in summary.items.items():
+            item, side = key[:-1], key[-1]
+            if item in TEXT_ITEMS:
+                assert result.format(item, side, i) == summary.format(item, side), (i, key)
+                continue
+            expected = result.columns[key][i]
+            if math.isnan(value):
+                assert math.isnan(expected), (i, key)
+            else:
+                assert expected == pytest.approx(value, rel=1e-9, abs=1e-12), (i, key)
+    return result, summaries
+
+
+@pytest.mark.parametrize("seed, machine", [(0, DEFAULT_MACHINE), (1, "No. 106")])
+def test_batch_matches_engine(seed, machine):
+    result, summaries = compare_with_engine(random_designs(400, seed), machine)
+    # Örnekte hem hatalı hem hatasız satırlar bulunmalı
+    assert 0 < sum(summary is not None for summary in summaries) < result.size
+
+
+def test_no_fitting_blade_leaves_edge_radius_empty():
+    # Büyük t0PL ve ince dişlerde pinyon için katalogda bıçak ucu (Öğe 50) yoktur
+    inputs = {name: np.full(20, value, dtype=float) for name, value in DEFAULT_INPUTS.items()}
+    inputs["t0PL"] = np.linspace(0.25, 0.5, 20)
+    inputs["Pd"][10:] = 10.0
+    result, summaries = compare_with_engine(inputs)
+    no_blade = np.isnan(result.columns["50L"])
+    assert no_blade.any() and not no_blade.all()
+    assert np.isnan(result.columns["78L"][no_blade]).all()
+    assert np.isnan(result.columns["78R"][no_blade]).all()
+    for i, summary in enumerate(summaries):
+        assert (BLADE_WIDTH_WARNING in summary.warnings) == no_blade[i]
+        if no_blade[i]:
+            assert EDGE_RADIUS_WARNING in summary.warnings
+
+
+def test_profiler_counts_batch_fallbacks():
+    values = np.array([-2.0, -1.0, -0.0, 0.0, 0.5, 1.0, 1.5, math.nan, -math.inf])
+    with Profiler() as profiler:
+        clamp(values, item="33")
+        safe_acos(values)
+        safe_sqrt(values)
+        safe_division(values, np.array([0.0, 1e-11, -1e-12, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0]))
+    # [-1, 1] dışı ve NaN: -2, 1.5, NaN, -inf; negatif ve NaN: -2, -1, NaN, -inf
+    assert profiler.clamps == {"33": 4}
+    assert profiler.fallbacks == {("safe_acos", "batch"): 4, ("safe_sqrt", "batch"): 4,
+                                  ("safe_division", "batch"): 3}
@@ -0,0 +1,72 @@
+import pytest
+
+import spreadblade_engine
+from spreadblade_engine import DEFAULT_INPUTS, FORMULA_VERSION, SpreadBladeEngine
+from spreadblade_cache import ResultCache, cache_key, open_cache
+
+
+def test_cache_key_is_canonical():
+    inputs = dict(DEFAULT_INPUTS)
+    assert cache_key(inputs) == cache_key({name: str(value) for name, value in inputs.items()})
+    assert cache_key({**inputs, "b0P": 0.0}) == cache_key({**inputs, "b0P": -0.0})
+    assert cache_key(inputs) != cache_key({**inputs, "rc": 4.5})
+    assert cache_key(inputs) != cache_key(inputs, "No. 106")
+
+
+def test_engine_uses_cache():
+    cache = ResultCache()
+    first = SpreadBladeEngine(cache=cache).calculate_all(dict(DEFAULT_INPUTS))
+    second = SpreadBladeEngine(cache=cache).calculate_all(dict(DEFAULT_INPUTS))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert second.items.data.tobytes() == first.items.data.tobytes()
+    assert second.warnings == first.warnings
+    # Başka makine ayrı anahtardır
+    SpreadBladeEngine(cache=cache, machine="No. 106").calculate_all(dict(DEFAULT_INPUTS))
+    assert cache.misses == 2
+
+
+def test_disk_cache_and_invalidate(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    key = cache_key(DEFAULT_INPUTS)
+    summary = SpreadBladeEngine().calculate_all(dict(DEFAULT_INPUTS))
+    cache = ResultCache(path=path)
+    cache.put(key, summary)
+    cache.close()
+
+    cache = ResultCache(path=path)
+    assert cache.get(key).warnings == summary.warnings
+    assert cache.disk_hits == 1
+    cache.invalidate()
+    assert cache.get(key) is None
+    assert cache.stats()["stored"] == 0
+    cache.close()
+
+
+def test_old_formula_version_is_dropped(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = ResultCache(path=path)
+    cache._db.execute("INSERT INTO results (key, version, data) VALUES (?, ?, ?)",
+                      ("eski", FORMULA_VERSION - 1, "{}"))
+    cache._db.commit()
+    cache.close()
+    cache = ResultCache(path=path)
+    assert cache.stats()["stored"] == 0
+    cache.close()
+
+
+def test_cache_key_covers_machine_record(monkeypatch):
+    machines = spreadblade_engine.default_machines()
+    name, K2, (beta_min, beta_max), rule = spreadblade_engine.find_machine("No. 116")
+    key = cache_key(DEFAULT_INPUTS, name)
+    for record in ((name, K2 + 0.25, (beta_min, beta_max), rule), (name, K2, (beta_min, beta_max - 5.0), rule),
+                   (name, K2, (beta_min + 1.0, beta_max), rule), (name, K2, (beta_min, beta_max), "142")):
+        monkeypatch.setattr(spreadblade_engine, "default_machines", lambda: (record,) + machines[1:])
+        assert cache_key(DEFAULT_INPUTS, name) != key, record
+    monkeypatch.setattr(spreadblade_engine, "default_machines", lambda: machines)
+    assert cache_key(DEFAULT_INPUTS, name) == key
+
+
+def test_unopenable_cache_warns(tmp_path):
+    with pytest.warns(RuntimeWarning):
+        cache = open_cache(str(tmp_path / "yok" / "cache.sqlite"))
+    assert cache.stats()["stored"] == 0
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from spreadblade_engine import DEFAULT_INPUTS
+from spreadblade_batch import INPUT_NAMES
+from spreadblade_cli import read_jobs, run
+from spreadblade_export import ERROR_MESSAGE_COLUMN, read_columns
+
+
+def write_ndjson_jobs(path):
+    lines = [json.dumps({"job": "A", **DEFAULT_INPUTS}), '{"job": "B", "n": 20,',
+             json.dumps({"job": "C", **DEFAULT_INPUTS, "F": "abc"}), "", "[1, 2]"]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_malformed_ndjson_lines_become_row_errors(tmp_path):
+    path = tmp_path / "isler.ndjson"
+    write_ndjson_jobs(path)
+    inputs, row_errors, extra = read_jobs(str(path))
+    assert extra == {"job": ["A", "", "C", ""]}
+    assert row_errors[0] is None
+    assert row_errors[1][1].startswith("2. satır okunamadı")
+    assert row_errors[2][1] == "Geçersiz giriş değeri: F='abc'"
+    assert row_errors[3][1].startswith("5. satır okunamadı")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ""])
+def test_columnar_keeps_passthrough_and_row_errors(tmp_path, suffix):
+    path = tmp_path / "isler.ndjson"
+    write_ndjson_jobs(path)
+    output = str(tmp_path / ("sonuc" + suffix))
+    assert run(str(path), output, columnar=True) == (4, 3)
+    columns = read_columns(output, ["job", ERROR_MESSAGE_COLUMN])
+    assert list(columns["job"]) == ["A", "", "C", ""]
+    messages = list(columns[ERROR_MESSAGE_COLUMN])
+    assert messages[0] == ""
+    assert messages[1].startswith("Giriş Hatası: 2. satır okunamadı")
+    assert messages[2] == "Giriş Hatası: Geçersiz giriş değeri: F='abc'"
+
+
+@pytest.mark.parametrize("output, columnar", [("sonuc.csv", False), ("sonuc.ndjson", False), ("sonuc.csv", True)])
+def test_header_only_csv_gives_empty_output(tmp_path, output, columnar):
+    path = tmp_path / "isler.csv"
+    path.write_text(",".join(["job"] + INPUT_NAMES) + "\n", encoding="utf-8")
+    assert run(str(path), str(tmp_path / output), columnar=columnar) == (0, 0)
+
+
+def test_missing_column_in_header_only_csv(tmp_path):
+    path = tmp_path / "isler.csv"
+    path.write_text("n,N\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_jobs(str(path))
@@ -0,0 +1,87 @@
+import math
+
+import numpy as np
+import pytest
+
+import spreadblade_cutters
+from spreadblade_cutters import CUTTERS, CutterCatalog, open_cutter_catalog, read_catalog
+
+CATALOG = open_cutter_catalog()
+
+
+def test_cutter_is_smallest_that_covers_rc():
+    radii = [cutter[0] for cutter in CUTTERS]
+    assert CATALOG.cutter(radii[0]) == 0
+    assert CATALOG.cutter(0.5) == 0
+    assert CATALOG.cutter(radii[0] + 1e-9) == 1
+    assert CATALOG.cutter(radii[2]) == 2
+    assert CATALOG.cutter(radii[-1] * 2) == len(radii) - 1
+    assert CATALOG.cutter(math.nan) == len(radii) - 1
+    rc = np.array([0.5, radii[0], radii[0] + 1e-9, radii[2], radii[-1] * 2, math.nan])
+    assert CATALOG.cutter_column(rc).tolist() == [CATALOG.cutter(value) for value in rc.tolist()]
+
+
+def test_select_edges():
+    widths = CUTTERS[0][1]
+    assert CATALOG.select(3.5, "WB", widths[3]) == widths[3]
+    assert CATALOG.select(3.5, "WB", widths[3], strict=True) == widths[2]
+    assert CATALOG.select(3.5, "WB", widths[3] + 1e-4) == widths[3]
+    assert CATALOG.select(3.5, "WB", 10.0) == widths[-1]
+    for value in (widths[0] - 1e-4, -0.01, math.nan):
+        assert math.isnan(CATALOG.select(3.5, "WB", value))
+        assert CATALOG.select(3.5, "WB", value, smallest=True) == widths[0]
+    assert math.isnan(CATALOG.select(3.5, "WB", widths[0], strict=True))
+    blades = CATALOG.select(3.5, "NB", 13.0)
+    assert blades == 12 and isinstance(blades, int)
+    assert CATALOG.select(3.5, "NB", 12.0, strict=True) == 8
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize("smallest", [False, True])
+@pytest.mark.parametrize("column", ["WB", "NB", "rE"])
+def test_select_column_matches_select(column, strict, smallest):
+    rng = np.random.default_rng(24)
+    size = 2_000
+    rc = rng.choice([cutter[0] for cutter in CUTTERS] + [1.0, 4.0, 30.0, math.nan], size)
+    index = ("WB", "NB", "rE").index(column) + 1
+    cells = np.array([value for cutter in CUTTERS for value in cutter[index]], dtype=float)
+    values = np.where(rng.random(size) < 0.5, rng.choice(cells, size), rng.uniform(-0.05, 40.0, size))
+    values[::97] = math.nan
+    vector = CATALOG.select_column(rc, column, values, strict=strict, smallest=smallest)
+    scalar = [CATALOG.select(r, column, v, strict=strict, smallest=smallest) for r, v in zip(rc.tolist(), values.tolist())]
+    np.testing.assert_array_equal(vector, np.array(scalar, dtype=float))
+
+
+def test_read_catalog(tmp_path):
+    path = tmp_path / "kesiciler.txt"
+    path.write_text("# atölye kataloğu\n6.0 ; 0.05 0.065 ; 12, 16 ; 0.02\n\n3.5 ; 0.04,0.02 ; 8 ; 0.01  # küçük\n",
+                    encoding="utf-8")
+    catalog = CutterCatalog(read_catalog(path))
+    assert catalog.radii.tolist() == [3.5, 6.0]
+    assert catalog.select(3.5, "WB", 0.03) == 0.02
+    # Satırları farklı uzunlukta tablolarda boş hücreler hiçbir değeri karşılamaz
+    assert catalog.select_column(np.array([3.5]), "WB", np.array([1.0])).tolist() == [0.04]
+    path.write_text("3.5 ; 0.02 ; 8\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":1:"):
+        read_catalog(path)
+    path.write_text("3.5 ; 0.02 ; ; 0.01\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":1:"):
+        read_catalog(path)
+
+
+def test_cutter_file_from_environment(tmp_path, monkeypatch):
+    path = tmp_path / "kesiciler.txt"
+    path.write_text("5.0 ; 0.03 ; 10 ; 0.015\n", encoding="utf-8")
+    monkeypatch.setenv("SPREADBLADE_CUTTERS", str(path))
+    spreadblade_cutters.default_cutters.cache_clear()
+    spreadblade_cutters.default_signature.cache_clear()
+    try:
+        catalog = spreadblade_cutters.default_cutter_catalog()
+        assert catalog.radii.tolist() == [5.0]
+        assert catalog.select(9.0, "NB", 11.0) == 10
+        assert catalog.signature != CATALOG.signature
+    finally:
+        monkeypatch.delenv("SPREADBLADE_CUTTERS")
+        spreadblade_cutters.default_cutters.cache_clear()
+        spreadblade_cutters.default_signature.cache_clear()
+    assert spreadblade_cutters.default_cutter_catalog() is CATALOG
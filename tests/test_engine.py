@@ -0,0 +1,101 @@
+import math
+
+import pytest
+
+import spreadblade_engine
+from spreadblade_engine import (
+    DEFAULT_INPUTS, DEFAULT_MACHINE, MACHINES, CalculationError, SpreadBladeEngine, find_machine, machine_names,
+)
+from spreadblade_batch import calculate_batch
+
+CHANGES = [
+    {"rc": 4.5},
+    {"psi_deg": 30.0},
+    {"F": 2.0},
+    {"n": 17.0, "N": 53.0},
+    {"a0P": 0.2, "t0G": 0.3},
+    {"shaft_angle_deg": 75.0},
+]
+
+
+def same(a, b):
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or (math.isnan(a) and math.isnan(b))
+    return a == b
+
+
+@pytest.mark.parametrize("changes", CHANGES)
+def test_update_matches_full_calculation(changes):
+    engine = SpreadBladeEngine()
+    before = engine.calculate_all(dict(DEFAULT_INPUTS)).items.copy()
+    changed = engine.update(changes)
+    expected = SpreadBladeEngine().calculate_all({**DEFAULT_INPUTS, **changes})
+    assert set(engine.items) == set(expected.items)
+    for key, value in expected.items.items():
+        assert same(engine.items[key], value), key
+        if not same(before[key], value):
+            assert key in changed, key
+    assert engine.summary().warnings == expected.warnings
+
+
+def test_update_before_calculation_runs_full_calculation():
+    engine = SpreadBladeEngine()
+    changed = engine.update({**DEFAULT_INPUTS, "rc": 4.5})
+    assert engine.complete
+    assert changed == set(engine.items)
+
+
+def test_update_after_error_recovers():
+    engine = SpreadBladeEngine()
+    engine.calculate_all(dict(DEFAULT_INPUTS))
+    with pytest.raises(CalculationError):
+        engine.update({"Pd": -1.0})
+    assert not engine.complete
+    engine.update({"Pd": DEFAULT_INPUTS["Pd"]})
+    expected = SpreadBladeEngine().calculate_all(dict(DEFAULT_INPUTS))
+    assert all(same(engine.items[key], value) for key, value in expected.items.items())
+
+
+def test_default_design_fits_the_catalog():
+    summary = SpreadBladeEngine().calculate_all(dict(DEFAULT_INPUTS))
+    assert summary.warnings == []
+    for key in ("45L", "50L", "50R", "77L", "78L", "78R"):
+        assert math.isfinite(summary.items[key]), key
+    assert summary.items["77L"] > 0
+
+
+def test_vanishing_item_73_leaves_r3_unbounded():
+    # Öğe 73 ≈ 0 (76 = 73² sıfıra yakın): r3 sonsuzdur, rE r1 ve r2'den seçilir
+    summary = SpreadBladeEngine().calculate_all({**DEFAULT_INPUTS, "psi_deg": 26.13, "F": 1.741, "rc": 6.0})
+    assert abs(summary.items["73L"]) < 1e-5
+    assert math.isinf(summary.items["77L"])
+    assert math.isfinite(summary.items["78L"])
+
+
+@pytest.fixture
+def machine_file(tmp_path, monkeypatch):
+    path = tmp_path / "makineler.txt"
+    monkeypatch.setenv("SPREADBLADE_MACHINES", str(path))
+    spreadblade_engine.default_machines.cache_clear()
+    yield path
+    monkeypatch.delenv("SPREADBLADE_MACHINES")
+    spreadblade_engine.default_machines.cache_clear()
+
+
+def test_machine_file_overrides_and_extends_catalog(machine_file):
+    machine_file.write_text("# atölye\nNo. 116 ; 9.0 ; 0 170 ; 137\n\nNo. 118 ; 9.5 ; 5, 175 ; 142  # yeni\n",
+                            encoding="utf-8")
+    assert machine_names() == [name for name, _, _, _ in MACHINES] + ["No. 118"]
+    assert find_machine(DEFAULT_MACHINE) == ("No. 116", 9.0, (0.0, 170.0), "137")
+    assert find_machine("No. 118") == ("No. 118", 9.5, (5.0, 175.0), "142")
+    summary = SpreadBladeEngine(machine="No. 118").calculate_all(dict(DEFAULT_INPUTS))
+    assert summary.items["138L"] == 9.5
+    assert calculate_batch(DEFAULT_INPUTS, machine="No. 118").columns["138L"][0] == 9.5
+
+
+@pytest.mark.parametrize("line", ["No. 118 ; 9.5 ; 0 175", "No. 118 ; 0 ; 0 175 ; 142", "No. 118 ; 9.5 ; 175 0 ; 142",
+                                  "No. 118 ; 9.5 ; 0 175 ; 140", " ; 9.5 ; 0 175 ; 142"])
+def test_bad_machine_file_is_rejected(machine_file, line):
+    machine_file.write_text(line + "\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":1:"):
+        find_machine("No. 116")
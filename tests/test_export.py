@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from spreadblade_engine import DEFAULT_INPUTS
+from spreadblade_batch import calculate_batch
+from spreadblade_export import ERROR_COLUMN, export_batch, export_sweep, read_columns
+from spreadblade_sweep import grid_axis
+
+COLUMNS = ["rc", "psi_deg", "78L", "136L", "137R", "141L", "132L", ERROR_COLUMN]
+
+
+def designs():
+    inputs = {name: np.full(250, value, dtype=float) for name, value in DEFAULT_INPUTS.items()}
+    inputs["psi_deg"] = np.linspace(0, 45, 250)
+    inputs["rc"] = np.resize([3.5, 4.5, 6.0, 9.0], 250)
+    inputs["Pd"][::50] = -1.0 # Hatalı satırlar
+    return inputs
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ""])
+def test_export_batch_round_trip(tmp_path, suffix):
+    inputs = designs()
+    path = str(tmp_path / ("sonuc" + suffix))
+    rows, failed = export_batch(inputs, path, chunk_size=64)
+    expected = calculate_batch(inputs)
+    assert (rows, failed) == (250, int(np.count_nonzero(expected.error)))
+    assert failed > 0
+
+    columns = read_columns(path, COLUMNS)
+    for name in ("rc", "psi_deg"):
+        np.testing.assert_array_equal(columns[name], inputs[name])
+    for key in ("78L", "136L", "137R", "141L"):
+        np.testing.assert_array_equal(columns[key], expected.columns[key])
+    np.testing.assert_array_equal(columns[ERROR_COLUMN], expected.error)
+    assert list(columns["132L"]) == expected.text_column("132", "L")
+
+
+def test_export_sweep_round_trip(tmp_path):
+    path = str(tmp_path / "tarama.csv")
+    axes = {"psi_deg": grid_axis(20, 40, 5), "rc": grid_axis(3.5, 6.0, 3)}
+    assert export_sweep(path, DEFAULT_INPUTS, axes, chunk_size=4) == 15
+    with open(path, encoding="utf-8") as f:
+        assert f.readline().startswith("psi_deg,rc,")
+    columns = read_columns(path, ["psi_deg", "rc", "136L"])
+    psi, rc = np.meshgrid(axes["psi_deg"], axes["rc"], indexing="ij")
+    expected = calculate_batch({**DEFAULT_INPUTS, "psi_deg": psi.ravel(), "rc": rc.ravel()})
+    assert sorted(zip(columns["psi_deg"], columns["rc"], columns["136L"])) == sorted(
+        zip(psi.ravel(), rc.ravel(), expected.columns["136L"]))
@@ -0,0 +1,61 @@
+import itertools
+import math
+import os
+import warnings
+from collections import Counter
+from fractions import Fraction
+
+import numpy as np
+
+from spreadblade_gears import open_gear_index, train_ratios
+
+INVENTORY = {20: 1, 24: 1, 30: 2, 36: 1, 45: 1, 50: 1}
+
+
+def brute_force_ratios(inventory):
+    gears = [teeth for teeth, count in inventory.items() for _ in range(count)]
+    ratios = {Fraction(a, b) for a, b in itertools.permutations(gears, 2)}
+    for a, b, c, d in itertools.permutations(gears, 4):
+        ratios.add(Fraction(a * c, b * d))
+    return sorted(ratios)
+
+
+def test_index_holds_every_train_once():
+    index = open_gear_index(INVENTORY, "")
+    expected = brute_force_ratios(INVENTORY)
+    assert len(index) == len(expected)
+    np.testing.assert_allclose(index.ratios, [float(r) for r in expected], rtol=1e-15)
+    for A, B, C, D in index.trains.tolist():
+        used = Counter([A, B] + ([C, D] if C else []))
+        assert all(used[teeth] <= INVENTORY[teeth] for teeth in used)
+
+
+def test_match_error_is_nearest_train():
+    index = open_gear_index(INVENTORY, "")
+    rng = np.random.default_rng(22)
+    values = np.concatenate([rng.uniform(0.2, 5.0, 2000), -rng.uniform(0.2, 5.0, 200), index.ratios[:50]])
+    match = index.match(values)
+    nearest = np.min(np.abs(index.ratios[None, :] - np.abs(values)[:, None]), axis=1)
+    np.testing.assert_array_equal(np.abs(match.error), nearest)
+    np.testing.assert_array_equal(match.error, match.ratio - np.abs(values))
+    np.testing.assert_array_equal(match.ratio, train_ratios(index.trains[match.index]))
+    assert np.all(match.error[-50:] == 0)
+    assert index.describe_column(values[:100], match=index.match(values[:100])) == \
+        [index.describe(value) for value in values[:100].tolist()]
+
+
+def test_unusable_ratios_have_no_train():
+    index = open_gear_index(INVENTORY, "")
+    match = index.match([0.0, math.nan, math.inf])
+    assert match.index.tolist() == [-1, -1, -1]
+    assert np.all(np.isnan(match.error))
+    assert [index.describe(value) for value in (0.0, math.nan, math.inf)] == ["-", "-", "-"]
+
+
+def test_index_directory_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPREADBLADE_GEAR_INDEX_DIR", str(tmp_path))
+    inventory = {**INVENTORY, 40: 1}
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        index = open_gear_index(inventory)
+    assert os.listdir(tmp_path) == [f".spreadblade_gears_{index.signature}.npy"]
@@ -0,0 +1,47 @@
+import math
+import os
+import warnings
+
+import numpy as np
+
+from spreadblade_batch import k1_factor
+from spreadblade_k1table import (
+    K1_TABLE_PHI_RANGE, K1_TABLE_RATIO_RANGE, K1_TABLE_TOLERANCE, K1Table, open_k1_table,
+)
+
+
+def test_table_within_tolerance_of_exact_formula():
+    table = open_k1_table("")
+    assert isinstance(table, K1Table)
+    rng = np.random.default_rng(13)
+    R_a = np.exp(rng.uniform(*np.log(K1_TABLE_RATIO_RANGE), 200_000))
+    phi = rng.uniform(*K1_TABLE_PHI_RANGE, 200_000)
+    assert np.max(np.abs(table(R_a, phi) - k1_factor(R_a, phi))) <= K1_TABLE_TOLERANCE
+
+
+def test_outside_domain_uses_exact_formula():
+    table = open_k1_table("")
+    R_a = np.array([0.01, 5.0e4, 2.0, math.nan])
+    phi = np.array([math.radians(20.0), math.radians(20.0), math.radians(40.0), math.radians(20.0)])
+    np.testing.assert_array_equal(table(R_a, phi), k1_factor(R_a, phi))
+
+
+def test_table_file_written_only_where_requested(tmp_path, monkeypatch):
+    path = tmp_path / "k1.npy"
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("SPREADBLADE_K1_TABLE", str(path))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        table = open_k1_table()
+    assert os.path.exists(path)
+    np.testing.assert_array_equal(np.load(path), table.nodes)
+    assert os.listdir(tmp_path) == ["k1.npy"]
+
+
+def test_unwritable_path_warns(tmp_path):
+    path = str(tmp_path / "yok" / "k1.npy")
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        table = open_k1_table(path)
+    assert isinstance(table, K1Table)
+    assert [w.category for w in caught] == [RuntimeWarning]
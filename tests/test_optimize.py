@@ -0,0 +1,26 @@
+import math
+
+import numpy as np
+
+from spreadblade_engine import DEFAULT_INPUTS, SpreadBladeEngine
+from spreadblade_batch import calculate_batch
+from spreadblade_optimize import feasible_mask, optimize
+
+
+def test_pareto_candidates_have_blades():
+    result = optimize(DEFAULT_INPUTS)
+    assert result.best is not None and result.front
+    for candidate in result.front:
+        summary = SpreadBladeEngine().calculate_all(
+            {**DEFAULT_INPUTS, "rc": candidate.rc, "psi_deg": candidate.psi_deg})
+        for key in ("50L", "50R", "78L", "78R"):
+            assert math.isfinite(summary.items[key]), (candidate, key)
+        assert candidate.rE == summary.items["78L"]
+
+
+def test_designs_without_blade_are_infeasible():
+    rc = np.full(2, DEFAULT_INPUTS["rc"])
+    result = calculate_batch({**DEFAULT_INPUTS, "t0PL": np.array([DEFAULT_INPUTS["t0PL"], 0.4]), "rc": rc})
+    assert np.isnan(result.columns["50L"][1])
+    ok, _ = feasible_mask(result, rc)
+    assert not ok[1]
@@ -0,0 +1,47 @@
+import os
+
+import numpy as np
+
+from spreadblade_engine import DEFAULT_INPUTS
+from spreadblade_batch import calculate_batch
+from spreadblade_parallel import calculate_parallel, iter_parallel
+
+
+def designs(size, seed=4):
+    rng = np.random.default_rng(seed)
+    inputs = {name: np.full(size, float(value)) for name, value in DEFAULT_INPUTS.items()}
+    inputs["rc"] = rng.uniform(1.0, 9.0, size)
+    inputs["psi_deg"] = rng.uniform(15.0, 45.0, size)
+    inputs["Pd"][::17] = -1.0 # hatalı satırlar
+    return inputs
+
+
+def same(a, b):
+    assert a.error.tobytes() == b.error.tobytes()
+    assert list(a.columns) == list(b.columns) and list(a.extras) == list(b.extras)
+    for key in a.columns:
+        assert a.columns[key].tobytes() == b.columns[key].tobytes(), key
+    for key in a.extras:
+        assert a.extras[key].tobytes() == b.extras[key].tobytes(), key
+
+
+def test_parallel_windows_match_serial():
+    inputs = designs(101)
+    serial = calculate_batch(inputs)
+    # 2 işçi x SLOTS_PER_WORKER yuva: yuvalar yeniden kullanılır, son parça eksik
+    same(calculate_parallel(inputs, workers=2, chunk_size=7), serial)
+    starts = []
+    for start, part in iter_parallel(inputs, workers=2, chunk_size=7):
+        starts.append(start)
+        same(part, calculate_batch({name: values[start:start + part.size] for name, values in inputs.items()}))
+    assert starts[0] == 0 and len(starts) > 2 and starts[-1] < 101
+
+
+def test_abandoned_iteration_releases_shared_memory():
+    before = set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+    parts = iter_parallel(designs(60), workers=2, chunk_size=5)
+    start, part = next(parts)
+    assert start == 0 and part.size == 5
+    parts.close()
+    if os.path.isdir("/dev/shm"):
+        assert set(os.listdir("/dev/shm")) <= before
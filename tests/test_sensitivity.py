@@ -0,0 +1,66 @@
+import numpy as np
+
+from spreadblade_engine import DEFAULT_INPUTS, SpreadBladeEngine
+from spreadblade_batch import INPUT_NAMES, calculate_batch
+from spreadblade_sensitivity import sensitivity
+
+
+def designs(size, seed=21):
+    rng = np.random.default_rng(seed)
+    inputs = {name: np.full(size, float(value)) for name, value in DEFAULT_INPUTS.items()}
+    inputs["rc"] = rng.uniform(3.6, 6.0, size)
+    inputs["psi_deg"] = rng.uniform(25.0, 40.0, size)
+    inputs["F"] = rng.uniform(1.0, 1.8, size)
+    return inputs
+
+
+def test_result_does_not_depend_on_chunk_size():
+    inputs = designs(11)
+    whole, parts = sensitivity(inputs), sensitivity(inputs, chunk_size=3)
+    assert whole.error.tobytes() == parts.error.tobytes()
+    for table in ("nominal", "jacobian", "discontinuous", "margins"):
+        for key, values in getattr(whole, table).items():
+            assert values.tobytes() == getattr(parts, table)[key].tobytes(), (table, key)
+
+
+def test_jacobian_matches_engine_differences():
+    result = sensitivity(DEFAULT_INPUTS)
+    for input_name in ("psi_deg", "F", "Pd", "a0G"):
+        h = 1e-4
+        up = SpreadBladeEngine().calculate_all({**DEFAULT_INPUTS, input_name: DEFAULT_INPUTS[input_name] + h})
+        down = SpreadBladeEngine().calculate_all({**DEFAULT_INPUTS, input_name: DEFAULT_INPUTS[input_name] - h})
+        j = INPUT_NAMES.index(input_name)
+        for output, key in (("S", "136L"), ("beta", "141L"), ("m75_L", "131L")):
+            expected = (up.items[key] - down.items[key]) / (2 * h)
+            assert np.isclose(result.jacobian[output][0, j], expected, rtol=1e-4, atol=1e-8), (output, input_name)
+
+
+def test_rounding_jump_is_flagged_and_margin_predicts_it():
+    j = INPUT_NAMES.index("t0PL")
+    nominal = SpreadBladeEngine().calculate_all(DEFAULT_INPUTS).items["44L"]
+    margin = sensitivity(DEFAULT_INPUTS).margins["44"][0, j]
+    assert 0 < margin < 0.1
+
+    def WG(t0PL):
+        return calculate_batch({**DEFAULT_INPUTS, "t0PL": t0PL}).columns["44L"][0]
+
+    x = DEFAULT_INPUTS["t0PL"]
+    far = next(x + sign * 1.5 * margin for sign in (1, -1) if WG(x + sign * 1.5 * margin) != nominal)
+    assert WG(x + 0.5 * (far - x)) == nominal
+    # Sıçramayı ikiye bölmeyle bul; tahmin edilen uzaklık gerçek uzaklığa yakın olmalı
+    near = x
+    for _ in range(60):
+        middle = 0.5 * (near + far)
+        near, far = (middle, far) if WG(middle) == nominal else (near, middle)
+    assert np.isclose(abs(near - x), margin, rtol=0.05)
+    at_jump = sensitivity({**DEFAULT_INPUTS, "t0PL": near})
+    assert at_jump.discontinuous["44"][0, j]
+    assert not sensitivity(DEFAULT_INPUTS).discontinuous["44"][0, j]
+
+
+def test_failed_designs_have_no_derivatives():
+    inputs = designs(3)
+    inputs["Pd"][1] = -1.0
+    result = sensitivity(inputs)
+    assert result.error[1] != 0 and result.error[0] == result.error[2] == 0
+    assert np.all(np.isnan(result.jacobian["S"][1])) and np.all(np.isfinite(result.jacobian["S"][[0, 2]]))
@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+import pytest
+
+from spreadblade_engine import DEFAULT_INPUTS, DEFAULT_MACHINE, calculate
+from spreadblade_cache import cache_key
+from spreadblade_service import (
+    CalculationService, ServiceError, calculate_design, calculate_designs, parse_design,
+)
+
+
+NO_BLADE = {**DEFAULT_INPUTS, "t0PL": 0.4}
+
+
+def strict_loads(body):
+    """NaN/Infinity kabul etmeyen json.loads."""
+    def reject(constant):
+        raise ValueError(f"JSON dışı sabit: {constant}")
+    return json.loads(body, parse_constant=reject)
+
+
+def test_batch_body_is_strict_json():
+    # İlk satırda bıçak ucu yoktur (Öğe 50/78 NaN); ikinci satır geçersiz, üçüncü satır NaN aktarır
+    rows = [{"job": 1, **NO_BLADE}, {"job": 2, **DEFAULT_INPUTS, "F": "NaN"},
+            {"job": float("nan"), **DEFAULT_INPUTS}]
+    status, body = calculate_designs(json.dumps(rows))
+    assert status == 200
+    payload = strict_loads(body)
+    assert payload["count"] == 3 and payload["failed"] == 1
+    first, second, third = payload["results"]
+    assert first["items"]["78L"] is None
+    assert second["F"] is None and second["error"]["title"] == "Giriş Hatası"
+    assert third["job"] is None
+
+
+def test_single_design_is_strict_json():
+    status, body = calculate_design(dict(NO_BLADE))
+    assert status == 200
+    assert strict_loads(body)["items"]["78L"] is None
+    status, body = calculate_design({**DEFAULT_INPUTS, "rc": float("nan")})
+    assert status == 422
+    assert strict_loads(body)["rc"] is None
+
+
+@pytest.mark.parametrize("value", ['"NaN"', '"inf"', '"-Infinity"', "NaN", "Infinity"])
+def test_non_finite_design_is_rejected(value):
+    body = json.dumps(DEFAULT_INPUTS)[:-1] + f', "rc": {value}}}'
+    with pytest.raises(ServiceError) as e:
+        parse_design(body)
+    assert e.value.status == 422
+
+    service = CalculationService(workers=1)
+    try:
+        status, payload = asyncio.run(service.handle("POST", "/calculate", body.encode("utf-8")))
+    finally:
+        service.close()
+    assert status == 422
+    assert strict_loads(payload)["error"]["title"] == "Giriş Hatası"
+
+
+def test_machine_field():
+    key, inputs, machine = parse_design(json.dumps(DEFAULT_INPUTS))
+    assert (key, machine) == (cache_key(DEFAULT_INPUTS), DEFAULT_MACHINE)
+    key, inputs, machine = parse_design(json.dumps({**DEFAULT_INPUTS, "machine": "No. 106"}))
+    assert (key, machine) == (cache_key(DEFAULT_INPUTS, "No. 106"), "No. 106")
+    with pytest.raises(ServiceError) as e:
+        parse_design(json.dumps({**DEFAULT_INPUTS, "machine": "No. 999"}))
+    assert e.value.status == 422
+
+    expected = calculate(DEFAULT_INPUTS, "No. 106").items["141L"]
+    status, body = calculate_design(inputs, machine="No. 106")
+    assert status == 200 and strict_loads(body)["beta"] == round(expected, 2)
+    status, body = calculate_designs(json.dumps({"designs": [DEFAULT_INPUTS], "machine": "No. 106"}))
+    assert status == 200 and strict_loads(body)["results"][0]["beta"] == round(expected, 2)
+    status, body = calculate_designs(json.dumps({"designs": [DEFAULT_INPUTS], "machine": "No. 999"}))
+    assert status == 422
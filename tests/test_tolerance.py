@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from spreadblade_engine import DEFAULT_INPUTS
+from spreadblade_batch import calculate_batch
+from spreadblade_tolerance import TOLERANCE_OUTPUTS, analyze, iter_deviations
+
+TOLERANCES = {"rc": ("normal", 0.002), "F": ("uniform", 0.01), "t0G": ("triangular", 0.003)}
+
+
+def same_outputs(a, b):
+    assert a.error.tobytes() == b.error.tobytes()
+    for name in a.outputs:
+        assert a.outputs[name].tobytes() == b.outputs[name].tobytes(), name
+
+
+def test_same_seed_reproduces_regardless_of_chunk_size():
+    first = analyze(DEFAULT_INPUTS, TOLERANCES, samples=5_000, seed=7)
+    same_outputs(first, analyze(DEFAULT_INPUTS, TOLERANCES, samples=5_000, seed=7))
+    same_outputs(first, analyze(DEFAULT_INPUTS, TOLERANCES, samples=5_000, seed=7, chunk_size=777))
+    assert first.report() == analyze(DEFAULT_INPUTS, TOLERANCES, samples=5_000, seed=7, chunk_size=1_000).report()
+    other = analyze(DEFAULT_INPUTS, TOLERANCES, samples=5_000, seed=8)
+    assert other.outputs["S"].tobytes() != first.outputs["S"].tobytes()
+
+
+def test_input_streams_are_independent():
+    alone = np.concatenate([d["rc"] for d in iter_deviations({"rc": TOLERANCES["rc"]}, 3_000, seed=5)])
+    together = np.concatenate([d["rc"] for d in iter_deviations(TOLERANCES, 3_000, seed=5, chunk_size=1_000)])
+    assert alone.tobytes() == together.tobytes()
+
+
+def test_deviations_respect_tolerance_limits():
+    deviations = next(iter_deviations(TOLERANCES, 20_000, seed=1))
+    assert np.all(np.abs(deviations["F"]) <= 0.01) and np.all(np.abs(deviations["t0G"]) <= 0.003)
+    assert abs(np.std(deviations["rc"]) - 0.002 / 3) < 0.0001
+
+
+def test_samples_are_batch_results_of_perturbed_inputs():
+    result = analyze(DEFAULT_INPUTS, TOLERANCES, samples=500, seed=3)
+    deviations = next(iter_deviations(TOLERANCES, 500, seed=3))
+    batch = calculate_batch({**DEFAULT_INPUTS, **{name: DEFAULT_INPUTS[name] + d for name, d in deviations.items()}})
+    for name, key in TOLERANCE_OUTPUTS:
+        assert result.outputs[name].tobytes() == np.where(batch.ok, batch.columns[key], np.nan).tobytes(), name
+
+
+def test_zero_tolerance_never_changes_outputs():
+    result = analyze(DEFAULT_INPUTS, {"rc": ("normal", 0.0)}, samples=100, seed=0)
+    assert result.failure_probability == 0.0
+    assert result.any_change_probability() == 0.0
+
+
+@pytest.mark.parametrize("tolerances", [{"rc": ("gauss", 0.001)}, {"rc": ("normal", -0.001)}, {"xyz": ("normal", 0.1)}])
+def test_bad_tolerances_are_rejected(tolerances):
+    with pytest.raises(ValueError):
+        analyze(DEFAULT_INPUTS, tolerances, samples=10)